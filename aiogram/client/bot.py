@@ -10,11 +10,13 @@ from typing import (
     AsyncIterator,
     BinaryIO,
     List,
+    Literal,
     Optional,
     Type,
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
 import aiofiles
@@ -87,6 +89,7 @@ from ..methods import (
     GetUserProfilePhotos,
     GetWebhookInfo,
     HideGeneralForumTopic,
+    LazyResult,
     LeaveChat,
     LogOut,
     PinChatMessage,
@@ -96,6 +99,7 @@ from ..methods import (
     ReopenGeneralForumTopic,
     ReplaceStickerInSet,
     RestrictChatMember,
+    ResultMode,
     RevokeChatInviteLink,
     SendAnimation,
     SendAudio,
@@ -419,13 +423,14 @@ class Bot:
             destination = io.BytesIO()
 
         close_stream = False
-        if self.session.api.is_local:
+        api = self.session.get_api(self)
+        if api.is_local:
             stream = self.__aiofiles_reader(
-                str(self.session.api.wrap_local_file.to_local(file_path)), chunk_size=chunk_size
+                str(api.wrap_local_file.to_local(file_path)), chunk_size=chunk_size
             )
             close_stream = True
         else:
-            url = self.session.api.file_url(self.__token, file_path)
+            url = api.file_url(self.__token, file_path)
             stream = self.session.stream_content(
                 url=url,
                 timeout=timeout,
@@ -484,15 +489,52 @@ class Bot:
             file_path, destination=destination, timeout=timeout, chunk_size=chunk_size, seek=seek
         )
 
+    @overload
     async def __call__(
-        self, method: TelegramMethod[T], request_timeout: Optional[int] = None
-    ) -> T:
+        self,
+        method: TelegramMethod[T],
+        request_timeout: Optional[int] = None,
+        result_mode: Literal[ResultMode.FULL, None] = None,
+    ) -> T:  # pragma: no cover
+        pass
+
+    @overload
+    async def __call__(
+        self,
+        method: TelegramMethod[T],
+        request_timeout: Optional[int] = None,
+        *,
+        result_mode: Literal[ResultMode.LAZY],
+    ) -> LazyResult[T]:  # pragma: no cover
+        pass
+
+    @overload
+    async def __call__(
+        self,
+        method: TelegramMethod[T],
+        request_timeout: Optional[int] = None,
+        *,
+        result_mode: Literal[ResultMode.SKIP],
+    ) -> None:  # pragma: no cover
+        pass
+
+    async def __call__(
+        self,
+        method: TelegramMethod[T],
+        request_timeout: Optional[int] = None,
+        result_mode: Optional[ResultMode] = None,
+    ) -> Any:
         """
         Call API method
 
         :param method:
+        :param request_timeout: Request timeout
+        :param result_mode: How the result should be parsed,
+            by default mode is resolved by the session
         :return:
         """
+        if result_mode is not None:
+            method = method.model_copy().with_result_mode(result_mode)
         return await self.session(self, method, timeout=request_timeout)
 
     def __hash__(self) -> int:
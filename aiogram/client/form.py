@@ -2,10 +2,24 @@ from __future__ import annotations
 
 import secrets
 import typing
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    List,
+    Literal,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pydantic import BaseModel
 from pydantic_core import from_json, to_json
+from typing_extensions import Annotated, get_args, get_origin
 
 from aiogram.client.default import DefaultBotProperties
 from aiogram.client.default_annotations import get_default_prop_name, is_default_prop
@@ -16,6 +30,84 @@ if TYPE_CHECKING:
 
 M = typing.TypeVar("M", bound=BaseModel)
 
+_ModelPredicate = Callable[[Type[BaseModel], Set[type]], bool]
+
+
+def _annotation_matches(annotation: Any, predicate: _ModelPredicate, seen: Set[type]) -> bool:
+    """
+    Check statically that the value of annotated type can contain model matched by predicate
+
+    Unresolved annotations are treated as matched, so the result is always conservative.
+    """
+    if annotation is Any or isinstance(annotation, (ForwardRef, str)):
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return _annotation_matches(get_args(annotation)[0], predicate, seen)
+    if origin is not None:
+        return any(_annotation_matches(arg, predicate, seen) for arg in get_args(annotation))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation in seen:
+            return False
+        seen.add(annotation)
+        return predicate(annotation, seen)
+    return False
+
+
+def _model_has_files(model_type: Type[BaseModel], seen: Set[type]) -> bool:
+    if issubclass(model_type, InputFile):
+        return True
+    return any(
+        _annotation_matches(field_info.annotation, _model_has_files, seen)
+        for field_info in model_type.model_fields.values()
+    )
+
+
+def _model_has_default_props(model_type: Type[BaseModel], seen: Set[type]) -> bool:
+    return any(
+        is_default_prop(field_info)
+        or _annotation_matches(field_info.annotation, _model_has_default_props, seen)
+        for field_info in model_type.model_fields.values()
+    )
+
+
+@lru_cache(maxsize=None)
+def get_file_fields(model_type: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    Get names of the model fields that can contain :class:`aiogram.types.InputFile`
+
+    Result is resolved from the model annotations once per model class.
+    """
+    return tuple(
+        field_name
+        for field_name, field_info in model_type.model_fields.items()
+        if _annotation_matches(field_info.annotation, _model_has_files, {model_type})
+    )
+
+
+@lru_cache(maxsize=None)
+def get_default_prop_fields(
+    model_type: Type[BaseModel],
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """
+    Get model fields that should be replaced with default bot properties
+
+    Result is resolved from the model annotations once per model class.
+
+    :return: pairs of field name and default property name
+        and names of the fields that can contain nested models with default properties
+    """
+    default_fields = []
+    nested_fields = []
+    for field_name, field_info in model_type.model_fields.items():
+        if is_default_prop(field_info):
+            default_fields.append((field_name, get_default_prop_name(field_info)))
+        elif _annotation_matches(field_info.annotation, _model_has_default_props, {model_type}):
+            nested_fields.append(field_name)
+    return tuple(default_fields), tuple(nested_fields)
+
 
 def extract_files_from_any(value: Any) -> Tuple[Any, Dict[str, InputFile]]:
     if isinstance(value, InputFile):
@@ -39,39 +131,53 @@ def extract_files_from_list(value: List[Any]) -> Tuple[List[Any], Dict[str, Inpu
 
 
 def extract_files_from_model(model: M) -> Tuple[M, Dict[str, InputFile]]:
+    """
+    Replace files in the model with attachment links
+
+    Only fields that can contain files are checked,
+    the model is copied only when some files are found.
+    """
     files = {}
     update = {}
-    for field_name, field_value in model:
+    fields = [(name, getattr(model, name)) for name in get_file_fields(type(model))]
+    if model.__pydantic_extra__:
+        fields.extend(model.__pydantic_extra__.items())
+    for field_name, field_value in fields:
         modified_value, field_files = extract_files_from_any(field_value)
         if field_files:
             files.update(field_files)
             update[field_name] = modified_value
-    modified_model = model.model_copy(update=update)
-    return modified_model, files
+    if not update:
+        return model, files
+    return model.model_copy(update=update), files
 
 
 def replace_default_props(model: M, *, props: DefaultBotProperties) -> M:
+    """
+    Replace default bot properties in the model
+
+    The model is copied only when some of the fields are changed.
+    """
     update = {}
-    for field_name, field_info in model.model_fields.items():
+    default_fields, nested_fields = get_default_prop_fields(type(model))
+    for field_name, default_name in default_fields:
         field_value = getattr(model, field_name)
-        if is_default_prop(field_info):
-            default_name = get_default_prop_name(field_info)
-            default_value = props[default_name]
-            unset_value = props.model_fields[default_name].default
-            replaced_value = default_value if default_value != unset_value else field_value
-        elif isinstance(field_value, list):
-            replaced_value = [
-                (
-                    replace_default_props(value, props=props)
-                    if isinstance(value, BaseModel)
-                    else value
-                )
-                for value in field_value
-            ]
-        else:
-            replaced_value = field_value
-        if field_value != replaced_value:
+        default_value = props[default_name]
+        unset_value = props.model_fields[default_name].default
+        if default_value != unset_value and field_value != default_value:
+            update[field_name] = default_value
+    for field_name in nested_fields:
+        field_value = getattr(model, field_name)
+        if not isinstance(field_value, list):
+            continue
+        replaced_value = [
+            (replace_default_props(value, props=props) if isinstance(value, BaseModel) else value)
+            for value in field_value
+        ]
+        if any(old is not new for old, new in zip(field_value, replaced_value)):
             update[field_name] = replaced_value
+    if not update:
+        return model
     return model.model_copy(update=update)
 
 
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Generic, Iterable, Tuple
+
+from pydantic_core import to_json
+
+from aiogram.client.form import construct_form_data
+from aiogram.methods.base import TelegramMethod, TelegramType
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+DEFAULT_PREPARED_FIELDS = ("chat_id",)
+
+
+class PreparedMethod(Generic[TelegramType]):
+    """
+    Method template serialized once and sent many times with different values
+    of the designated fields
+
+    Is useful when the same message is sent to many chats,
+    the whole method is dumped only once and only the designated fields
+    (:code:`chat_id` by default) are serialized for each call:
+
+    .. code-block:: python
+
+        prepared = PreparedMethod(SendPhoto(chat_id=0, photo=file_id), bot=bot)
+        for chat_id in chat_ids:
+            await bot(prepared(chat_id=chat_id))
+
+    Files should be uploaded once and referenced by :code:`file_id` or URL,
+    templates with :class:`aiogram.types.InputFile` are rejected.
+    Default bot properties are applied when the template is prepared.
+    """
+
+    def __init__(
+        self,
+        method: TelegramMethod[TelegramType],
+        *,
+        bot: Bot,
+        fields: Iterable[str] = DEFAULT_PREPARED_FIELDS,
+    ) -> None:
+        """
+        :param method: method template, values of the designated fields are ignored
+        :param bot: bot instance, its default properties are applied to the template
+        :param fields: names of the fields that are substituted on each call
+        """
+        self.fields: Tuple[str, ...] = tuple(fields)
+        unknown = [name for name in self.fields if name not in type(method).model_fields]
+        if unknown:
+            raise ValueError(
+                f"Method {type(method).__name__} has no fields {', '.join(map(repr, unknown))}"
+            )
+        data, files = construct_form_data(method, bot=bot, dumps=False)
+        if files:
+            raise ValueError(
+                "Prepared method can not contain files to upload, "
+                "upload the file once and use its file_id instead"
+            )
+        self.method = method
+        self.data: Dict[str, Any] = {
+            key: value for key, value in data.items() if key not in self.fields
+        }
+        self.body = to_json(self.data)
+
+    def __call__(self, **values: Any) -> TelegramMethod[TelegramType]:
+        """
+        Make the method with the given values of the designated fields
+
+        Values are not validated, so they should have the types expected by the method.
+
+        :param values: values of the designated fields
+        :return: method that is sent without serialization of the template fields
+        """
+        unexpected = values.keys() - set(self.fields)
+        if unexpected:
+            raise TypeError(
+                f"Fields {', '.join(map(repr, sorted(unexpected)))} are not designated "
+                f"to be substituted, designated fields: {', '.join(self.fields)}"
+            )
+        method = self.method.model_copy(update=values)
+        method._prepared = self
+        return method
+
+    def _dump_fields(self, method: TelegramMethod[TelegramType]) -> Dict[str, Any]:
+        # Fields are read from the method itself, so the values changed
+        # by the request middlewares with `model_copy` are respected
+        values = {name: getattr(method, name) for name in self.fields}
+        return {
+            name: (
+                value.model_dump(mode="json", exclude_none=True)
+                if hasattr(value, "model_dump")
+                else value
+            )
+            for name, value in values.items()
+            if value is not None
+        }
+
+    def build_data(self, method: TelegramMethod[TelegramType]) -> Dict[str, Any]:
+        """
+        Build request data of the method made by this template
+
+        :param method: method made by this template
+        """
+        return {**self._dump_fields(method), **self.data}
+
+    def build_body(self, method: TelegramMethod[TelegramType]) -> bytes:
+        """
+        Build JSON body of the method made by this template
+
+        Serialized template is concatenated with the serialized designated fields.
+
+        :param method: method made by this template
+        """
+        fields = self._dump_fields(method)
+        if not fields:
+            return self.body
+        fields_body = to_json(fields)
+        if self.body == b"{}":
+            return fields_body
+        return fields_body[:-1] + b"," + self.body[1:]
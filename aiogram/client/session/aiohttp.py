@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import ssl
+from contextlib import suppress
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,21 +20,39 @@ from typing import (
 )
 
 import certifi
-from aiohttp import BasicAuth, ClientError, ClientSession, FormData, TCPConnector
-from aiohttp.hdrs import USER_AGENT
+from aiohttp import (
+    BasicAuth,
+    ClientConnectorError,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    FormData,
+    TCPConnector,
+)
+from aiohttp.hdrs import CONTENT_TYPE, USER_AGENT
 from aiohttp.http import SERVER_SOFTWARE
+from pydantic_core import to_json
+from yarl import URL
 
 from aiogram.__meta__ import __version__
-from aiogram.methods import TelegramMethod
+from aiogram.methods import GetUpdates, Lane, TelegramMethod
+from aiogram.types import InputFile
 
-from ...exceptions import TelegramNetworkError
+from ...exceptions import (
+    TelegramConnectionError,
+    TelegramNetworkError,
+    TelegramResponseTooLarge,
+)
 from ...methods.base import TelegramType
-from ..form import construct_form_data
+from ..form import construct_form_data, json_dumps
+from ..telegram import TelegramAPIServer
 from .base import BaseSession
 
 if TYPE_CHECKING:
     from ..bot import Bot
 
+logger = logging.getLogger(__name__)
+
 _ProxyBasic = Union[str, Tuple[str, BasicAuth]]
 _ProxyChain = Iterable[_ProxyBasic]
 _ProxyType = Union[_ProxyChain, _ProxyBasic]
@@ -85,26 +106,93 @@ def _prepare_connector(chain_or_plain: _ProxyType) -> Tuple[Type["TCPConnector"]
     return ChainProxyConnector, {"proxy_infos": infos}
 
 
+@dataclass(frozen=True)
+class LaneConfig:
+    """
+    Connections pool settings of the lane
+    """
+
+    limit: int = 100
+    """The total number of simultaneous connections of the lane"""
+    timeout: Optional[float] = None
+    """Default request timeout of the lane, session timeout is used when is not set"""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Utilisation of the connections pool
+    """
+
+    limit: int
+    """The total number of simultaneous connections, 0 means unlimited"""
+    acquired: int
+    """Amount of connections used by the requests in progress"""
+    idle: int
+    """Amount of opened connections ready to be reused"""
+
+    @property
+    def utilisation(self) -> float:
+        """
+        Share of the limit used by the requests in progress
+        """
+        return self.acquired / self.limit if self.limit else 0.0
+
+
 class AiohttpSession(BaseSession):
     def __init__(
-        self, proxy: Optional[_ProxyType] = None, limit: int = 100, **kwargs: Any
+        self,
+        proxy: Optional[_ProxyType] = None,
+        limit: int = 100,
+        json_requests: bool = True,
+        max_response_size: Optional[int] = None,
+        lanes: Optional[Dict[Lane, LaneConfig]] = None,
+        warm_up_connections: int = 0,
+        keep_alive_interval: Optional[float] = None,
+        keepalive_timeout: Optional[float] = None,
+        **kwargs: Any,
     ) -> None:
         """
         Client session based on aiohttp.
 
         :param proxy: The proxy to be used for requests. Default is None.
         :param limit: The total number of simultaneous connections. Default is 100.
+        :param json_requests: Send requests without files as a single JSON body
+            instead of multipart form data. Default is True.
+        :param max_response_size: Maximum size of the API response body in bytes, larger
+            responses are rejected with :class:`aiogram.exceptions.TelegramResponseTooLarge`.
+            Default is None (unlimited).
+        :param lanes: Dedicated connection pools for traffic classes,
+            requests of the lanes that are not configured share the default pool.
+            Default is None (all requests share the default pool).
+        :param warm_up_connections: The number of connections to each Bot API server
+            opened by :meth:`warm_up`. Default is 0 (connections are opened by the requests).
+        :param keep_alive_interval: Interval (in seconds) between the requests that keep
+            the warmed up connections open, should be less than :code:`keepalive_timeout`.
+            Default is None (connections are not kept alive).
+        :param keepalive_timeout: Time (in seconds) the idle connection is kept in the pool.
+            Default is None (aiohttp default is used).
         :param kwargs: Additional keyword arguments.
         """
         super().__init__(**kwargs)
 
+        self.json_requests = json_requests
+        self.max_response_size = max_response_size
+        self.lanes: Dict[Lane, LaneConfig] = dict(lanes) if lanes else {}
+        self.lane_methods: Dict[Type[TelegramMethod[Any]], Lane] = {GetUpdates: Lane.LONG_POLL}
+        self.warm_up_connections = warm_up_connections
+        self.keep_alive_interval = keep_alive_interval
+
         self._session: Optional[ClientSession] = None
+        self._lane_sessions: Dict[Lane, ClientSession] = {}
         self._connector_type: Type[TCPConnector] = TCPConnector
         self._connector_init: Dict[str, Any] = {
             "ssl": ssl.create_default_context(cafile=certifi.where()),
             "limit": limit,
             "ttl_dns_cache": 3600,  # Workaround for https://github.com/aiogram/aiogram/issues/1500
         }
+        self._keepalive_timeout = keepalive_timeout
+        self._keep_alive_task: Optional[asyncio.Task[None]] = None
         self._should_reset_connector = True  # flag determines connector state
         self._proxy: Optional[_ProxyType] = None
 
@@ -130,34 +218,199 @@ class AiohttpSession(BaseSession):
         self._setup_proxy_connector(proxy)
         self._should_reset_connector = True
 
-    async def create_session(self) -> ClientSession:
+    def _create_client_session(self, **connector_init: Any) -> ClientSession:
+        if self._keepalive_timeout is not None:
+            connector_init.setdefault("keepalive_timeout", self._keepalive_timeout)
+        return ClientSession(
+            connector=self._connector_type(**{**self._connector_init, **connector_init}),
+            headers={
+                USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{__version__}",
+            },
+        )
+
+    async def create_session(self, lane: Optional[Lane] = None) -> ClientSession:
+        """
+        Get the client session of the lane, creates it when needed
+
+        :param lane: traffic class, the default pool is used when the lane is not configured
+        """
         if self._should_reset_connector:
-            await self.close()
+            await self._close_client_sessions()
+
+        lane_config = self.lanes.get(lane) if lane is not None else None
+        if lane is not None and lane_config is not None:
+            lane_session = self._lane_sessions.get(lane)
+            if lane_session is None or lane_session.closed:
+                lane_session = self._lane_sessions[lane] = self._create_client_session(
+                    limit=lane_config.limit
+                )
+                self._should_reset_connector = False
+            return lane_session
 
         if self._session is None or self._session.closed:
-            self._session = ClientSession(
-                connector=self._connector_type(**self._connector_init),
-                headers={
-                    USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{__version__}",
-                },
-            )
+            self._session = self._create_client_session()
             self._should_reset_connector = False
 
         return self._session
 
-    async def close(self) -> None:
-        if self._session is not None and not self._session.closed:
-            await self._session.close()
+    def resolve_lane(self, method: TelegramMethod[Any], data: Union[FormData, bytes]) -> Lane:
+        """
+        Resolve traffic class of the request
+
+        Lane set for the method call by :meth:`aiogram.methods.TelegramMethod.with_lane`
+        has precedence, otherwise lane is taken from :code:`lane_methods` by the method class,
+        requests with files go to the file lane, the rest go to the interactive lane.
+
+        :param method: Method instance
+        :param data: request body
+        """
+        if method._lane is not None:
+            return method._lane
+        if (lane := self.lane_methods.get(type(method))) is not None:
+            return lane
+        if isinstance(data, FormData) and data.is_multipart:
+            return Lane.FILE
+        return Lane.INTERACTIVE
+
+    def get_pool_stats(self, lane: Optional[Lane] = None) -> PoolStats:
+        """
+        Get utilisation of the connections pool
+
+        :param lane: traffic class, the default pool is used when the lane is not configured
+        """
+        lane_config = self.lanes.get(lane) if lane is not None else None
+        session: Optional[ClientSession]
+        if lane is not None and lane_config is not None:
+            session = self._lane_sessions.get(lane)
+            limit = lane_config.limit
+        else:
+            session = self._session
+            limit = self._connector_init.get("limit", 100)
+        if session is None or session.closed:
+            return PoolStats(limit=limit, acquired=0, idle=0)
+
+        connector = session.connector
+        # aiohttp does not expose the state of the pool, so it is taken from the connector
+        acquired = len(getattr(connector, "_acquired", ()))
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        return PoolStats(
+            limit=connector.limit if connector else limit, acquired=acquired, idle=idle
+        )
+
+    def _get_warm_up_urls(self) -> List[str]:
+        if self.balancer is not None:
+            servers = [state.server for state in self.balancer.states]
+        else:
+            servers = [self.api]
+        urls: List[str] = []
+        for server in servers:
+            url = str(URL(server.base.format(token="", method="")).origin())
+            if url not in urls:
+                urls.append(url)
+        return urls
+
+    async def _ping(self, session: ClientSession, url: str) -> bool:
+        try:
+            async with session.head(url, allow_redirects=False, timeout=self.timeout):
+                return True
+        except (asyncio.TimeoutError, ClientError) as e:
+            logger.warning("Failed to open connection to %r: %s: %s", url, type(e).__name__, e)
+            return False
+
+    async def open_connections(self, connections: int, lane: Lane = Lane.INTERACTIVE) -> int:
+        """
+        Open connections to the Bot API servers
+
+        Lightweight HEAD requests are sent to each server concurrently,
+        so idle connections of the pool are reused and the missing ones are opened.
+        Connections stay in the pool after the responses.
+
+        :param connections: amount of connections to each server
+        :param lane: traffic class of the connections
+        :return: amount of the successful requests
+        """
+        if connections <= 0:
+            return 0
+        session = await self.create_session(lane=lane)
+        results = await asyncio.gather(
+            *(
+                self._ping(session=session, url=url)
+                for url in self._get_warm_up_urls()
+                for _ in range(connections)
+            )
+        )
+        return sum(results)
+
+    async def warm_up(
+        self, connections: Optional[int] = None, lane: Lane = Lane.INTERACTIVE
+    ) -> None:
+        """
+        Pre-establish connections to the Bot API servers, so the first requests
+        do not wait for DNS resolving, TCP and TLS handshakes,
+        and start keeping them alive when :code:`keep_alive_interval` is specified
+
+        Is called by the dispatcher on startup of polling.
+
+        :param connections: amount of connections to each server,
+            :code:`warm_up_connections` by default
+        :param lane: traffic class of the connections
+        """
+        if connections is None:
+            connections = self.warm_up_connections
+        if connections <= 0:
+            return
+        opened = await self.open_connections(connections=connections, lane=lane)
+        logger.debug("%d connections are warmed up", opened)
+
+        if self.keep_alive_interval is not None and (
+            self._keep_alive_task is None or self._keep_alive_task.done()
+        ):
+            self._keep_alive_task = asyncio.create_task(
+                self._keep_alive(
+                    connections=connections, lane=lane, interval=self.keep_alive_interval
+                )
+            )
+
+    async def _keep_alive(self, connections: int, lane: Lane, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            # Connections used by the requests in progress are warm anyway
+            missing = connections - self.get_pool_stats(lane=lane).acquired
+            await self.open_connections(connections=missing, lane=lane)
 
+    async def _stop_keep_alive(self) -> None:
+        task, self._keep_alive_task = self._keep_alive_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def close(self) -> None:
+        await self._stop_keep_alive()
+        await self._close_client_sessions()
+
+    async def _close_client_sessions(self) -> None:
+        sessions = [self._session, *self._lane_sessions.values()]
+        self._lane_sessions = {}
+        closed = False
+        for session in sessions:
+            if session is not None and not session.closed:
+                await session.close()
+                closed = True
+
+        if closed:
             # Wait 250 ms for the underlying SSL connections to close
             # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
             await asyncio.sleep(0.25)
 
     def build_form_data(self, bot: Bot, method: TelegramMethod[TelegramType]) -> FormData:
-        form = FormData(quote_fields=False)
-        data, files = construct_form_data(method, bot=bot)
-        for key, value in data.items():
-            form.add_field(key, value)
+        data, files = construct_form_data(method, bot=bot, dumps=False)
+        return self._build_multipart(bot=bot, data=data, files=files)
+
+    def _build_multipart(
+        self, bot: Bot, data: Dict[str, Any], files: Dict[str, InputFile]
+    ) -> FormData:
+        form = self._build_form_data(data=data)
         for key, file in files.items():
             form.add_field(
                 key,
@@ -166,21 +419,118 @@ class AiohttpSession(BaseSession):
             )
         return form
 
+    @staticmethod
+    def _build_form_data(data: Dict[str, Any]) -> FormData:
+        form = FormData(quote_fields=False)
+        for key, value in data.items():
+            form.add_field(key, json_dumps(value))
+        return form
+
+    def build_request_data(
+        self, bot: Bot, method: TelegramMethod[TelegramType]
+    ) -> Tuple[Union[FormData, bytes], Dict[str, str]]:
+        """
+        Build request body and headers
+
+        Requests without files are sent as a single JSON body when :code:`json_requests`
+        is enabled, multipart form data built by :meth:`build_form_data` is used otherwise.
+
+        :param bot: Bot instance
+        :param method: Method instance
+        :return: request body and headers
+        """
+        prepared = method._prepared
+        if prepared is not None:
+            # Method made by the template is not serialized again
+            if self.json_requests:
+                return prepared.build_body(method), {CONTENT_TYPE: "application/json"}
+            return self._build_form_data(data=prepared.build_data(method)), {}
+        if not self.json_requests:
+            return self.build_form_data(bot=bot, method=method), {}
+        data, files = construct_form_data(method, bot=bot, dumps=False)
+        if not files:
+            return to_json(data), {CONTENT_TYPE: "application/json"}
+        if type(self).build_form_data is not AiohttpSession.build_form_data:
+            # Overridden form builder serializes the method by itself
+            return self.build_form_data(bot=bot, method=method), {}
+        return self._build_multipart(bot=bot, data=data, files=files), {}
+
+    async def _read_response(
+        self, resp: ClientResponse, method: TelegramMethod[TelegramType]
+    ) -> bytes:
+        max_size = self.max_response_size
+        if max_size is None:
+            return await resp.read()
+
+        error = TelegramResponseTooLarge(
+            method=method, message=f"Response is larger than {max_size} bytes"
+        )
+        if resp.content_length is not None:
+            if resp.content_length > max_size:
+                raise error
+            return await resp.read()
+
+        # Content length is unknown, so the body is read by chunks to stop as soon as possible
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in resp.content.iter_any():
+            size += len(chunk)
+            if size > max_size:
+                raise error
+            chunks.append(chunk)
+        return b"".join(chunks)
+
     async def make_request(
         self, bot: Bot, method: TelegramMethod[TelegramType], timeout: Optional[int] = None
     ) -> TelegramType:
-        session = await self.create_session()
+        if self.balancer is None:
+            return await self.request_server(bot=bot, method=method, api=self.api, timeout=timeout)
+        return await self.balancer.call(
+            bot.id,
+            lambda api: self.request_server(bot=bot, method=method, api=api, timeout=timeout),
+            idempotent=self.balancer.is_idempotent(method),
+        )
+
+    async def request_server(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        api: TelegramAPIServer,
+        timeout: Optional[int] = None,
+    ) -> TelegramType:
+        """
+        Make request to the given Bot API server
 
-        url = self.api.api_url(token=bot.token, method=method.__api_method__)
-        form = self.build_form_data(bot=bot, method=method)
+        :param bot: Bot instance
+        :param method: Method instance
+        :param api: Bot API server
+        :param timeout: Request timeout
+        """
+        url = api.api_url(token=bot.token, method=method.__api_method__)
+        data, headers = self.build_request_data(bot=bot, method=method)
+        lane = self.resolve_lane(method=method, data=data)
+        session = await self.create_session(lane=lane)
+
+        request_timeout: float
+        if timeout is not None:
+            request_timeout = timeout
+        elif (lane_config := self.lanes.get(lane)) is not None and lane_config.timeout:
+            request_timeout = lane_config.timeout
+        else:
+            request_timeout = self.timeout
 
         try:
             async with session.post(
-                url, data=form, timeout=self.timeout if timeout is None else timeout
+                url,
+                data=data,
+                headers=headers,
+                timeout=request_timeout,
             ) as resp:
-                raw_result = await resp.text()
+                raw_result = await self._read_response(resp=resp, method=method)
         except asyncio.TimeoutError:
             raise TelegramNetworkError(method=method, message="Request timeout error")
+        except ClientConnectorError as e:
+            raise TelegramConnectionError(method=method, message=f"{type(e).__name__}: {e}")
         except ClientError as e:
             raise TelegramNetworkError(method=method, message=f"{type(e).__name__}: {e}")
         response = self.check_response(
@@ -199,7 +549,7 @@ class AiohttpSession(BaseSession):
         if headers is None:
             headers = {}
 
-        session = await self.create_session()
+        session = await self.create_session(lane=Lane.FILE)
 
         async with session.get(
             url, timeout=timeout, headers=headers, raise_for_status=raise_for_status
@@ -210,3 +560,157 @@ class AiohttpSession(BaseSession):
     async def __aenter__(self) -> AiohttpSession:
         await self.create_session()
         return self
+
+
+class AiohttpSessionPool:
+    def __init__(
+        self,
+        proxy: Optional[_ProxyType] = None,
+        limit: int = 100,
+        limit_per_bot: Optional[int] = None,
+        lanes: Optional[Dict[Lane, LaneConfig]] = None,
+    ) -> None:
+        """
+        Connections pool shared by many bots
+
+        Each bot gets its own lightweight session via :meth:`create_session`,
+        so middlewares, API server and other settings can be different for each bot,
+        while connections, TLS context and DNS cache are shared.
+        Pool is not closed by the sessions of the bots, it should be closed by the owner.
+
+        :param proxy: The proxy to be used for requests. Default is None.
+        :param limit: The total number of simultaneous connections of all bots. Default is 100.
+        :param limit_per_bot: The number of simultaneous requests of each bot.
+            Default is None (unlimited).
+        :param lanes: Dedicated connection pools for traffic classes.
+        """
+        self.limit_per_bot = limit_per_bot
+        self._session = AiohttpSession(proxy=proxy, limit=limit, lanes=lanes)
+
+    @property
+    def proxy(self) -> Optional[_ProxyType]:
+        return self._session.proxy
+
+    @property
+    def lanes(self) -> Dict[Lane, LaneConfig]:
+        return self._session.lanes
+
+    @property
+    def lane_methods(self) -> Dict[Type[TelegramMethod[Any]], Lane]:
+        return self._session.lane_methods
+
+    def create_session(self, **kwargs: Any) -> PooledAiohttpSession:
+        """
+        Create session of the bot that uses connections of the pool
+
+        :param kwargs: arguments to be passed to :class:`PooledAiohttpSession`
+        """
+        kwargs.setdefault("limit", self.limit_per_bot)
+        return PooledAiohttpSession(pool=self, **kwargs)
+
+    async def get_client_session(self, lane: Optional[Lane] = None) -> ClientSession:
+        return await self._session.create_session(lane=lane)
+
+    def get_pool_stats(self, lane: Optional[Lane] = None) -> PoolStats:
+        """
+        Get utilisation of the connections pool
+
+        :param lane: traffic class, the default pool is used when the lane is not configured
+        """
+        return self._session.get_pool_stats(lane=lane)
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def __aenter__(self) -> AiohttpSessionPool:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+class PooledAiohttpSession(AiohttpSession):
+    def __init__(
+        self,
+        pool: AiohttpSessionPool,
+        limit: Optional[int] = None,
+        proxy: Optional[_ProxyType] = None,
+        json_requests: bool = True,
+        max_response_size: Optional[int] = None,
+        warm_up_connections: int = 0,
+        keep_alive_interval: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Client session that uses connections of the shared pool,
+        closing of this session does not close the pool.
+
+        Connector, TLS context and proxy are owned by the pool,
+        so creating of the session is cheap.
+
+        :param pool: shared connections pool
+        :param limit: The number of simultaneous requests of this session.
+            Default is None (limited only by the pool).
+        :param proxy: Not supported, proxy should be passed to the pool
+        :param json_requests: Send requests without files as a single JSON body
+            instead of multipart form data. Default is True.
+        :param max_response_size: Maximum size of the API response body in bytes.
+            Default is None (unlimited).
+        :param warm_up_connections: The number of connections to each Bot API server
+            opened by :meth:`warm_up`. Default is 0.
+        :param keep_alive_interval: Interval (in seconds) between the requests that keep
+            the warmed up connections open. Default is None.
+        :param kwargs: arguments to be passed to :class:`BaseSession`
+        """
+        if proxy is not None:
+            raise ValueError(
+                "Pooled session uses connections of the pool, "
+                "proxy should be passed to the AiohttpSessionPool"
+            )
+        # AiohttpSession.__init__ is skipped intentionally,
+        # connector and TLS context of the session would never be used
+        BaseSession.__init__(self, **kwargs)
+
+        self.pool = pool
+        self.json_requests = json_requests
+        self.max_response_size = max_response_size
+        self.lanes = pool.lanes
+        self.lane_methods = pool.lane_methods
+        self.warm_up_connections = warm_up_connections
+        self.keep_alive_interval = keep_alive_interval
+        self.requests_limit = limit
+
+        self._keep_alive_task: Optional[asyncio.Task[None]] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def proxy(self) -> Optional[_ProxyType]:
+        return self.pool.proxy
+
+    @proxy.setter
+    def proxy(self, proxy: _ProxyType) -> None:
+        raise ValueError(
+            "Pooled session uses connections of the pool, "
+            "proxy should be passed to the AiohttpSessionPool"
+        )
+
+    async def create_session(self, lane: Optional[Lane] = None) -> ClientSession:
+        return await self.pool.get_client_session(lane=lane)
+
+    def get_pool_stats(self, lane: Optional[Lane] = None) -> PoolStats:
+        return self.pool.get_pool_stats(lane=lane)
+
+    async def close(self) -> None:
+        # Connections are owned by the pool
+        await self._stop_keep_alive()
+
+    async def make_request(
+        self, bot: Bot, method: TelegramMethod[TelegramType], timeout: Optional[int] = None
+    ) -> TelegramType:
+        if self.requests_limit is None:
+            return await super().make_request(bot=bot, method=method, timeout=timeout)
+        if self._semaphore is None:
+            # Semaphore is created lazily to be bound to the running loop
+            self._semaphore = asyncio.Semaphore(self.requests_limit)
+        async with self._semaphore:
+            return await super().make_request(bot=bot, method=method, timeout=timeout)
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from aiogram.exceptions import (
+    TelegramConnectionError,
+    TelegramEntityTooLarge,
+    TelegramNetworkError,
+    TelegramResponseTooLarge,
+    TelegramServerError,
+)
+from aiogram.methods import (
+    GetChat,
+    GetChatAdministrators,
+    GetChatMember,
+    GetChatMemberCount,
+    GetFile,
+    GetMe,
+    GetUpdates,
+    GetUserProfilePhotos,
+    GetWebhookInfo,
+    TelegramMethod,
+)
+
+from ..telegram import TelegramAPIServer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+APIServerProbe = Callable[[TelegramAPIServer], Awaitable[Any]]
+
+# Errors caused by the request itself, other servers would fail the same way
+CLIENT_SIDE_ERRORS = (TelegramEntityTooLarge, TelegramResponseTooLarge)
+
+DEFAULT_IDEMPOTENT_METHODS: FrozenSet[Type[TelegramMethod[Any]]] = frozenset(
+    {
+        GetChat,
+        GetChatAdministrators,
+        GetChatMember,
+        GetChatMemberCount,
+        GetFile,
+        GetMe,
+        GetUpdates,
+        GetUserProfilePhotos,
+        GetWebhookInfo,
+    }
+)
+
+
+class APIServerState:
+    """
+    Runtime state of the API server in the balancer
+    """
+
+    def __init__(self, server: TelegramAPIServer) -> None:
+        self.server = server
+        self.outstanding = 0
+        """Amount of requests in progress"""
+        self.failures = 0
+        """Amount of consecutive failures"""
+        self.unhealthy_until = 0.0
+        """Monotonic time until the server is excluded from routing"""
+
+    @property
+    def healthy(self) -> bool:
+        return self.unhealthy_until <= time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f"APIServerState(base={self.server.base!r}, outstanding={self.outstanding}, "
+            f"failures={self.failures}, healthy={self.healthy})"
+        )
+
+
+class APIServerBalancer:
+    def __init__(
+        self,
+        servers: Iterable[TelegramAPIServer],
+        sticky: bool = True,
+        max_failures: int = 1,
+        cooldown: float = 30.0,
+        idempotent_methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Routes requests between multiple Bot API servers
+
+        Requests go to the healthy server with the least amount of outstanding requests
+        and fail over to the next server on network or server errors.
+        Requests of the non-idempotent methods fail over only when the connection
+        can't be established, since timed out request could be processed by the server.
+
+        :param servers: Bot API servers
+        :param sticky: bind each bot to the chosen server while it is healthy,
+            is required for local servers, since they keep the state of the bots
+        :param max_failures: amount of consecutive failures to exclude the server from routing
+        :param cooldown: time (in seconds) the failed server is excluded from routing
+        :param idempotent_methods: methods that are safe to send again to the next server,
+            by default the read methods like :code:`getMe`, :code:`getChat` and :code:`getUpdates`
+        """
+        self.states = [APIServerState(server) for server in servers]
+        if not self.states:
+            raise ValueError("At least one API server should be specified")
+        self.sticky = sticky
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.idempotent_methods = (
+            frozenset(idempotent_methods)
+            if idempotent_methods is not None
+            else DEFAULT_IDEMPOTENT_METHODS
+        )
+        self._bot_states: Dict[int, APIServerState] = {}
+
+    def choose(
+        self, bot_id: int, exclude: Iterable[APIServerState] = ()
+    ) -> Optional[APIServerState]:
+        """
+        Choose the server for the request of the bot
+
+        :param bot_id: bot id
+        :param exclude: servers that should not be chosen
+        :return: server state or :code:`None` when all the servers are excluded
+        """
+        candidates = [state for state in self.states if state not in exclude]
+        if not candidates:
+            return None
+        if self.sticky:
+            bound = self._bot_states.get(bot_id)
+            if bound is not None and bound in candidates and bound.healthy:
+                return bound
+        # When all the servers are unhealthy, it's better to try them anyway
+        healthy = [state for state in candidates if state.healthy] or candidates
+        state = min(healthy, key=lambda item: (item.outstanding, item.failures))
+        if self.sticky:
+            self._bot_states[bot_id] = state
+        return state
+
+    def get_server(self, bot_id: int) -> TelegramAPIServer:
+        """
+        Get the server of the bot, is used for the requests outside the balancer like downloads
+
+        :param bot_id: bot id
+        """
+        state = self.choose(bot_id)
+        if state is None:  # pragma: no cover
+            raise RuntimeError("No API servers available")
+        return state.server
+
+    def is_idempotent(self, method: TelegramMethod[Any]) -> bool:
+        """
+        Check whether the request of the method can be safely sent again to the next server
+
+        :param method: method instance
+        """
+        return type(method) in self.idempotent_methods
+
+    def mark_success(self, state: APIServerState) -> None:
+        state.failures = 0
+        state.unhealthy_until = 0.0
+
+    def mark_failure(self, state: APIServerState) -> None:
+        state.failures += 1
+        if state.failures >= self.max_failures:
+            if state.healthy:
+                logger.warning(
+                    "API server %r is excluded from routing for %.1f seconds after %d failures",
+                    state.server.base,
+                    self.cooldown,
+                    state.failures,
+                )
+            state.unhealthy_until = time.monotonic() + self.cooldown
+
+    async def call(
+        self,
+        bot_id: int,
+        request: Callable[[TelegramAPIServer], Awaitable[T]],
+        idempotent: bool = True,
+    ) -> T:
+        """
+        Make the request with failover between the servers
+
+        :param bot_id: bot id
+        :param request: callable that makes the request to the given server
+        :param idempotent: the request can be sent again when it's not known
+            whether the server processed it, otherwise it fails over only on connection errors
+        :return: result of the first successful request
+        """
+        tried: List[APIServerState] = []
+        while True:
+            state = self.choose(bot_id, exclude=tried)
+            if state is None:  # pragma: no cover
+                raise RuntimeError("No API servers available")
+            state.outstanding += 1
+            try:
+                result = await request(state.server)
+            except CLIENT_SIDE_ERRORS:
+                raise
+            except (TelegramNetworkError, TelegramServerError) as e:
+                self.mark_failure(state)
+                tried.append(state)
+                if len(tried) >= len(self.states):
+                    raise
+                if not idempotent and not isinstance(e, TelegramConnectionError):
+                    raise
+                logger.warning(
+                    "Request to API server %r failed with %s: %s, trying the next server",
+                    state.server.base,
+                    type(e).__name__,
+                    e,
+                )
+                continue
+            finally:
+                state.outstanding -= 1
+            self.mark_success(state)
+            return result
+
+    async def check_health(self, probe: APIServerProbe) -> None:
+        """
+        Probe all the servers and update their health
+
+        :param probe: callable that makes the lightweight request to the given server
+        """
+
+        async def check(state: APIServerState) -> None:
+            try:
+                await probe(state.server)
+            except Exception as e:
+                logger.warning(
+                    "Health check of API server %r failed with %s: %s",
+                    state.server.base,
+                    type(e).__name__,
+                    e,
+                )
+                self.mark_failure(state)
+            else:
+                self.mark_success(state)
+
+        await asyncio.gather(*(check(state) for state in self.states))
+
+    async def run_health_checks(self, probe: APIServerProbe, interval: float = 30.0) -> None:
+        """
+        Probe all the servers periodically until cancelled
+
+        :param probe: callable that makes the lightweight request to the given server
+        :param interval: time between the checks (in seconds)
+        """
+        while True:
+            await self.check_health(probe)
+            await asyncio.sleep(interval)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import abc
 import json
+import warnings
+from contextvars import ContextVar
 from http import HTTPStatus
 from types import TracebackType
 from typing import (
@@ -13,6 +15,7 @@ from typing import (
     Final,
     Optional,
     Type,
+    Union,
     cast,
 )
 
@@ -33,9 +36,10 @@ from aiogram.exceptions import (
     TelegramUnauthorizedError,
 )
 
-from ...methods import Response, TelegramMethod
+from ...methods import LazyResult, Response, ResultMode, TelegramMethod
 from ...methods.base import TelegramType
 from ..telegram import PRODUCTION, TelegramAPIServer
+from .balancer import APIServerBalancer
 from .middlewares.manager import RequestMiddlewareManager
 
 if TYPE_CHECKING:
@@ -46,6 +50,34 @@ _JsonDumps = Callable[..., str]
 
 DEFAULT_TIMEOUT: Final[float] = 60.0
 
+# Timeout of the request passed through the middlewares chain, so the chain is not rebuilt
+_request_timeout: ContextVar[Optional[int]] = ContextVar("request_timeout", default=None)
+
+_RAW_RESPONSE_TYPE = Response[Any]
+_RESPONSE_TYPES: Dict[Type[TelegramMethod[Any]], Type[Response[Any]]] = {}
+
+
+def get_response_type(
+    method_type: Type[TelegramMethod[TelegramType]],
+) -> Type[Response[TelegramType]]:
+    """
+    Get parametrized response model for the method class
+
+    Parametrizing the pydantic generic model is not free,
+    so the result is cached per method class and built only once at first use.
+
+    :param method_type: method class
+    :return: :class:`aiogram.methods.base.Response` parametrized with the method result type
+    """
+    try:
+        return _RESPONSE_TYPES[method_type]
+    except KeyError:
+        pass
+    response_type = _RESPONSE_TYPES[method_type] = Response[
+        method_type.__returning__  # type: ignore
+    ]
+    return response_type
+
 
 class BaseSession(abc.ABC):
     """
@@ -63,12 +95,15 @@ class BaseSession(abc.ABC):
         json_loads: Optional[_JsonLoads] = None,
         json_dumps: Optional[_JsonDumps] = None,
         timeout: Optional[float] = None,
+        balancer: Optional[APIServerBalancer] = None,
     ) -> None:
         """
         :param api: Telegram Bot API URL patterns
         :param json_loads: JSON loader (deprecated, not used)
         :param json_dumps: JSON dumper (deprecated, not used)
         :param timeout: Session scope request timeout (deprecated, not used)
+        :param balancer: Routes requests between multiple Bot API servers,
+            :code:`api` is not used when it is specified
         """
         if json_loads is not None or json_dumps is not None or timeout is not None:
             warnings.warn(
@@ -79,25 +114,71 @@ class BaseSession(abc.ABC):
             )
 
         self.api = api
+        self.balancer = balancer
+        self.json_loads = json_loads or json.loads
+        self.json_dumps = json_dumps or json.dumps
+        self.timeout = timeout or DEFAULT_TIMEOUT
         self.middleware = RequestMiddlewareManager()
+        # Result modes per method class, can be overridden per call
+        self.result_modes: Dict[Type[TelegramMethod[Any]], ResultMode] = {}
+
+    def get_api(self, bot: Bot) -> TelegramAPIServer:
+        """
+        Get Bot API server used by the bot
+
+        :param bot: Bot instance
+        :return: API server
+        """
+        if self.balancer is not None:
+            return self.balancer.get_server(bot.id)
+        return self.api
+
+    def get_result_mode(self, method: TelegramMethod[Any]) -> ResultMode:
+        """
+        Resolve how the result of the method call should be parsed
+
+        Mode specified for the method call takes precedence over the mode
+        configured for the method class in :attr:`result_modes`.
+
+        :param method: Method instance
+        :return: result mode
+        """
+        if method._result_mode is not None:
+            return method._result_mode
+        return self.result_modes.get(type(method), ResultMode.FULL)
 
     def check_response(
         self,
         bot: Bot,
         method: TelegramMethod[TelegramType],
         status_code: int,
-        content: str,
+        content: Union[str, bytes],
     ) -> Response[TelegramType]:
         """
         Check response status
+
+        Content can be passed as raw bytes, so it is validated without decoding into string.
         """
+        result_mode = self.get_result_mode(method)
+        response_type: Type[Response[Any]]
         try:
-            response_type = Response[method.__returning__]  # type: ignore
+            if result_mode is ResultMode.FULL:
+                response_type = get_response_type(type(method))
+            else:
+                response_type = _RAW_RESPONSE_TYPE
             response = response_type.model_validate_json(content, context={"bot": bot})
         except ValidationError as e:
             raise ClientDecodeError("Failed to deserialize object", e, content)
 
         if HTTPStatus.OK <= status_code <= HTTPStatus.IM_USED and response.ok:
+            if result_mode is ResultMode.LAZY:
+                response.result = LazyResult(
+                    response_type=get_response_type(type(method)),
+                    raw=response.result,
+                    bot=bot,
+                )
+            elif result_mode is ResultMode.SKIP:
+                response.result = None
             return response
 
         description = cast(str, response.description)
@@ -137,6 +218,15 @@ class BaseSession(abc.ABC):
             message=description,
         )
 
+    async def warm_up(self) -> None:
+        """
+        Pre-establish connections to the Bot API server,
+        is called by the dispatcher on startup of polling
+
+        Does nothing by default.
+        """
+        pass
+
     @abc.abstractmethod
     async def close(self) -> None:  # pragma: no cover
         """
@@ -182,10 +272,22 @@ class BaseSession(abc.ABC):
         method: TelegramMethod[TelegramType],
         timeout: Optional[int] = None,
     ) -> TelegramType:
-        middleware = self.middleware.wrap_middlewares(
-            self.make_request, timeout=timeout
-        )
-        return cast(TelegramType, await middleware(bot, method))
+        if not self.middleware:
+            return await self.make_request(bot, method, timeout=timeout)
+
+        middleware = self.middleware.compile(self._make_request_with_timeout)
+        token = _request_timeout.set(timeout)
+        try:
+            return cast(TelegramType, await middleware(bot, method))
+        finally:
+            _request_timeout.reset(token)
+
+    async def _make_request_with_timeout(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> TelegramType:
+        return await self.make_request(bot, method, timeout=_request_timeout.get())
 
     async def __aenter__(self) -> BaseSession:
         return self
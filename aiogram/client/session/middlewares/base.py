@@ -1,15 +1,39 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from aiogram.methods import Response, TelegramMethod
 from aiogram.methods.base import TelegramType
 
 if TYPE_CHECKING:
+    from ....dispatcher.router import Router
     from ...bot import Bot
 
 
+def _never(*args: Any, **kwargs: Any) -> bool:
+    return False
+
+
+async def _skip_update(*args: Any, **kwargs: Any) -> None:  # pragma: no cover
+    pass
+
+
+def register_update_types(router: Router, *update_types: str) -> None:
+    """
+    Make the updates of the given types to be received by the router
+
+    Outer middlewares are not taken into account by :code:`resolve_used_update_types`,
+    so the handler that never matches is registered for each type,
+    and the updates are requested when allowed updates are resolved from the handlers.
+
+    :param router: router instance, usually it is the dispatcher
+    :param update_types: names of the update types
+    """
+    for update_type in update_types:
+        router.observers[update_type].register(_skip_update, _never)
+
+
 class NextRequestMiddlewareType(Protocol[TelegramType]):  # pragma: no cover
     async def __call__(
         self,
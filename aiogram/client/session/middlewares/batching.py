@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from aiogram import loggers
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import (
+    CopyMessage,
+    CopyMessages,
+    DeleteMessage,
+    DeleteMessages,
+    ForwardMessage,
+    ForwardMessages,
+    Response,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+MAX_BATCH_SIZE = 100
+
+# Single message method: batch method and fields shared by all the messages of the batch
+BATCH_METHODS: Dict[
+    Type[TelegramMethod[Any]], Tuple[Type[TelegramMethod[Any]], Tuple[str, ...]]
+] = {
+    DeleteMessage: (DeleteMessages, ("chat_id",)),
+    ForwardMessage: (
+        ForwardMessages,
+        (
+            "chat_id",
+            "from_chat_id",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+        ),
+    ),
+    CopyMessage: (
+        CopyMessages,
+        (
+            "chat_id",
+            "from_chat_id",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+        ),
+    ),
+}
+DEFAULT_BATCHED_METHODS = frozenset({DeleteMessage, CopyMessage})
+
+
+@dataclass
+class BatchingMetrics:
+    """
+    Counters of the batching middleware
+    """
+
+    requests: int = 0
+    """Amount of batched calls"""
+    batches: int = 0
+    """Amount of sent requests, including batches of the single message"""
+    single: int = 0
+    """Amount of batches with the single message sent as is"""
+
+
+@dataclass
+class _Batch:
+    bot: Bot
+    method: TelegramMethod[Any]
+    make_request: NextRequestMiddlewareType[Any]
+    waiters: List[Tuple[int, asyncio.Future[Any]]] = field(default_factory=list)
+    message_ids: Set[int] = field(default_factory=set)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class MessageBatcher(BaseRequestMiddleware):
+    def __init__(
+        self,
+        window: float = 0.1,
+        max_size: int = MAX_BATCH_SIZE,
+        methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Middleware that buffers calls of the single message methods for a short window
+        and sends them as the batch requests
+
+        :code:`deleteMessage` calls to the same chat are sent as :code:`deleteMessages`,
+        :code:`copyMessage` and :code:`forwardMessage` calls from the same chat to the same chat
+        (and with the same options) are sent as :code:`copyMessages` and :code:`forwardMessages`.
+        Each caller receives its result (or the error) of the batch request,
+        batches of the single message are sent as is.
+
+        Only the calls without the options missing in the batch methods are batched,
+        copies with the new caption or the reply markup are sent as usual.
+
+        .. warning::
+
+            :code:`deleteMessages` skips messages that can not be found,
+            so batched deletions do not raise the error for such messages.
+            :code:`forwardMessages` returns :class:`aiogram.types.MessageId`
+            instead of :class:`aiogram.types.Message`, so :code:`forwardMessage`
+            is batched only when it is passed in :code:`methods` explicitly.
+
+        :param window: time (in seconds) the calls are buffered before the batch is sent
+        :param max_size: maximum amount of messages in the batch, the full batch is sent at once
+        :param methods: batched methods, by default :code:`deleteMessage` and :code:`copyMessage`
+        """
+        unknown = [method.__name__ for method in methods or () if method not in BATCH_METHODS]
+        if unknown:
+            raise ValueError(f"Methods {', '.join(unknown)} can not be batched")
+        if not 1 <= max_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size should be from 1 to {MAX_BATCH_SIZE}")
+
+        self.window = window
+        self.max_size = max_size
+        self.methods = frozenset(methods) if methods is not None else DEFAULT_BATCHED_METHODS
+        self.metrics = BatchingMetrics()
+        self._batches: Dict[Hashable, _Batch] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def is_batchable(self, method: TelegramMethod[Any]) -> bool:
+        """
+        Check that the call can be sent in the batch
+
+        :param method: method instance
+        """
+        if type(method) not in self.methods or method._result_mode is not None:
+            return False
+        _, shared_fields = BATCH_METHODS[type(method)]
+        # Options that are not supported by the batch methods should be empty
+        return not method.__pydantic_extra__ and all(
+            value is None
+            for name, value in method
+            if name != "message_id" and name not in shared_fields
+        )
+
+    def get_key(self, bot: Bot, method: TelegramMethod[Any]) -> Hashable:
+        """
+        Build the key of the batch, calls with the same key are sent in the same batch
+
+        :param bot: bot instance
+        :param method: single message method
+        """
+        _, shared_fields = BATCH_METHODS[type(method)]
+        return (bot.id, type(method)) + tuple(getattr(method, name) for name in shared_fields)
+
+    def make_batch_method(
+        self, method: TelegramMethod[Any], message_ids: List[int]
+    ) -> TelegramMethod[Any]:
+        """
+        Make the batch method
+
+        :param method: one of the batched single message methods
+        :param message_ids: identifiers of the messages in the strictly increasing order
+        """
+        batch_method_type, shared_fields = BATCH_METHODS[type(method)]
+        batch_method = batch_method_type(
+            message_ids=message_ids, **{name: getattr(method, name) for name in shared_fields}
+        )
+        batch_method._priority = method._priority
+        return batch_method
+
+    async def flush(self) -> None:
+        """
+        Send all the buffered calls without waiting for the window end
+        and wait until they are sent
+        """
+        for key in list(self._batches):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    def _flush(self, key: Hashable) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: _Batch) -> None:
+        # Callers that are cancelled while waiting do not need the result
+        waiters = [
+            (message_id, waiter) for message_id, waiter in batch.waiters if not waiter.done()
+        ]
+        if not waiters:
+            return
+        message_ids = sorted({message_id for message_id, _ in waiters})
+        if len(message_ids) == 1:
+            self.metrics.single += 1
+            method = batch.method.model_copy(update={"message_id": message_ids[0]})
+        else:
+            method = self.make_batch_method(batch.method, message_ids)
+        self.metrics.batches += 1
+        loggers.middlewares.debug(
+            "%d calls of %r are sent as %r (bot id=%d)",
+            len(waiters),
+            type(batch.method).__name__,
+            type(method).__name__,
+            batch.bot.id,
+        )
+
+        try:
+            result = await batch.make_request(batch.bot, method)
+        except Exception as e:
+            for _, waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+
+        if len(message_ids) == 1 or not isinstance(result, list):
+            results = {message_id: result for message_id in message_ids}
+        elif len(result) == len(message_ids):
+            results = dict(zip(message_ids, result))
+        else:
+            # Messages that can not be copied or forwarded are skipped,
+            # so the results can not be matched with the calls
+            results = {}
+        for message_id, waiter in waiters:
+            if waiter.done():
+                continue
+            if message_id in results:
+                waiter.set_result(results[message_id])
+            else:
+                waiter.set_exception(
+                    TelegramBadRequest(
+                        method=method,
+                        message="Some messages of the batch are skipped by Telegram, "
+                        "the result of the message can not be determined",
+                    )
+                )
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not self.is_batchable(method):
+            return await make_request(bot, method)
+
+        self.metrics.requests += 1
+        message_id: int = getattr(method, "message_id")
+        key = self.get_key(bot=bot, method=method)
+        batch = self._batches.get(key)
+        if (
+            batch is not None
+            and message_id in batch.message_ids
+            and not isinstance(method, DeleteMessage)
+        ):
+            # The same message is copied or forwarded again, so it is sent in the next batch
+            self._flush(key)
+            batch = None
+        if batch is None:
+            batch = self._batches[key] = _Batch(bot=bot, method=method, make_request=make_request)
+            batch.timer = asyncio.get_running_loop().call_later(self.window, self._flush, key)
+
+        waiter: asyncio.Future[Response[TelegramType]] = asyncio.get_running_loop().create_future()
+        batch.waiters.append((message_id, waiter))
+        batch.message_ids.add(message_id)
+        if len(batch.message_ids) >= self.max_size:
+            self._flush(key)
+        return await waiter
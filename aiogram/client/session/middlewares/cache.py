@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
+
+from aiogram import loggers
+from aiogram.methods import (
+    BanChatMember,
+    BanChatSenderChat,
+    GetChat,
+    GetChatAdministrators,
+    GetChatMember,
+    GetChatMemberCount,
+    LeaveChat,
+    PromoteChatMember,
+    Response,
+    RestrictChatMember,
+    SetChatAdministratorCustomTitle,
+    SetChatDescription,
+    SetChatPermissions,
+    SetChatPhoto,
+    SetChatTitle,
+    TelegramMethod,
+    UnbanChatMember,
+    UnbanChatSenderChat,
+)
+from aiogram.methods.base import ResultMode, TelegramType
+from aiogram.types import ChatMemberUpdated, TelegramObject
+
+from ..base import get_response_type
+from .base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+    register_update_types,
+)
+from .single_flight import make_method_key
+
+if TYPE_CHECKING:
+    from ....dispatcher.router import Router
+    from ...bot import Bot
+
+DEFAULT_CACHE_TTL: Dict[Type[TelegramMethod[Any]], float] = {
+    GetChat: 60.0,
+    GetChatAdministrators: 300.0,
+    GetChatMember: 60.0,
+    GetChatMemberCount: 60.0,
+}
+# Methods that change chat members or chat info, so the cache of the chat is dropped on success
+DEFAULT_INVALIDATING_METHODS: FrozenSet[Type[TelegramMethod[Any]]] = frozenset(
+    {
+        BanChatMember,
+        BanChatSenderChat,
+        LeaveChat,
+        PromoteChatMember,
+        RestrictChatMember,
+        SetChatAdministratorCustomTitle,
+        SetChatDescription,
+        SetChatPermissions,
+        SetChatPhoto,
+        SetChatTitle,
+        UnbanChatMember,
+        UnbanChatSenderChat,
+    }
+)
+
+
+def make_chat_tag(bot_id: int, chat_id: Any) -> str:
+    return f"{bot_id}:{chat_id}"
+
+
+class BaseResponseCacheStorage(ABC):
+    """
+    Base class for cached responses storages
+
+    Responses are stored serialized and tagged with the chat, so all the responses
+    related to the chat can be dropped at once.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Get cached response
+
+        :param key: cache key
+        :return: serialized response or :code:`None` when it is missing or expired
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float, tag: Optional[str] = None) -> None:
+        """
+        Cache the response
+
+        :param key: cache key
+        :param value: serialized response
+        :param ttl: time to live (in seconds)
+        :param tag: tag of the chat
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, tag: str) -> None:
+        """
+        Drop all the responses tagged with the tag
+
+        :param tag: tag of the chat
+        """
+        pass
+
+    async def close(self) -> None:  # pragma: no cover
+        """
+        Close storage (database connection, file or etc.)
+        """
+        pass
+
+
+class MemoryResponseCacheStorage(BaseResponseCacheStorage):
+    """
+    In-memory cache with TTL and LRU eviction, is used by default.
+
+    Is not shared between processes, for multi-process deployments
+    use :class:`aiogram.client.session.middlewares.redis.RedisResponseCacheStorage`
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """
+        :param max_size: maximum amount of cached responses,
+            least recently used responses are evicted
+        """
+        self.max_size = max_size
+        self._data: OrderedDict[str, Tuple[float, str, Optional[str]]] = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def _remove(self, key: str) -> None:
+        _, _, tag = self._data.pop(key)
+        if tag is not None and (keys := self._tags.get(tag)) is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value, _ = item
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float, tag: Optional[str] = None) -> None:
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = (time.monotonic() + ttl, value, tag)
+        if tag is not None:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._data) > self.max_size:
+            self._remove(next(iter(self._data)))
+
+    async def invalidate(self, tag: str) -> None:
+        for key in self._tags.pop(tag, ()):
+            self._data.pop(key, None)
+
+
+@dataclass
+class CacheMetrics:
+    """
+    Counters of the response cache
+    """
+
+    hits: int = 0
+    """Amount of responses returned from the cache"""
+    misses: int = 0
+    """Amount of requests made because the response is not cached"""
+    invalidations: int = 0
+    """Amount of chat invalidations"""
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(BaseRequestMiddleware):
+    def __init__(
+        self,
+        storage: Optional[BaseResponseCacheStorage] = None,
+        ttl: Optional[Dict[Type[TelegramMethod[Any]], float]] = None,
+        invalidating_methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Middleware that caches responses of read methods
+
+        Cached responses of the chat are dropped when the bot changes the chat members
+        or the chat info, and when :code:`chat_member` or :code:`my_chat_member` update
+        of the chat is received (see :meth:`setup`).
+
+        :param storage: responses storage, in-memory storage is used by default
+        :param ttl: cached methods with time to live (in seconds) of their responses,
+            by default :code:`getChat`, :code:`getChatAdministrators`,
+            :code:`getChatMember` and :code:`getChatMemberCount` are cached
+        :param invalidating_methods: methods that drop the cache of the chat on success
+        """
+        self.storage = storage or MemoryResponseCacheStorage()
+        self.ttl = ttl if ttl is not None else DEFAULT_CACHE_TTL
+        self.invalidating_methods = (
+            frozenset(invalidating_methods)
+            if invalidating_methods is not None
+            else DEFAULT_INVALIDATING_METHODS
+        )
+        self.metrics = CacheMetrics()
+
+    async def invalidate(self, bot_id: int, chat_id: Any) -> None:
+        """
+        Drop all the cached responses of the chat
+
+        :param bot_id: bot id
+        :param chat_id: chat id
+        """
+        self.metrics.invalidations += 1
+        await self.storage.invalidate(make_chat_tag(bot_id, chat_id))
+
+    def setup(self, router: Router) -> None:
+        """
+        Invalidate cache by :code:`chat_member` and :code:`my_chat_member` updates
+        received by the router, usually it is the dispatcher
+
+        :param router: router instance
+        """
+        router.chat_member.outer_middleware(self.invalidation_middleware)
+        router.my_chat_member.outer_middleware(self.invalidation_middleware)
+        register_update_types(router, "chat_member", "my_chat_member")
+
+    async def invalidation_middleware(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Event middleware that drops the cache of the chat of the received update
+        """
+        bot = data.get("bot")
+        if isinstance(event, ChatMemberUpdated) and bot is not None:
+            await self.invalidate(bot_id=bot.id, chat_id=event.chat.id)
+        return await handler(event, data)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        method_type = type(method)
+        chat_id = getattr(method, "chat_id", None)
+
+        if method_type in self.invalidating_methods:
+            result = await make_request(bot, method)
+            if chat_id is not None:
+                await self.invalidate(bot_id=bot.id, chat_id=chat_id)
+            return result
+
+        ttl = self.ttl.get(method_type)
+        # Responses of other result modes are not complete, so they are not cached
+        if ttl is None or bot.session.get_result_mode(method) is not ResultMode.FULL:
+            return await make_request(bot, method)
+
+        key = make_method_key(bot=bot, method=method)
+        response_type = get_response_type(method_type)
+        cached = await self.storage.get(key)
+        if cached is not None:
+            self.metrics.hits += 1
+            loggers.middlewares.debug(
+                "Response of method %r is taken from cache (bot id=%d)",
+                method_type.__name__,
+                bot.id,
+            )
+            cached_response = response_type.model_validate_json(cached, context={"bot": bot})
+            return cast(Response[TelegramType], cached_response.result)
+
+        self.metrics.misses += 1
+        result = await make_request(bot, method)
+        # Session returns the result, so it is wrapped to be serialized as any response type
+        await self.storage.set(
+            key,
+            response_type(ok=True, result=result).model_dump_json(
+                by_alias=True, exclude_none=True
+            ),
+            ttl=ttl,
+            tag=make_chat_tag(bot.id, chat_id) if chat_id is not None else None,
+        )
+        return result
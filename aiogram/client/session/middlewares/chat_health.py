@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from aiogram import loggers
+from aiogram.enums import ChatMemberStatus
+from aiogram.exceptions import TelegramForbiddenError, TelegramMigrateToChat
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import ChatMemberUpdated, TelegramObject
+
+from .base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+    register_update_types,
+)
+
+if TYPE_CHECKING:
+    from ....dispatcher.router import Router
+    from ...bot import Bot
+
+FORBIDDEN = "forbidden"
+MIGRATED = "migrated"
+
+DEFAULT_FORBIDDEN_TTL = 24 * 60 * 60.0
+DEFAULT_MIGRATED_TTL = 30 * 24 * 60 * 60.0
+
+# Statuses of the bot in the chat that make sending to the chat impossible
+UNREACHABLE_STATUSES = frozenset({ChatMemberStatus.KICKED, ChatMemberStatus.LEFT})
+
+# Descriptions of the errors that mean the chat can not receive messages until the bot
+# is unblocked or added back, other forbidden errors (like "bot can't initiate conversation
+# with a user") are resolved by the user and are not remembered
+UNREACHABLE_DESCRIPTIONS = (
+    "bot was blocked by the user",
+    "user is deactivated",
+    "bot was kicked from",
+)
+
+
+def make_chat_key(bot_id: int, chat_id: Any) -> str:
+    return f"{bot_id}:{chat_id}"
+
+
+def is_unreachable_error(error: TelegramForbiddenError) -> bool:
+    """
+    Check whether the error means the chat is unreachable:
+    the bot is blocked by the user, the account is deactivated
+    or the bot is kicked from the chat
+
+    :param error: forbidden error raised by the request to the chat
+    """
+    description = error.message.lower()
+    return any(fragment in description for fragment in UNREACHABLE_DESCRIPTIONS)
+
+
+class BaseChatHealthStorage(ABC):
+    """
+    Base class for storages of the unreachable and migrated chats
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Get status of the chat
+
+        :param key: key of the chat
+        :return: status or :code:`None` when the chat is healthy
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """
+        Set status of the chat
+
+        :param key: key of the chat
+        :param value: status
+        :param ttl: time to live (in seconds)
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Forget status of the chat
+
+        :param key: key of the chat
+        """
+        pass
+
+    async def close(self) -> None:  # pragma: no cover
+        """
+        Close storage (database connection, file or etc.)
+        """
+        pass
+
+
+class MemoryChatHealthStorage(BaseChatHealthStorage):
+    """
+    In-memory statuses storage, is used by default.
+
+    Is not shared between processes, for multi-process deployments
+    use :class:`aiogram.client.session.middlewares.redis.RedisChatHealthStorage`
+    """
+
+    def __init__(self, cleanup_every: int = 1000) -> None:
+        """
+        :param cleanup_every: remove expired statuses after this amount of updates
+        """
+        self._data: Dict[str, Tuple[float, str]] = {}
+        self._cleanup_every = cleanup_every
+        self._updates = 0
+
+    def _cleanup(self, now: float) -> None:
+        self._data = {key: item for key, item in self._data.items() if item[0] > now}
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        now = time.monotonic()
+        self._updates += 1
+        if self._updates % self._cleanup_every == 0:
+            self._cleanup(now)
+        self._data[key] = (now + ttl, value)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class UnreachableChatPolicy(str, Enum):
+    """
+    What to do with the requests to the chats known to be unreachable
+    """
+
+    RAISE = "raise"
+    """Raise :class:`aiogram.exceptions.TelegramForbiddenError` without sending the request"""
+    SEND = "send"
+    """Send the request anyway, statuses are only collected"""
+
+
+@dataclass
+class ChatHealthMetrics:
+    """
+    Counters of the chat health middleware
+    """
+
+    forbidden: int = 0
+    """Amount of chats marked as unreachable"""
+    migrated: int = 0
+    """Amount of migrated chats found"""
+    short_circuited: int = 0
+    """Amount of requests rejected without sending"""
+    rewritten: int = 0
+    """Amount of requests sent to the new id of the migrated chat"""
+
+
+class ChatHealth(BaseRequestMiddleware):
+    def __init__(
+        self,
+        storage: Optional[BaseChatHealthStorage] = None,
+        policy: UnreachableChatPolicy = UnreachableChatPolicy.RAISE,
+        forbidden_ttl: float = DEFAULT_FORBIDDEN_TTL,
+        migrated_ttl: float = DEFAULT_MIGRATED_TTL,
+        retry_migrated: bool = True,
+        methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Middleware that remembers chats that can not receive messages
+
+        Chats that blocked the bot, deactivated accounts and chats the bot was kicked from
+        are remembered by :class:`aiogram.exceptions.TelegramForbiddenError`
+        with the corresponding description,
+        the next requests to them are handled according to the policy.
+        Groups migrated to supergroups are remembered
+        by :class:`aiogram.exceptions.TelegramMigrateToChat`,
+        the next requests to them are sent to the new chat id.
+
+        :param storage: statuses storage, in-memory storage is used by default
+        :param policy: what to do with the requests to the unreachable chats
+        :param forbidden_ttl: time (in seconds) the chat is considered unreachable
+        :param migrated_ttl: time (in seconds) the new id of the migrated chat is remembered
+        :param retry_migrated: send the failed request to the new id of the migrated chat
+        :param methods: methods that are checked, by default all the methods with :code:`chat_id`
+        """
+        self.storage = storage or MemoryChatHealthStorage()
+        self.policy = policy
+        self.forbidden_ttl = forbidden_ttl
+        self.migrated_ttl = migrated_ttl
+        self.retry_migrated = retry_migrated
+        self.methods: Optional[FrozenSet[Type[TelegramMethod[Any]]]] = (
+            frozenset(methods) if methods is not None else None
+        )
+        self.metrics = ChatHealthMetrics()
+
+    async def mark_forbidden(self, bot_id: int, chat_id: Any, description: str) -> None:
+        """
+        Mark the chat as unreachable
+
+        :param bot_id: bot id
+        :param chat_id: chat id
+        :param description: description of the error raised by the requests to the chat
+        """
+        self.metrics.forbidden += 1
+        await self.storage.set(
+            make_chat_key(bot_id, chat_id), f"{FORBIDDEN}:{description}", ttl=self.forbidden_ttl
+        )
+
+    async def mark_migrated(self, bot_id: int, chat_id: Any, migrate_to_chat_id: int) -> None:
+        """
+        Remember the new id of the migrated chat
+
+        :param bot_id: bot id
+        :param chat_id: old chat id
+        :param migrate_to_chat_id: new chat id
+        """
+        self.metrics.migrated += 1
+        await self.storage.set(
+            make_chat_key(bot_id, chat_id),
+            f"{MIGRATED}:{migrate_to_chat_id}",
+            ttl=self.migrated_ttl,
+        )
+
+    async def forget(self, bot_id: int, chat_id: Any) -> None:
+        """
+        Forget status of the chat
+
+        :param bot_id: bot id
+        :param chat_id: chat id
+        """
+        await self.storage.delete(make_chat_key(bot_id, chat_id))
+
+    def setup(self, router: Router) -> None:
+        """
+        Update statuses of the chats by :code:`my_chat_member` updates
+        received by the router, usually it is the dispatcher
+
+        :param router: router instance
+        """
+        router.my_chat_member.outer_middleware(self.status_middleware)
+        register_update_types(router, "my_chat_member")
+
+    async def status_middleware(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Event middleware that updates status of the chat when the bot is blocked,
+        unblocked, kicked or added to the chat
+        """
+        bot = data.get("bot")
+        if isinstance(event, ChatMemberUpdated) and bot is not None:
+            status = event.new_chat_member.status
+            if status in UNREACHABLE_STATUSES:
+                await self.mark_forbidden(
+                    bot_id=bot.id,
+                    chat_id=event.chat.id,
+                    description="Forbidden: the bot is blocked or removed from the chat",
+                )
+            else:
+                await self.forget(bot_id=bot.id, chat_id=event.chat.id)
+        return await handler(event, data)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None or (self.methods is not None and type(method) not in self.methods):
+            return await make_request(bot, method)
+
+        value = await self.storage.get(make_chat_key(bot.id, chat_id))
+        if value is not None:
+            status, _, details = value.partition(":")
+            if status == MIGRATED:
+                self.metrics.rewritten += 1
+                chat_id = int(details)
+                method = method.model_copy(update={"chat_id": chat_id})
+            elif status == FORBIDDEN and self.policy is UnreachableChatPolicy.RAISE:
+                self.metrics.short_circuited += 1
+                loggers.middlewares.debug(
+                    "Method %r is not sent to unreachable chat %s (bot id=%d)",
+                    type(method).__name__,
+                    chat_id,
+                    bot.id,
+                )
+                raise TelegramForbiddenError(method=method, message=details)
+
+        try:
+            return await make_request(bot, method)
+        except TelegramForbiddenError as e:
+            if is_unreachable_error(e):
+                await self.mark_forbidden(bot_id=bot.id, chat_id=chat_id, description=e.message)
+            raise
+        except TelegramMigrateToChat as e:
+            await self.mark_migrated(
+                bot_id=bot.id, chat_id=chat_id, migrate_to_chat_id=e.migrate_to_chat_id
+            )
+            if not self.retry_migrated:
+                raise
+            self.metrics.rewritten += 1
+            return await make_request(
+                bot, method.model_copy(update={"chat_id": e.migrate_to_chat_id})
+            )
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Optional, Type
+
+from aiogram import loggers
+from aiogram.exceptions import (
+    CircuitBreakerOpen,
+    TelegramAPIError,
+    TelegramNetworkError,
+    TelegramServerError,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from ..balancer import CLIENT_SIDE_ERRORS
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+
+class CircuitState(str, Enum):
+    """
+    State of the circuit breaker
+    """
+
+    CLOSED = "closed"
+    """Requests are sent as usual"""
+    OPEN = "open"
+    """API server is unavailable, requests are rejected"""
+    HALF_OPEN = "half_open"
+    """Recovery timeout is passed, limited amount of probe requests is sent"""
+
+
+class Circuit:
+    """
+    Circuit of the API server
+    """
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        """Amount of consecutive failures"""
+        self.opened_at = 0.0
+        """Monotonic time when the circuit was opened last time"""
+        self.probes = 0
+        """Amount of probe requests in progress"""
+        self._changed: Optional[asyncio.Event] = None
+
+    def set_state(self, state: CircuitState) -> None:
+        self.state = state
+        # Queued requests are woken up to check the new state
+        event, self._changed = self._changed, None
+        if event is not None:
+            event.set()
+
+    async def wait(self, timeout: float) -> None:
+        """
+        Wait until the state is changed or the timeout is passed
+
+        :param timeout: timeout (in seconds)
+        """
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"Circuit(state={self.state.value!r}, failures={self.failures})"
+
+
+@dataclass
+class CircuitBreakerMetrics:
+    """
+    Counters of the circuit breaker
+    """
+
+    requests: int = 0
+    """Amount of handled requests"""
+    failures: int = 0
+    """Amount of network and server errors"""
+    opened: int = 0
+    """Amount of times the circuits were opened"""
+    rejected: int = 0
+    """Amount of requests rejected without sending"""
+    queued: int = 0
+    """Amount of requests that waited for the circuit to close"""
+    probes: int = 0
+    """Amount of probe requests sent in the half-open state"""
+
+
+class CircuitBreaker(BaseRequestMiddleware):
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        queue_methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+        max_queue_time: float = 60.0,
+    ) -> None:
+        """
+        Middleware that stops sending requests to the unavailable Bot API server
+
+        Circuit of the server is opened after consecutive network or server errors,
+        errors caused by the request itself (like too large files) are not counted,
+        while it is open the requests are rejected
+        with :class:`aiogram.exceptions.CircuitBreakerOpen` without waiting for the timeout.
+        When the recovery timeout is passed, limited amount of probe requests is sent
+        and the circuit is closed by the first successful one.
+
+        :param failure_threshold: amount of consecutive failures to open the circuit
+        :param recovery_timeout: time (in seconds) before the probe requests are sent
+        :param half_open_probes: maximum amount of concurrent probe requests
+        :param queue_methods: non-critical methods that wait for the circuit to close
+            instead of being rejected, by default all the requests are rejected
+        :param max_queue_time: maximum time (in seconds) the request waits for the circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.queue_methods: FrozenSet[Type[TelegramMethod[Any]]] = frozenset(queue_methods or ())
+        self.max_queue_time = max_queue_time
+        self.metrics = CircuitBreakerMetrics()
+        self._circuits: Dict[str, Circuit] = {}
+
+    @property
+    def circuits(self) -> Dict[str, Circuit]:
+        """
+        Circuits by the API servers
+        """
+        return self._circuits
+
+    def get_key(self, bot: Bot) -> str:
+        return bot.session.get_api(bot).base
+
+    def get_circuit(self, key: str) -> Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = Circuit()
+        return circuit
+
+    def get_state(self, bot: Bot) -> CircuitState:
+        """
+        Get state of the circuit of the API server used by the bot
+
+        :param bot: bot instance
+        """
+        return self.get_circuit(self.get_key(bot)).state
+
+    def get_retry_after(self, circuit: Circuit) -> float:
+        """
+        Get time (in seconds) until the probe requests can be sent
+        """
+        if circuit.state is not CircuitState.OPEN:
+            return 0.0
+        return max(circuit.opened_at + self.recovery_timeout - time.monotonic(), 0.0)
+
+    def _is_allowed(self, circuit: Circuit) -> bool:
+        if circuit.state is CircuitState.OPEN and not self.get_retry_after(circuit):
+            circuit.set_state(CircuitState.HALF_OPEN)
+        if circuit.state is CircuitState.HALF_OPEN:
+            return circuit.probes < self.half_open_probes
+        return circuit.state is CircuitState.CLOSED
+
+    def _on_success(self, key: str, circuit: Circuit) -> None:
+        circuit.failures = 0
+        if circuit.state is not CircuitState.CLOSED:
+            loggers.middlewares.info("Circuit of API server %r is closed", key)
+            circuit.set_state(CircuitState.CLOSED)
+
+    def _on_failure(self, key: str, circuit: Circuit) -> None:
+        self.metrics.failures += 1
+        circuit.failures += 1
+        if circuit.state is CircuitState.HALF_OPEN or (
+            circuit.state is CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+        ):
+            loggers.middlewares.warning(
+                "Circuit of API server %r is open for %.1f seconds after %d failures",
+                key,
+                self.recovery_timeout,
+                circuit.failures,
+            )
+            self.metrics.opened += 1
+            circuit.opened_at = time.monotonic()
+            circuit.set_state(CircuitState.OPEN)
+
+    async def _wait_allowed(self, key: str, circuit: Circuit, method: TelegramMethod[Any]) -> None:
+        deadline: Optional[float] = None
+        while not self._is_allowed(circuit):
+            now = time.monotonic()
+            if type(method) in self.queue_methods:
+                if deadline is None:
+                    self.metrics.queued += 1
+                    deadline = now + self.max_queue_time
+                if now < deadline:
+                    timeout = deadline - now
+                    if circuit.state is CircuitState.OPEN:
+                        timeout = min(timeout, self.get_retry_after(circuit))
+                    await circuit.wait(timeout=timeout)
+                    continue
+            self.metrics.rejected += 1
+            raise CircuitBreakerOpen(
+                method=method,
+                message=f"Circuit of API server {key!r} is {circuit.state.value}",
+                retry_after=self.get_retry_after(circuit),
+            )
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        self.metrics.requests += 1
+        key = self.get_key(bot)
+        circuit = self.get_circuit(key)
+        await self._wait_allowed(key=key, circuit=circuit, method=method)
+
+        probe = circuit.state is CircuitState.HALF_OPEN
+        if probe:
+            self.metrics.probes += 1
+            circuit.probes += 1
+        try:
+            result = await make_request(bot, method)
+        except CLIENT_SIDE_ERRORS:
+            # Server is available, the request or the response is just too large
+            self._on_success(key=key, circuit=circuit)
+            raise
+        except (TelegramNetworkError, TelegramServerError):
+            self._on_failure(key=key, circuit=circuit)
+            raise
+        except TelegramAPIError:
+            # Server is available, the request is just wrong
+            self._on_success(key=key, circuit=circuit)
+            raise
+        finally:
+            if probe:
+                circuit.probes -= 1
+                if circuit.state is CircuitState.HALF_OPEN:
+                    # Probe is cancelled, so the queued request can be the next probe
+                    circuit.set_state(CircuitState.HALF_OPEN)
+        self._on_success(key=key, circuit=circuit)
+        return result
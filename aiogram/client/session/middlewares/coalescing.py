@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Type
+
+from aiogram import loggers
+from aiogram.methods import (
+    EditMessageCaption,
+    EditMessageReplyMarkup,
+    EditMessageText,
+    Response,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+DEFAULT_COALESCED_METHODS = frozenset(
+    {EditMessageText, EditMessageCaption, EditMessageReplyMarkup}
+)
+
+
+@dataclass
+class CoalescingMetrics:
+    """
+    Counters of the edit coalescing middleware
+    """
+
+    requests: int = 0
+    """Amount of handled edits"""
+    sent: int = 0
+    """Amount of sent edits"""
+    coalesced: int = 0
+    """Amount of edits replaced by the later edits of the same message"""
+
+
+@dataclass
+class _PendingEdit:
+    bot: Bot
+    method: TelegramMethod[Any]
+    make_request: NextRequestMiddlewareType[Any]
+    waiters: List[asyncio.Future[Any]] = field(default_factory=list)
+    sent_at: float = float("-inf")
+    task: Optional[asyncio.Task[None]] = None
+
+
+class EditCoalescer(BaseRequestMiddleware):
+    def __init__(
+        self,
+        window: float = 1.0,
+        methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Middleware that coalesces frequent edits of the same message
+
+        The first edit of the message is sent immediately, the next edits
+        made within the window after it wait for the window end and only the latest
+        of them is sent, so the message is edited no more often than once per window.
+        All the callers receive the result (or the error) of the sent edit.
+
+        Edits are coalesced per bot, method, chat and message (or inline message),
+        so edits of the text and of the reply markup of the same message do not replace
+        each other.
+
+        :param window: minimal interval (in seconds) between the edits of the same message
+        :param methods: methods that are coalesced, by default :code:`editMessageText`,
+            :code:`editMessageCaption` and :code:`editMessageReplyMarkup`
+        """
+        self.window = window
+        self.methods = frozenset(methods) if methods is not None else DEFAULT_COALESCED_METHODS
+        self.metrics = CoalescingMetrics()
+        self._pending: Dict[Hashable, _PendingEdit] = {}
+
+    def get_key(self, bot: Bot, method: TelegramMethod[Any]) -> Hashable:
+        """
+        Build the key of the edited message, edits with the same key are coalesced
+
+        :param bot: bot instance
+        :param method: edit method
+        """
+        return (
+            bot.id,
+            method.__api_method__,
+            getattr(method, "business_connection_id", None),
+            getattr(method, "chat_id", None),
+            getattr(method, "message_id", None),
+            getattr(method, "inline_message_id", None),
+        )
+
+    async def _send(self, key: Hashable, edit: _PendingEdit) -> None:
+        try:
+            while True:
+                delay = edit.sent_at + self.window - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # Callers that are cancelled while waiting do not need the result
+                waiters = [waiter for waiter in edit.waiters if not waiter.done()]
+                edit.waiters = []
+                if not waiters:
+                    break
+
+                self.metrics.sent += 1
+                edit.sent_at = time.monotonic()
+                try:
+                    result = await edit.make_request(edit.bot, edit.method)
+                except Exception as e:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(result)
+        finally:
+            del self._pending[key]
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if type(method) not in self.methods:
+            return await make_request(bot, method)
+
+        self.metrics.requests += 1
+        key = self.get_key(bot=bot, method=method)
+        waiter: asyncio.Future[Response[TelegramType]] = asyncio.get_running_loop().create_future()
+        edit = self._pending.get(key)
+        if edit is None:
+            edit = self._pending[key] = _PendingEdit(
+                bot=bot, method=method, make_request=make_request
+            )
+            edit.task = asyncio.create_task(self._send(key, edit))
+        elif edit.waiters:
+            # Previous edit is not sent yet, so it is replaced by the latest one
+            self.metrics.coalesced += 1
+            loggers.middlewares.debug(
+                "Method %r is coalesced with the later edit (bot id=%d)",
+                type(method).__name__,
+                bot.id,
+            )
+        edit.method = method
+        edit.make_request = make_request
+        edit.waiters.append(waiter)
+        return await waiter
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Optional, Set, Type
+
+from aiogram import loggers
+from aiogram.methods import (
+    AnswerInlineQuery,
+    GetChat,
+    GetChatMember,
+    GetFile,
+    Response,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+from .retry import RetryBudget
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+DEFAULT_HEDGED_METHODS = frozenset({AnswerInlineQuery, GetChat, GetChatMember, GetFile})
+
+
+@dataclass
+class HedgingMetrics:
+    """
+    Counters of the hedged requests middleware
+    """
+
+    requests: int = 0
+    """Amount of handled requests"""
+    hedged: int = 0
+    """Amount of requests with the second request sent"""
+    hedge_wins: int = 0
+    """Amount of requests answered by the second request first"""
+
+
+class HedgedRequests(BaseRequestMiddleware):
+    def __init__(
+        self,
+        methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+        quantile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        window: int = 100,
+        min_samples: int = 20,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Middleware that sends the second request of the idempotent method when the first one
+        is slower than usual and returns the first successful response, the other is cancelled
+
+        Delay before the second request is the latency quantile of the recent requests
+        of the method.
+
+        :param methods: idempotent methods that can be hedged, by default
+            :code:`answerInlineQuery`, :code:`getChat`, :code:`getChatMember` and :code:`getFile`
+        :param quantile: latency quantile used as the delay
+        :param initial_delay: delay (in seconds) used until enough latencies are collected
+        :param min_delay: minimal delay (in seconds)
+        :param window: amount of recent latencies of each method to calculate the quantile
+        :param min_samples: minimal amount of latencies to calculate the quantile
+        :param budget: limits the share of the second requests, by default 5% of requests
+        """
+        self.methods = frozenset(methods) if methods is not None else DEFAULT_HEDGED_METHODS
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.budget = budget if budget is not None else RetryBudget(ratio=0.05, capacity=10.0)
+        self.metrics = HedgingMetrics()
+        self._latencies: Dict[Type[TelegramMethod[Any]], Deque[float]] = {}
+
+    def get_delay(self, method_type: Type[TelegramMethod[Any]]) -> float:
+        """
+        Get delay before the second request of the method
+
+        :param method_type: method class
+        """
+        latencies = self._latencies.get(method_type)
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(latencies)
+        index = min(int(len(ordered) * self.quantile), len(ordered) - 1)
+        return max(ordered[index], self.min_delay)
+
+    def _record(self, method_type: Type[TelegramMethod[Any]], latency: float) -> None:
+        latencies = self._latencies.get(method_type)
+        if latencies is None:
+            latencies = self._latencies[method_type] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        method_type = type(method)
+        if method_type not in self.methods:
+            return await make_request(bot, method)
+
+        self.metrics.requests += 1
+        self.budget.deposit()
+        started_at = time.monotonic()
+
+        primary = asyncio.ensure_future(make_request(bot, method))
+        pending: Set[asyncio.Future[Response[TelegramType]]] = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.get_delay(method_type))
+            if not done and self.budget.withdraw():
+                self.metrics.hedged += 1
+                loggers.middlewares.debug(
+                    "Method %r is slow, the second request is sent (bot id=%d)",
+                    method_type.__name__,
+                    bot.id,
+                )
+                pending.add(asyncio.ensure_future(make_request(bot, method)))
+
+            # The first successful response wins, the error is raised only when all requests fail
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.metrics.hedge_wins += 1
+                        self._record(method_type, time.monotonic() - started_at)
+                        result: Response[TelegramType] = task.result()
+                        return result
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, Union, cast, overload
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, cast, overload
 
 from aiogram.client.session.middlewares.base import (
     NextRequestMiddlewareType,
@@ -13,16 +13,22 @@ from aiogram.methods.base import TelegramType
 class RequestMiddlewareManager(Sequence[RequestMiddlewareType]):
     def __init__(self) -> None:
         self._middlewares: List[RequestMiddlewareType] = []
+        # The last compiled chain with its callback, is dropped when the middlewares are changed
+        self._compiled: Optional[
+            Tuple[NextRequestMiddlewareType[Any], NextRequestMiddlewareType[Any]]
+        ] = None
 
     def register(
         self,
         middleware: RequestMiddlewareType,
     ) -> RequestMiddlewareType:
         self._middlewares.append(middleware)
+        self._compiled = None
         return middleware
 
     def unregister(self, middleware: RequestMiddlewareType) -> None:
         self._middlewares.remove(middleware)
+        self._compiled = None
 
     def __call__(
         self,
@@ -60,3 +66,19 @@ class RequestMiddlewareManager(Sequence[RequestMiddlewareType]):
         for m in reversed(self._middlewares):
             middleware = partial(m, middleware)
         return cast(NextRequestMiddlewareType[TelegramType], middleware)
+
+    def compile(
+        self,
+        callback: NextRequestMiddlewareType[TelegramType],
+    ) -> NextRequestMiddlewareType[TelegramType]:
+        """
+        Get the middlewares chain wrapping the callback
+
+        Chain is built once and reused until the middlewares are registered or unregistered.
+
+        :param callback: the last callable of the chain
+        :return: the chain
+        """
+        if self._compiled is None or self._compiled[0] != callback:
+            self._compiled = (callback, self.wrap_middlewares(callback))
+        return cast(NextRequestMiddlewareType[TelegramType], self._compiled[1])
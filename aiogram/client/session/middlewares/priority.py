@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections import deque
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from aiogram import loggers
+from aiogram.dispatcher.flags import get_flag
+from aiogram.methods import (
+    AnswerCallbackQuery,
+    AnswerInlineQuery,
+    AnswerPreCheckoutQuery,
+    AnswerShippingQuery,
+    AnswerWebAppQuery,
+    Response,
+    SendChatAction,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+from aiogram.types import TelegramObject
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ....dispatcher.router import Router
+    from ...bot import Bot
+
+PRIORITY_FLAG = "priority"
+
+
+class Priority(IntEnum):
+    """
+    Common priorities of the requests, lower value is sent sooner
+    """
+
+    HIGH = 0
+    """Answers to the user actions that should be fast"""
+    NORMAL = 50
+    """Regular requests"""
+    LOW = 100
+    """Mass mailings and other background jobs"""
+
+
+DEFAULT_METHOD_PRIORITIES: Dict[Type[TelegramMethod[Any]], int] = {
+    AnswerCallbackQuery: Priority.HIGH,
+    AnswerInlineQuery: Priority.HIGH,
+    AnswerPreCheckoutQuery: Priority.HIGH,
+    AnswerShippingQuery: Priority.HIGH,
+    AnswerWebAppQuery: Priority.HIGH,
+    SendChatAction: Priority.HIGH,
+}
+
+# Priority of the requests made inside the handler, is set from the handler flag
+current_priority: ContextVar[Optional[int]] = ContextVar("current_priority", default=None)
+
+
+class _Waiter:
+    __slots__ = ("enqueued_at", "future")
+
+    def __init__(self, future: asyncio.Future[None]) -> None:
+        self.enqueued_at = time.monotonic()
+        self.future = future
+
+
+class PriorityScheduler(BaseRequestMiddleware):
+    def __init__(
+        self,
+        limit: int = 100,
+        max_wait: Optional[float] = 5.0,
+        default_priority: int = Priority.NORMAL,
+        method_priorities: Optional[Dict[Type[TelegramMethod[Any]], int]] = None,
+    ) -> None:
+        """
+        Middleware that limits concurrent requests and sends the queued requests
+        in order of their priority
+
+        Priority of the request is taken from the call (:code:`method.with_priority(...)`),
+        then from the :code:`priority` flag of the handler that makes the request
+        (see :meth:`setup`), then from the method class.
+
+        :param limit: maximum amount of concurrent requests,
+            should not be greater than connections limit of the session
+        :param max_wait: requests queued longer than this time (in seconds) are sent first
+            regardless of the priority to avoid starvation, :code:`None` disables it
+        :param default_priority: priority of the requests without priority hints
+        :param method_priorities: priorities of the method classes,
+            by default answers to queries and chat actions have high priority
+        """
+        self.limit = limit
+        self.max_wait = max_wait
+        self.default_priority = default_priority
+        self.method_priorities = (
+            dict(method_priorities)
+            if method_priorities is not None
+            else dict(DEFAULT_METHOD_PRIORITIES)
+        )
+
+        self._active = 0
+        self._counter = 0
+        self._heap: List[Tuple[int, int, _Waiter]] = []
+        self._fifo: Deque[_Waiter] = deque()
+
+    @property
+    def active(self) -> int:
+        """
+        Amount of requests in progress
+        """
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """
+        Amount of queued requests
+        """
+        return sum(1 for waiter in self._fifo if not waiter.future.done())
+
+    def resolve_priority(self, method: TelegramMethod[Any]) -> int:
+        if method._priority is not None:
+            return method._priority
+        if (priority := current_priority.get()) is not None:
+            return priority
+        return self.method_priorities.get(type(method), self.default_priority)
+
+    def setup(self, router: Router) -> None:
+        """
+        Apply :code:`priority` flag of the handlers to the requests made inside them
+
+        :param router: router instance, usually it is the dispatcher
+        """
+        for event_name, observer in router.observers.items():
+            if event_name != "update":
+                observer.middleware(self.flags_middleware)
+
+    async def flags_middleware(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        """
+        Event middleware that sets the priority from the handler flag
+        """
+        priority = get_flag(data, PRIORITY_FLAG)
+        if priority is None:
+            return await handler(event, data)
+        token = current_priority.set(priority)
+        try:
+            return await handler(event, data)
+        finally:
+            current_priority.reset(token)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        # Waiters are removed from both queues lazily, so served and cancelled ones are skipped
+        while self._fifo and self._fifo[0].future.done():
+            self._fifo.popleft()
+        if (
+            self.max_wait is not None
+            and self._fifo
+            and time.monotonic() - self._fifo[0].enqueued_at >= self.max_wait
+        ):
+            return self._fifo.popleft()
+        while self._heap:
+            _, _, waiter = heapq.heappop(self._heap)
+            if not waiter.future.done():
+                return waiter
+        return None
+
+    async def acquire(self, priority: int) -> None:
+        """
+        Acquire the slot for the request
+
+        :param priority: priority of the request
+        """
+        # Slots are passed to the queued requests directly, so there are no queued requests
+        # while the limit is not reached
+        if self._active < self.limit:
+            self._active += 1
+            return
+
+        waiter = _Waiter(future=asyncio.get_running_loop().create_future())
+        self._counter += 1
+        heapq.heappush(self._heap, (priority, self._counter, waiter))
+        self._fifo.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot is already passed to this request, so it should be passed further
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Release the slot, it is passed to the next queued request
+        """
+        waiter = self._next_waiter()
+        if waiter is None:
+            self._active -= 1
+        else:
+            waiter.future.set_result(None)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        priority = self.resolve_priority(method)
+        if self._active >= self.limit:
+            loggers.middlewares.debug(
+                "Method %r is queued with priority %d (bot id=%d)",
+                type(method).__name__,
+                priority,
+                bot.id,
+            )
+        await self.acquire(priority)
+        try:
+            return await make_request(bot, method)
+        finally:
+            self.release()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Optional, Type
+
+from aiogram import loggers
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+# Methods that produces or modifies messages in the chat and are limited by Telegram
+LIMITED_METHOD_PREFIXES = ("send", "copyMessage", "forwardMessage", "editMessage", "stopPoll")
+UNLIMITED_METHODS = frozenset({"sendChatAction"})
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Allowed amount of requests per period
+    """
+
+    limit: int
+    """Amount of requests"""
+    period: float = 1.0
+    """Period in seconds"""
+    burst: int = 1
+    """Amount of requests that can be made at once without spacing"""
+
+    @property
+    def interval(self) -> float:
+        return self.period / self.limit
+
+
+DEFAULT_GLOBAL_LIMIT = RateLimit(limit=30, period=1.0)
+DEFAULT_PRIVATE_CHAT_LIMIT = RateLimit(limit=1, period=1.0)
+DEFAULT_GROUP_CHAT_LIMIT = RateLimit(limit=20, period=60.0)
+
+
+@lru_cache(maxsize=None)
+def is_limited_method(method_type: Type[TelegramMethod[Any]]) -> bool:
+    """
+    Check that method sends or edits messages and should be rate limited
+
+    :param method_type: method class
+    """
+    api_method: str = method_type.__api_method__
+    return api_method not in UNLIMITED_METHODS and api_method.startswith(LIMITED_METHOD_PREFIXES)
+
+
+class BaseRateLimitStorage(ABC):
+    """
+    Base class for token buckets storages
+    """
+
+    @abstractmethod
+    async def reserve(self, key: str, rate: RateLimit, delay: float = 0.0) -> float:
+        """
+        Reserve the nearest free slot in the bucket
+
+        Reservation is made in any case, so each caller gets its own slot
+        and requests are spread in time in order of the reservation.
+
+        :param key: bucket key
+        :param rate: rate limit of the bucket
+        :param delay: the slot can't be earlier than this delay from now (in seconds)
+        :return: delay from now before the reserved slot (in seconds)
+        """
+        pass
+
+    async def close(self) -> None:  # pragma: no cover
+        """
+        Close storage (database connection, file or etc.)
+        """
+        pass
+
+
+class MemoryRateLimitStorage(BaseRateLimitStorage):
+    """
+    In-memory token buckets storage, is used by default.
+
+    Is not shared between processes, for multi-process deployments
+    use :class:`aiogram.client.session.middlewares.redis.RedisRateLimitStorage`
+    """
+
+    def __init__(self, cleanup_every: int = 1000) -> None:
+        """
+        :param cleanup_every: remove expired buckets after this amount of reservations
+        """
+        # Theoretical arrival time of the next request for each bucket (GCRA)
+        self._buckets: Dict[str, float] = {}
+        self._cleanup_every = cleanup_every
+        self._reservations = 0
+
+    def _cleanup(self, now: float) -> None:
+        self._buckets = {key: tat for key, tat in self._buckets.items() if tat > now}
+
+    async def reserve(self, key: str, rate: RateLimit, delay: float = 0.0) -> float:
+        now = time.monotonic()
+        self._reservations += 1
+        if self._reservations % self._cleanup_every == 0:
+            self._cleanup(now)
+
+        start = now + delay
+        tat = max(self._buckets.get(key, start), start)
+        allowed_at = max(tat - (rate.burst - 1) * rate.interval, start)
+        self._buckets[key] = tat + rate.interval
+        return allowed_at - now
+
+
+class RateLimiter(BaseRequestMiddleware):
+    def __init__(
+        self,
+        storage: Optional[BaseRateLimitStorage] = None,
+        global_limit: Optional[RateLimit] = DEFAULT_GLOBAL_LIMIT,
+        private_chat_limit: Optional[RateLimit] = DEFAULT_PRIVATE_CHAT_LIMIT,
+        group_chat_limit: Optional[RateLimit] = DEFAULT_GROUP_CHAT_LIMIT,
+        methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Middleware that spreads outgoing messages in time
+        to stay within Telegram limits and avoid flood waits
+
+        Requests are queued through token buckets of the bot and of the target chat,
+        the chat type is inferred from the :code:`chat_id` (positive ids are private chats).
+
+        :param storage: token buckets storage, in-memory storage is used by default
+        :param global_limit: limit for all chats of the bot
+        :param private_chat_limit: limit for each private chat
+        :param group_chat_limit: limit for each group, supergroup or channel
+        :param methods: limited methods, by default all methods that sends or edits messages
+        """
+        self.storage = storage or MemoryRateLimitStorage()
+        self.global_limit = global_limit
+        self.private_chat_limit = private_chat_limit
+        self.group_chat_limit = group_chat_limit
+        self.methods: Optional[FrozenSet[Type[TelegramMethod[Any]]]] = (
+            frozenset(methods) if methods is not None else None
+        )
+
+    def is_limited(self, method: TelegramMethod[Any]) -> bool:
+        if self.methods is not None:
+            return type(method) in self.methods
+        return is_limited_method(type(method))
+
+    def resolve_chat_limit(self, chat_id: Any) -> Optional[RateLimit]:
+        if isinstance(chat_id, int) and chat_id > 0:
+            return self.private_chat_limit
+        return self.group_chat_limit
+
+    async def reserve_chat(self, bot: Bot, method: TelegramMethod[Any]) -> float:
+        """
+        Reserve slot in the bucket of the target chat
+
+        :return: delay before the chat slot (in seconds)
+        """
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None or not (chat_limit := self.resolve_chat_limit(chat_id)):
+            return 0.0
+        return await self.storage.reserve(f"{bot.id}:chat:{chat_id}", chat_limit)
+
+    async def reserve_global(self, bot: Bot) -> float:
+        """
+        Reserve slot in the global bucket of the bot
+
+        :return: delay before the global slot (in seconds)
+        """
+        if not self.global_limit:
+            return 0.0
+        return await self.storage.reserve(f"{bot.id}:global", self.global_limit)
+
+    async def wait(self, bot: Bot, method: TelegramMethod[Any]) -> None:
+        """
+        Wait until the method call can be made
+
+        Global slot is reserved only when the chat slot is reached,
+        so the requests delayed by the limit of a busy chat do not hold global slots
+        and do not delay the requests to the other chats.
+        """
+        await self._sleep(bot=bot, method=method, delay=await self.reserve_chat(bot, method))
+        await self._sleep(bot=bot, method=method, delay=await self.reserve_global(bot))
+
+    async def _sleep(self, bot: Bot, method: TelegramMethod[Any], delay: float) -> None:
+        if delay <= 0:
+            return
+        loggers.middlewares.debug(
+            "Method %r is delayed by rate limiter for %.3f seconds (bot id=%d)",
+            type(method).__name__,
+            delay,
+            bot.id,
+        )
+        await asyncio.sleep(delay)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if self.is_limited(method):
+            await self.wait(bot=bot, method=method)
+        return await make_request(bot, method)
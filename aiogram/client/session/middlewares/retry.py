@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+from aiogram import loggers
+from aiogram.exceptions import (
+    RestartingTelegram,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.utils.backoff import Backoff, BackoffConfig
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+DEFAULT_BACKOFF_CONFIG = BackoffConfig(min_delay=1.0, max_delay=10.0, factor=2.0, jitter=0.1)
+
+
+class BaseBlockStorage(ABC):
+    """
+    Base class for storages of "blocked until" marks of bots and chats
+    """
+
+    @abstractmethod
+    async def block(self, key: str, delay: float) -> None:
+        """
+        Block the key for the delay, longer existing block is kept
+
+        :param key: scope key
+        :param delay: block duration (in seconds)
+        """
+        pass
+
+    @abstractmethod
+    async def get_delay(self, *keys: str) -> float:
+        """
+        Get time left until all the keys are unblocked
+
+        :param keys: scope keys
+        :return: delay (in seconds), zero when keys are not blocked
+        """
+        pass
+
+    async def close(self) -> None:  # pragma: no cover
+        """
+        Close storage (database connection, file or etc.)
+        """
+        pass
+
+
+class MemoryBlockStorage(BaseBlockStorage):
+    """
+    In-memory "blocked until" table, is used by default.
+
+    Is not shared between processes, for multi-process deployments
+    use :class:`aiogram.client.session.middlewares.redis.RedisBlockStorage`
+    """
+
+    def __init__(self) -> None:
+        self._blocked_until: Dict[str, float] = {}
+
+    async def block(self, key: str, delay: float) -> None:
+        until = time.monotonic() + delay
+        if self._blocked_until.get(key, 0) < until:
+            self._blocked_until[key] = until
+
+    async def get_delay(self, *keys: str) -> float:
+        now = time.monotonic()
+        delay = 0.0
+        for key in keys:
+            until = self._blocked_until.get(key)
+            if until is None:
+                continue
+            if until <= now:
+                del self._blocked_until[key]
+                continue
+            delay = max(delay, until - now)
+        return delay
+
+
+@dataclass
+class RetryMetrics:
+    """
+    Counters of the retry middleware
+    """
+
+    requests: int = 0
+    """Amount of handled requests"""
+    retries: int = 0
+    """Amount of retried attempts"""
+    flood_waits: int = 0
+    """Amount of received flood wait errors"""
+    server_errors: int = 0
+    """Amount of received server errors"""
+    network_errors: int = 0
+    """Amount of received network errors"""
+    exhausted: int = 0
+    """Amount of requests failed because of exhausted attempts or budget"""
+    waited: float = 0.0
+    """Total time spent in waiting for blocked scopes (in seconds)"""
+
+
+class RetryBudget:
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0) -> None:
+        """
+        Limits the share of retries to avoid retry storms when Telegram is unavailable
+
+        Each request deposits :code:`ratio` tokens and each retry withdraws one token,
+        so no more than :code:`capacity` retries can be made in a row.
+
+        :param ratio: amount of retries allowed per request
+        :param capacity: maximum amount of stored tokens
+        """
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def deposit(self) -> None:
+        self.tokens = min(self.tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RetryMiddleware(BaseRequestMiddleware):
+    def __init__(
+        self,
+        storage: Optional[BaseBlockStorage] = None,
+        max_retries: int = 3,
+        max_retry_after: Optional[float] = 60.0,
+        backoff_config: BackoffConfig = DEFAULT_BACKOFF_CONFIG,
+        budget: Optional[RetryBudget] = None,
+        retry_network_errors: bool = False,
+        ignore_methods: Optional[List[Type[TelegramMethod[Any]]]] = None,
+    ) -> None:
+        """
+        Middleware that retries requests failed with flood wait or server errors
+
+        Flood wait blocks the chat of the request (or the whole bot for the requests
+        without chat) in the shared table, so all the queued requests to this scope wait
+        once instead of hitting the limit again.
+        Server errors are retried with exponential backoff,
+        the restarting Telegram server blocks the whole bot.
+
+        :param storage: "blocked until" table, in-memory storage is used by default
+        :param max_retries: maximum amount of retries for each request
+        :param max_retry_after: flood waits longer than this value (in seconds)
+            are raised immediately, :code:`None` means no limit
+        :param backoff_config: backoff config for server errors
+        :param budget: retry budget shared by all requests, by default is not limited
+        :param retry_network_errors: retry network errors too,
+            disabled by default because the request may already have been processed
+        :param ignore_methods: methods that should not be retried
+        """
+        self.storage = storage or MemoryBlockStorage()
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.backoff_config = backoff_config
+        self.budget = budget
+        self.retry_network_errors = retry_network_errors
+        self.ignore_methods = ignore_methods if ignore_methods else []
+        self.metrics = RetryMetrics()
+
+    @classmethod
+    def get_keys(cls, bot: Bot, method: TelegramMethod[Any]) -> List[str]:
+        """
+        Get keys of the scopes affected by the method, the bot scope goes first
+        """
+        keys = [str(bot.id)]
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is not None:
+            keys.append(f"{bot.id}:chat:{chat_id}")
+        return keys
+
+    async def wait(self, keys: List[str]) -> None:
+        """
+        Wait until all the scopes are unblocked
+        """
+        while (delay := await self.storage.get_delay(*keys)) > 0:
+            self.metrics.waited += delay
+            await asyncio.sleep(delay)
+
+    def _can_retry(self, attempt: int) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if self.budget is not None and not self.budget.withdraw():
+            return False
+        return True
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if type(method) in self.ignore_methods:
+            return await make_request(bot, method)
+
+        self.metrics.requests += 1
+        if self.budget is not None:
+            self.budget.deposit()
+
+        keys = self.get_keys(bot=bot, method=method)
+        backoff = Backoff(config=self.backoff_config)
+        attempt = 0
+        while True:
+            await self.wait(keys)
+            # Flood waits and restarts are awaited through the table on the next attempt
+            delay = 0.0
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                self.metrics.flood_waits += 1
+                if self.max_retry_after is not None and e.retry_after > self.max_retry_after:
+                    raise
+                # Flood wait is applied to the chat when request is sent to the chat
+                await self.storage.block(keys[-1], e.retry_after)
+                error: Exception = e
+            except TelegramServerError as e:
+                self.metrics.server_errors += 1
+                if isinstance(e, RestartingTelegram):
+                    await self.storage.block(keys[0], next(backoff))
+                else:
+                    delay = next(backoff)
+                error = e
+            except TelegramNetworkError as e:
+                self.metrics.network_errors += 1
+                if not self.retry_network_errors:
+                    raise
+                delay = next(backoff)
+                error = e
+
+            if not self._can_retry(attempt):
+                self.metrics.exhausted += 1
+                raise error
+            attempt += 1
+            self.metrics.retries += 1
+            loggers.middlewares.warning(
+                "Method %r failed with %s: %s (bot id=%d). Retry attempt %d of %d",
+                type(method).__name__,
+                type(error).__name__,
+                error,
+                bot.id,
+                attempt,
+                self.max_retries,
+            )
+            if delay:
+                await asyncio.sleep(delay)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, Optional, Type
+
+from aiogram import loggers
+from aiogram.methods import (
+    GetChat,
+    GetChatAdministrators,
+    GetChatMember,
+    GetChatMemberCount,
+    GetFile,
+    GetMe,
+    Response,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from ...bot import Bot
+
+DEFAULT_IDEMPOTENT_METHODS: FrozenSet[Type[TelegramMethod[Any]]] = frozenset(
+    {
+        GetChat,
+        GetChatAdministrators,
+        GetChatMember,
+        GetChatMemberCount,
+        GetFile,
+        GetMe,
+    }
+)
+
+
+def make_method_key(bot: Bot, method: TelegramMethod[Any]) -> str:
+    """
+    Build the key of the method call, identical calls of the same bot have the same key
+
+    :param bot: bot instance
+    :param method: method instance
+    """
+    return f"{bot.id}:{method.__api_method__}:{method.model_dump_json()}"
+
+
+class SingleFlight(BaseRequestMiddleware):
+    def __init__(self, methods: Optional[Iterable[Type[TelegramMethod[Any]]]] = None) -> None:
+        """
+        Middleware that coalesces identical concurrent calls of idempotent methods
+
+        Only the first call (leader) makes the request,
+        the rest of identical calls made while the request is in flight
+        await the result (or the error) of the leader.
+
+        :param methods: idempotent methods that can be coalesced,
+            by default :code:`getChat`, :code:`getChatAdministrators`, :code:`getChatMember`,
+            :code:`getChatMemberCount`, :code:`getFile` and :code:`getMe`
+        """
+        self.methods = frozenset(methods) if methods is not None else DEFAULT_IDEMPOTENT_METHODS
+        self.coalesced = 0
+        self._in_flight: Dict[Any, asyncio.Future[Response[Any]]] = {}
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if type(method) not in self.methods:
+            return await make_request(bot, method)
+
+        # Result mode changes the content of the response, so it is a part of the key
+        key = (make_method_key(bot=bot, method=method), method._result_mode)
+        while (future := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+            loggers.middlewares.debug(
+                "Method %r is coalesced with the request in flight (bot id=%d)",
+                type(method).__name__,
+                bot.id,
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader is cancelled, so the next call becomes the leader
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await make_request(bot, method)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark exception as retrieved when there are no followers
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._in_flight[key]
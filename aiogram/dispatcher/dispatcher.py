@@ -10,7 +10,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Union
 
 from .. import loggers
 from ..client.bot import Bot
-from ..exceptions import TelegramAPIError
+from ..exceptions import CircuitBreakerOpen, TelegramAPIError
 from ..fsm.middleware import FSMContextMiddleware
 from ..fsm.storage.base import BaseEventIsolation, BaseStorage
 from ..fsm.storage.memory import DisabledEventIsolation, MemoryStorage
@@ -43,6 +43,7 @@ class Dispatcher(Router):
         events_isolation: Optional[BaseEventIsolation] = None,
         disable_fsm: bool = False,
         name: Optional[str] = None,
+        concurrent_lifecycle: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -53,9 +54,11 @@ class Dispatcher(Router):
         :param events_isolation: Events isolation
         :param disable_fsm: Disable FSM, note that if you disable FSM
             then you should not use storage and events isolation
+        :param concurrent_lifecycle: Emit startup and shutdown events in the included routers
+            concurrently
         :param kwargs: Other arguments, will be passed as keyword arguments to handlers
         """
-        super(Dispatcher, self).__init__(name=name)
+        super(Dispatcher, self).__init__(name=name, concurrent_lifecycle=concurrent_lifecycle)
 
         if storage and not isinstance(storage, BaseStorage):
             raise TypeError(
@@ -203,7 +206,7 @@ class Dispatcher(Router):
         """
         backoff = Backoff(config=backoff_config)
         get_updates = GetUpdates(timeout=polling_timeout, allowed_updates=allowed_updates)
-        kwargs = {}
+        kwargs: Dict[str, Any] = {}
         if bot.session.timeout:
             # Request timeout can be lower than session timeout and that's OK.
             # To prevent false-positive TimeoutError we should wait longer than polling timeout
@@ -212,6 +215,18 @@ class Dispatcher(Router):
         while True:
             try:
                 updates = await bot(get_updates, **kwargs)
+            except CircuitBreakerOpen as e:
+                failed = True
+                # Bot API server is known to be unavailable, so there is no reason to retry sooner
+                delay = max(e.retry_after, backoff.min_delay)
+                loggers.dispatcher.warning(
+                    "Bot API server is unavailable, sleep for %f seconds and try again... "
+                    "(bot id = %d)",
+                    delay,
+                    bot.id,
+                )
+                await asyncio.sleep(delay)
+                continue
             except Exception as e:
                 failed = True
                 # In cases when Telegram Bot API was inaccessible don't need to stop polling
@@ -523,6 +538,7 @@ class Dispatcher(Router):
             if "bot" in workflow_data:
                 workflow_data.pop("bot")
 
+            await asyncio.gather(*(bot.session.warm_up() for bot in bots))
             await self.emit_startup(bot=bots[-1], **workflow_data)
             loggers.dispatcher.info("Start polling")
             try:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Callable, List
 
+from ... import loggers
 from .handler import CallbackType, HandlerObject
 
 
@@ -38,8 +40,15 @@ class EventObserver:
         Propagate event to handlers.
         Handler will be called when all its filters is pass.
         """
+        loop = asyncio.get_running_loop()
         for handler in self.handlers:
+            start_time = loop.time()
             await handler.call(*args, **kwargs)
+            loggers.dispatcher.debug(
+                "Callback %s is finished. Duration %d ms",
+                getattr(handler.callback, "__qualname__", handler.callback),
+                (loop.time() - start_time) * 1000,
+            )
 
     def __call__(self) -> Callable[[CallbackType], CallbackType]:
         """
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Final, Generator, List, Optional, Set
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Final,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 
 from ..types import TelegramObject
 from .event.bases import REJECTED, UNHANDLED
 from .event.event import EventObserver
 from .event.telegram import TelegramEventObserver
 
+if TYPE_CHECKING:
+    from ..client.bot import Bot
+
 INTERNAL_UPDATE_TYPES: Final[frozenset[str]] = frozenset({"update", "error"})
 
 
@@ -21,15 +36,33 @@ class Router:
     - By decorator - :obj:`@router.<event_type>(<filters, ...>)`
     """
 
-    def __init__(self, *, name: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        bot_ids: Optional[Iterable[int]] = None,
+        concurrent_lifecycle: bool = False,
+    ) -> None:
         """
         :param name: Optional router name, can be useful for debugging
+        :param bot_ids: Optional set of bot ids this router is attached to,
+            updates received by any other bot will skip this router and all its sub-routers
+        :param concurrent_lifecycle: Emit startup and shutdown events in the sub-routers
+            concurrently instead of one by one
         """
 
         self.name = name or hex(id(self))
+        self.concurrent_lifecycle = concurrent_lifecycle
+        self._bot_ids: Optional[FrozenSet[int]] = (
+            frozenset(bot_ids) if bot_ids is not None else None
+        )
 
         self._parent_router: Optional[Router] = None
         self.sub_routers: List[Router] = []
+        # Sub-routers resolved per bot id, is used only when some of the sub-routers
+        # are attached to specific bots
+        self._bot_sub_routers: Dict[Optional[int], List[Router]] = {}
+        self._has_bot_sub_routers = False
 
         # Observers
         self.message = TelegramEventObserver(router=self, event_name="message")
@@ -108,6 +141,41 @@ class Router:
     def __repr__(self) -> str:
         return f"<{self}>"
 
+    @property
+    def bot_ids(self) -> Optional[FrozenSet[int]]:
+        """
+        Bot ids this router is attached to, :code:`None` means that router handles updates
+        from any bot
+        """
+        return self._bot_ids
+
+    def resolve_sub_routers(self, bot: Optional[Bot] = None) -> List[Router]:
+        """
+        Resolve sub-routers that should receive updates from the specified bot
+
+        Result is cached per bot id, so the lookup does not depend on the number
+        of the sub-routers attached to other bots.
+
+        :param bot: bot instance, when not specified only routers
+            that is not attached to any bot is returned
+        :return: list of sub-routers
+        """
+        if not self._has_bot_sub_routers:
+            return self.sub_routers
+
+        bot_id = bot.id if bot is not None else None
+        try:
+            return self._bot_sub_routers[bot_id]
+        except KeyError:
+            pass
+
+        routers = self._bot_sub_routers[bot_id] = [
+            router
+            for router in self.sub_routers
+            if router.bot_ids is None or bot_id in router.bot_ids
+        ]
+        return routers
+
     def resolve_used_update_types(self, skip_events: Optional[Set[str]] = None) -> List[str]:
         """
         Resolve registered event names
@@ -166,7 +234,7 @@ class Router:
             if response is not UNHANDLED:
                 return response
 
-        for router in self.sub_routers:
+        for router in self.resolve_sub_routers(kwargs.get("bot")):
             response = await router.propagate_event(update_type=update_type, event=event, **kwargs)
             if response is not UNHANDLED:
                 break
@@ -217,6 +285,9 @@ class Router:
 
         self._parent_router = router
         router.sub_routers.append(self)
+        router._bot_sub_routers.clear()
+        if self._bot_ids is not None:
+            router._has_bot_sub_routers = True
 
     def include_routers(self, *routers: Router) -> None:
         """
@@ -244,18 +315,36 @@ class Router:
         router.parent_router = self
         return router
 
+    async def _emit_sub_routers(self, event_name: str, *args: Any, **kwargs: Any) -> None:
+        if not self.concurrent_lifecycle:
+            for router in self.sub_routers:
+                await getattr(router, event_name)(*args, **kwargs)
+            return
+
+        # Sub-routers do not depend on each other, so they are emitted concurrently
+        # but each of them is awaited until the end before raising the first error
+        results = await asyncio.gather(
+            *(getattr(router, event_name)(*args, **kwargs) for router in self.sub_routers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     async def emit_startup(self, *args: Any, **kwargs: Any) -> None:
         """
         Recursively call startup callbacks
 
+        Startup callbacks of the router are always called before the callbacks
+        of its sub-routers, so the nested routers can depend on the parent router.
+
         :param args:
         :param kwargs:
         :return:
         """
         kwargs.update(router=self)
         await self.startup.trigger(*args, **kwargs)
-        for router in self.sub_routers:
-            await router.emit_startup(*args, **kwargs)
+        await self._emit_sub_routers("emit_startup", *args, **kwargs)
 
     async def emit_shutdown(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -267,5 +356,4 @@ class Router:
         """
         kwargs.update(router=self)
         await self.shutdown.trigger(*args, **kwargs)
-        for router in self.sub_routers:
-            await router.emit_shutdown(*args, **kwargs)
+        await self._emit_sub_routers("emit_shutdown", *args, **kwargs)
@@ -79,6 +79,35 @@ class TelegramNetworkError(TelegramAPIError):
     label = "HTTP Client says"
 
 
+class TelegramConnectionError(TelegramNetworkError):
+    """
+    Exception raised when connection to the Bot API server can't be established,
+    so the request is not sent.
+    """
+
+
+class TelegramResponseTooLarge(TelegramNetworkError):
+    """
+    Exception raised when the response is larger than the limit of the session.
+    """
+
+
+class CircuitBreakerOpen(TelegramNetworkError):
+    """
+    Exception raised when the request is rejected by the circuit breaker
+    because the Bot API server is unavailable.
+    """
+
+    def __init__(
+        self,
+        method: TelegramMethod[TelegramType],
+        message: str,
+        retry_after: float,
+    ) -> None:
+        super().__init__(method=method, message=message)
+        self.retry_after = retry_after
+
+
 class TelegramRetryAfter(TelegramAPIError):
     """
     Exception raised when flood control exceeds.
@@ -7,7 +7,7 @@ from .answer_web_app_query import AnswerWebAppQuery
 from .approve_chat_join_request import ApproveChatJoinRequest
 from .ban_chat_member import BanChatMember
 from .ban_chat_sender_chat import BanChatSenderChat
-from .base import Request, Response, TelegramMethod
+from .base import Lane, LazyResult, Request, Response, ResultMode, TelegramMethod
 from .close import Close
 from .close_forum_topic import CloseForumTopic
 from .close_general_forum_topic import CloseGeneralForumTopic
@@ -191,6 +191,8 @@ __all__ = (
     "GetUserProfilePhotos",
     "GetWebhookInfo",
     "HideGeneralForumTopic",
+    "Lane",
+    "LazyResult",
     "LeaveChat",
     "LogOut",
     "PinChatMessage",
@@ -202,6 +204,7 @@ __all__ = (
     "Request",
     "Response",
     "RestrictChatMember",
+    "ResultMode",
     "RevokeChatInviteLink",
     "SendAnimation",
     "SendAudio",
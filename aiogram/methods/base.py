@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,11 +10,13 @@ from typing import (
     Generator,
     Generic,
     Optional,
+    Type,
     TypeVar,
 )
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from pydantic.functional_validators import model_validator
+from typing_extensions import Self
 
 from aiogram.client.context_controller import BotContextController
 
@@ -22,6 +25,7 @@ from ..types.base import UNSET_TYPE
 
 if TYPE_CHECKING:
     from ..client.bot import Bot
+    from ..client.prepared import PreparedMethod
 
 TelegramType = TypeVar("TelegramType", bound=Any)
 
@@ -43,6 +47,76 @@ class Response(BaseModel, Generic[TelegramType]):
     parameters: Optional[ResponseParameters] = None
 
 
+class ResultMode(str, Enum):
+    """
+    Defines how the result of the API call is parsed
+    """
+
+    FULL = "full"
+    """Result is validated into the aiogram types (default)"""
+    LAZY = "lazy"
+    """Result is returned as :class:`LazyResult` that is validated only when accessed"""
+    SKIP = "skip"
+    """Result is not validated at all and :code:`None` is returned"""
+
+
+class Lane(str, Enum):
+    """
+    Traffic class of the request, each configured lane has its own connections pool
+    """
+
+    LONG_POLL = "long_poll"
+    """Long polling :code:`getUpdates` requests"""
+    INTERACTIVE = "interactive"
+    """Regular API calls, the default lane"""
+    BULK = "bulk"
+    """Mass mailings and other background jobs"""
+    FILE = "file"
+    """File uploads and downloads"""
+
+
+class LazyResult(Generic[TelegramType]):
+    """
+    Result of the API call that is validated only when accessed
+
+    Validated value is available via :attr:`value` property,
+    attributes of the value can be also accessed directly from this object.
+    """
+
+    __slots__ = ("raw", "_response_type", "_bot", "_value", "_resolved")
+
+    def __init__(
+        self,
+        response_type: Type[Response[TelegramType]],
+        raw: Any,
+        bot: Optional[Bot] = None,
+    ) -> None:
+        self.raw = raw
+        self._response_type = response_type
+        self._bot = bot
+        self._value: Optional[TelegramType] = None
+        self._resolved = False
+
+    @property
+    def value(self) -> TelegramType:
+        """
+        Validated result, validation is made only once at first access
+        """
+        if not self._resolved:
+            response = self._response_type.model_validate(
+                {"ok": True, "result": self.raw}, context={"bot": self._bot}
+            )
+            self._value = response.result
+            self._resolved = True
+        return self._value  # type: ignore[return-value]
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.value, item)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} raw={self.raw!r}>"
+
+
 class TelegramMethod(BotContextController, BaseModel, Generic[TelegramType], ABC):
     model_config = ConfigDict(
         extra="allow",
@@ -50,6 +124,11 @@ class TelegramMethod(BotContextController, BaseModel, Generic[TelegramType], ABC
         arbitrary_types_allowed=False,
     )
 
+    _result_mode: Optional[ResultMode] = PrivateAttr(default=None)
+    _priority: Optional[int] = PrivateAttr(default=None)
+    _lane: Optional[Lane] = PrivateAttr(default=None)
+    _prepared: Optional[PreparedMethod[Any]] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def remove_unset(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -80,6 +159,66 @@ class TelegramMethod(BotContextController, BaseModel, Generic[TelegramType], ABC
         def __api_method__(self) -> str:
             pass
 
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        prepared = self._prepared
+        if prepared is not None:
+            # Serialized template is valid only while the other fields are not changed
+            if update and not update.keys() <= set(prepared.fields):
+                prepared = None
+            copied._prepared = prepared
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith("_"):
+            return
+        prepared = self._prepared
+        if prepared is not None and name not in prepared.fields:
+            self._prepared = None
+
+    def with_result_mode(self, mode: ResultMode) -> Self:
+        """
+        Set how the result of this method call should be parsed
+
+        Is useful for fire-and-forget calls when the result is not needed:
+        :code:`await message.answer("Hello").with_result_mode(ResultMode.SKIP)`
+
+        :param mode: result mode
+        :return: self
+        """
+        self._result_mode = mode
+        return self
+
+    def with_priority(self, priority: int) -> Self:
+        """
+        Set scheduling priority of this method call, lower value is sent sooner
+
+        Is used by :class:`aiogram.client.session.middlewares.priority.PriorityScheduler`
+        when the requests are queued:
+        :code:`await bot(SendMessage(...).with_priority(Priority.LOW))`
+
+        :param priority: priority of the call
+        :return: self
+        """
+        self._priority = priority
+        return self
+
+    def with_lane(self, lane: Lane) -> Self:
+        """
+        Set traffic class of this method call
+
+        Is used by :class:`aiogram.client.session.aiohttp.AiohttpSession`
+        to choose the connections pool, so the bulk calls do not compete
+        with the interactive calls of the same method:
+        :code:`await bot(SendMessage(...).with_lane(Lane.BULK))`
+
+        :param lane: traffic class of the call
+        :return: self
+        """
+        self._lane = lane
+        return self
+
     async def emit(self, bot: Bot) -> TelegramType:
         return await bot(self)
 
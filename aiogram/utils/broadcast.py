@@ -0,0 +1,417 @@
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from aiogram import Bot
+from aiogram.client.prepared import PreparedMethod
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramMigrateToChat,
+    TelegramNetworkError,
+    TelegramNotFound,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods import Lane, TelegramMethod
+from aiogram.utils.backoff import Backoff, BackoffConfig
+
+logger = logging.getLogger(__name__)
+
+ChatId = Union[int, str]
+MessageFactory = Callable[[ChatId], TelegramMethod[Any]]
+
+DEFAULT_RATE = 25.0
+DEFAULT_BACKOFF_CONFIG = BackoffConfig(min_delay=1.0, max_delay=30.0, factor=2.0, jitter=0.1)
+
+
+class BaseBroadcastStorage(ABC):
+    """
+    Base class for storages of the broadcast progress
+    """
+
+    @abstractmethod
+    async def get_offset(self, job_id: str) -> int:
+        """
+        Get amount of the chats processed by the job
+
+        :param job_id: id of the broadcast job
+        """
+        pass
+
+    @abstractmethod
+    async def set_offset(self, job_id: str, offset: int) -> None:
+        """
+        Save amount of the chats processed by the job
+
+        :param job_id: id of the broadcast job
+        :param offset: amount of the processed chats
+        """
+        pass
+
+    async def close(self) -> None:  # pragma: no cover
+        """
+        Close storage (database connection, file or etc.)
+        """
+        pass
+
+
+class MemoryBroadcastStorage(BaseBroadcastStorage):
+    """
+    In-memory progress storage, is used by default.
+
+    Progress is lost on restart, use :class:`FileBroadcastStorage`
+    or your own storage to resume the jobs after restart
+    """
+
+    def __init__(self) -> None:
+        self._offsets: Dict[str, int] = {}
+
+    async def get_offset(self, job_id: str) -> int:
+        return self._offsets.get(job_id, 0)
+
+    async def set_offset(self, job_id: str, offset: int) -> None:
+        self._offsets[job_id] = offset
+
+
+class FileBroadcastStorage(BaseBroadcastStorage):
+    """
+    Progress storage based on the JSON file
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        :param path: path of the file, it is created when needed
+        """
+        self.path = Path(path)
+
+    def _read(self) -> Dict[str, int]:
+        if not self.path.exists():
+            return {}
+        offsets: Dict[str, int] = json.loads(self.path.read_text())
+        return offsets
+
+    async def get_offset(self, job_id: str) -> int:
+        return self._read().get(job_id, 0)
+
+    async def set_offset(self, job_id: str, offset: int) -> None:
+        offsets = self._read()
+        offsets[job_id] = offset
+        # File is replaced at once, so the progress is not lost when the process is killed
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(offsets))
+        tmp_path.replace(self.path)
+
+
+class DeliveryStatus(str, Enum):
+    """
+    Result of the delivery to the chat
+    """
+
+    SENT = "sent"
+    """Message is sent"""
+    BLOCKED = "blocked"
+    """Bot is blocked by the user, the account is deactivated or the bot is kicked from the chat"""
+    INVALID = "invalid"
+    """Chat is not found or the request is rejected by Telegram"""
+    FAILED = "failed"
+    """Request is failed after all the retries"""
+
+
+@dataclass(frozen=True)
+class DeliveryResult:
+    """
+    Result of the delivery to the chat
+    """
+
+    chat_id: ChatId
+    """Target chat id"""
+    status: DeliveryStatus
+    """Delivery status"""
+    result: Any = None
+    """Result of the request"""
+    error: Optional[TelegramAPIError] = None
+    """Error of the failed request"""
+
+
+@dataclass
+class BroadcastStats:
+    """
+    Live statistics of the broadcast
+    """
+
+    skipped: int = 0
+    """Amount of chats processed before the job was resumed"""
+    processed: int = 0
+    """Amount of chats processed by this run"""
+    sent: int = 0
+    """Amount of sent messages"""
+    blocked: int = 0
+    """Amount of chats that blocked the bot"""
+    invalid: int = 0
+    """Amount of invalid chats"""
+    failed: int = 0
+    """Amount of failed deliveries"""
+    retries: int = 0
+    """Amount of retried requests"""
+    flood_waits: int = 0
+    """Amount of flood control errors"""
+    started_at: float = field(default_factory=time.monotonic)
+    """Monotonic time when the run was started"""
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Time (in seconds) since the run was started
+        """
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """
+        Amount of processed chats per second
+        """
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+
+class Broadcast:
+    def __init__(
+        self,
+        bot: Bot,
+        chat_ids: Union[Iterable[ChatId], AsyncIterable[ChatId]],
+        message: Union[TelegramMethod[Any], MessageFactory],
+        *,
+        job_id: str = "broadcast",
+        storage: Optional[BaseBroadcastStorage] = None,
+        rate: float = DEFAULT_RATE,
+        concurrency: int = 10,
+        max_retries: int = 3,
+        backoff_config: BackoffConfig = DEFAULT_BACKOFF_CONFIG,
+        checkpoint_every: int = 100,
+        on_result: Optional[Callable[[DeliveryResult], Awaitable[Any]]] = None,
+        lane: Optional[Lane] = Lane.BULK,
+    ) -> None:
+        """
+        Mass delivery of the message to many chats
+
+        Messages are sent at the limited rate with bounded concurrency,
+        flood control errors pause the whole broadcast,
+        network and server errors are retried with backoff.
+        Progress is saved to the storage, so the job with the same id continues
+        from the last checkpoint after restart.
+
+        :param bot: bot instance
+        :param chat_ids: target chats, iterable or async iterable,
+            the order should be the same when the job is resumed
+        :param message: method to be sent to each chat (:code:`chat_id` is replaced)
+            or callable that makes the method for the chat id
+        :param job_id: id of the job in the progress storage
+        :param storage: progress storage, in-memory storage is used by default
+        :param rate: maximum amount of messages per second
+        :param concurrency: maximum amount of concurrent requests
+        :param max_retries: maximum amount of retries of network and server errors
+        :param backoff_config: delays between the retries
+        :param checkpoint_every: save progress after this amount of processed chats
+        :param on_result: callback called with the result of each delivery
+        :param lane: traffic class of the messages, so the broadcast does not compete
+            with the interactive calls for connections when the lane is configured in the session
+        """
+        self.bot = bot
+        self.chat_ids = chat_ids
+        self.message = message
+        self.job_id = job_id
+        self.storage = storage or MemoryBroadcastStorage()
+        self.rate = rate
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_config = backoff_config
+        self.checkpoint_every = checkpoint_every
+        self.on_result = on_result
+        self.lane = lane
+        self.stats = BroadcastStats()
+
+        self._prepared: Optional[PreparedMethod[Any]] = None
+        if isinstance(message, TelegramMethod):
+            try:
+                self._prepared = PreparedMethod(message, bot=bot)
+            except ValueError:
+                # Templates with files to upload are copied for each chat
+                pass
+        self._next_send_at = 0.0
+        self._offset = 0
+        self._finished: Set[int] = set()
+
+    def make_method(self, chat_id: ChatId) -> TelegramMethod[Any]:
+        """
+        Make method for the chat
+
+        :param chat_id: target chat id
+        """
+        method: TelegramMethod[Any]
+        if self._prepared is not None:
+            method = self._prepared(chat_id=chat_id)
+        elif isinstance(self.message, TelegramMethod):
+            method = self.message.model_copy(update={"chat_id": chat_id})
+        else:
+            method = self.message(chat_id)
+        if self.lane is not None:
+            method.with_lane(self.lane)
+        return method
+
+    async def _iter_chat_ids(self) -> AsyncIterator[ChatId]:
+        if isinstance(self.chat_ids, AsyncIterable):
+            async for chat_id in self.chat_ids:
+                yield chat_id
+        else:
+            for chat_id in self.chat_ids:
+                yield chat_id
+
+    async def _wait_turn(self) -> None:
+        # Each request reserves the next slot, so the requests are spread evenly in time
+        now = time.monotonic()
+        send_at = max(self._next_send_at, now)
+        self._next_send_at = send_at + 1 / self.rate
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    def _pause(self, delay: float) -> None:
+        self._next_send_at = max(self._next_send_at, time.monotonic() + delay)
+
+    async def deliver(self, chat_id: ChatId) -> DeliveryResult:
+        """
+        Deliver the message to the chat with retries
+
+        :param chat_id: target chat id
+        """
+        method = self.make_method(chat_id)
+        backoff = Backoff(config=self.backoff_config)
+        retries = 0
+        while True:
+            await self._wait_turn()
+            try:
+                result = await self.bot(method)
+            except TelegramRetryAfter as e:
+                self.stats.flood_waits += 1
+                logger.warning(
+                    "Broadcast %r is paused for %d seconds by flood control",
+                    self.job_id,
+                    e.retry_after,
+                )
+                self._pause(e.retry_after)
+                continue
+            except TelegramMigrateToChat as e:
+                method = method.model_copy(update={"chat_id": e.migrate_to_chat_id})
+                continue
+            except TelegramForbiddenError as e:
+                return DeliveryResult(chat_id=chat_id, status=DeliveryStatus.BLOCKED, error=e)
+            except (TelegramBadRequest, TelegramNotFound) as e:
+                return DeliveryResult(chat_id=chat_id, status=DeliveryStatus.INVALID, error=e)
+            except (TelegramNetworkError, TelegramServerError) as e:
+                if retries >= self.max_retries:
+                    return DeliveryResult(chat_id=chat_id, status=DeliveryStatus.FAILED, error=e)
+                retries += 1
+                self.stats.retries += 1
+                await backoff.asleep()
+                continue
+            except TelegramAPIError as e:
+                return DeliveryResult(chat_id=chat_id, status=DeliveryStatus.FAILED, error=e)
+            return DeliveryResult(chat_id=chat_id, status=DeliveryStatus.SENT, result=result)
+
+    async def _process(self, index: int, chat_id: ChatId) -> None:
+        result = await self.deliver(chat_id)
+        self.stats.processed += 1
+        if result.status is DeliveryStatus.SENT:
+            self.stats.sent += 1
+        elif result.status is DeliveryStatus.BLOCKED:
+            self.stats.blocked += 1
+        elif result.status is DeliveryStatus.INVALID:
+            self.stats.invalid += 1
+        else:
+            self.stats.failed += 1
+        if self.on_result is not None:
+            await self.on_result(result)
+
+        # Checkpoint is the amount of chats processed without gaps,
+        # since the chats are processed concurrently
+        self._finished.add(index)
+        offset = self._offset
+        while offset in self._finished:
+            self._finished.remove(offset)
+            offset += 1
+        checkpoint = offset // self.checkpoint_every > self._offset // self.checkpoint_every
+        self._offset = offset
+        if checkpoint:
+            await self.storage.set_offset(self.job_id, offset)
+
+    async def run(self) -> BroadcastStats:
+        """
+        Run the broadcast until all the chats are processed
+
+        :return: statistics of the run
+        """
+        self._offset = await self.storage.get_offset(self.job_id)
+        self._finished = set()
+        self.stats = BroadcastStats(skipped=self._offset)
+        logger.info("Broadcast %r is started from offset %d", self.job_id, self._offset)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: Set["asyncio.Task[None]"] = set()
+        errors: List[BaseException] = []
+
+        def on_done(task: "asyncio.Task[None]") -> None:
+            tasks.discard(task)
+            semaphore.release()
+            if not task.cancelled() and (error := task.exception()) is not None:
+                errors.append(error)
+
+        try:
+            index = 0
+            async for chat_id in self._iter_chat_ids():
+                if index >= self.stats.skipped:
+                    await semaphore.acquire()
+                    # Unexpected errors stop the broadcast without waiting for the rest chats
+                    if errors:
+                        raise errors[0]
+                    task = asyncio.create_task(self._process(index, chat_id))
+                    tasks.add(task)
+                    task.add_done_callback(on_done)
+                index += 1
+            if tasks:
+                await asyncio.wait(set(tasks))
+            if errors:
+                raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await self.storage.set_offset(self.job_id, self._offset)
+
+        logger.info(
+            "Broadcast %r is finished: %d sent, %d blocked, %d invalid, %d failed in %.1f seconds",
+            self.job_id,
+            self.stats.sent,
+            self.stats.blocked,
+            self.stats.invalid,
+            self.stats.failed,
+            self.stats.elapsed,
+        )
+        return self.stats
@@ -0,0 +1,412 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+from aiogram import Bot, Dispatcher
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+from aiogram.methods import ApproveChatJoinRequest, DeclineChatJoinRequest
+from aiogram.types import ChatJoinRequest
+
+logger = logging.getLogger(__name__)
+
+JoinRequestKey = Tuple[int, int, int]
+JoinRequestPolicy = Callable[[List[ChatJoinRequest]], Awaitable[Sequence[Optional[bool]]]]
+
+DEFAULT_RATE = 20.0
+
+
+class JoinRequestDecision(str, Enum):
+    """
+    Decision about the chat join request
+    """
+
+    APPROVE = "approve"
+    DECLINE = "decline"
+
+
+@dataclass(frozen=True)
+class JoinRequestResult:
+    """
+    Result of the processed chat join request
+    """
+
+    chat_id: int
+    """Chat id"""
+    user_id: int
+    """Id of the user that sent the request"""
+    decision: JoinRequestDecision
+    """Decision about the request"""
+    error: Optional[TelegramAPIError] = None
+    """Error of the failed request"""
+
+
+@dataclass
+class JoinRequestStats:
+    """
+    Live statistics of the processor
+    """
+
+    queued: int = 0
+    """Amount of queued requests"""
+    duplicates: int = 0
+    """Amount of repeated requests that are already queued"""
+    approved: int = 0
+    """Amount of approved requests"""
+    declined: int = 0
+    """Amount of declined requests"""
+    skipped: int = 0
+    """Amount of requests left undecided by the policy"""
+    failed: int = 0
+    """Amount of failed requests"""
+    flood_waits: int = 0
+    """Amount of flood control errors"""
+    started_at: float = field(default_factory=time.monotonic)
+    """Monotonic time when the processor was started"""
+
+    @property
+    def processed(self) -> int:
+        """
+        Amount of processed requests
+        """
+        return self.approved + self.declined + self.skipped + self.failed
+
+    @property
+    def pending(self) -> int:
+        """
+        Amount of requests waiting to be processed
+        """
+        return self.queued - self.processed
+
+    @property
+    def throughput(self) -> float:
+        """
+        Amount of processed requests per second
+        """
+        elapsed = time.monotonic() - self.started_at
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class _PendingRequest:
+    bot: Bot
+    request: ChatJoinRequest
+    decision: Optional[JoinRequestDecision] = None
+
+
+class JoinRequestProcessor:
+    def __init__(
+        self,
+        *,
+        rate: float = DEFAULT_RATE,
+        concurrency: int = 5,
+        policy: Optional[JoinRequestPolicy] = None,
+        batch_size: int = 100,
+        batch_window: float = 1.0,
+        on_result: Optional[Callable[[JoinRequestResult], Awaitable[Any]]] = None,
+    ) -> None:
+        """
+        Bulk processor of the chat join requests
+
+        Handlers queue the decisions and return at once, the requests are approved
+        and declined in background at the limited rate with bounded concurrency,
+        flood control errors pause the whole processor.
+        Repeated requests of the same user to the same chat are processed once.
+
+        :param rate: maximum amount of requests per second
+        :param concurrency: maximum amount of concurrent requests
+        :param policy: async callable that decides about the batch of requests
+            queued via :meth:`submit`, returns :code:`True` to approve the request,
+            :code:`False` to decline it and :code:`None` to leave it undecided
+        :param batch_size: maximum amount of requests passed to the policy at once
+        :param batch_window: time (in seconds) the requests are collected for the policy
+        :param on_result: callback called with the result of each processed request
+        """
+        self.rate = rate
+        self.concurrency = concurrency
+        self.policy = policy
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.on_result = on_result
+        self.stats = JoinRequestStats()
+
+        self._pending: Dict[JoinRequestKey, _PendingRequest] = {}
+        # Queues are created when the processor is started, so they are bound to the running loop
+        self._queue: Optional["asyncio.Queue[JoinRequestKey]"] = None
+        self._undecided: Optional["asyncio.Queue[JoinRequestKey]"] = None
+        self._empty: Optional[asyncio.Event] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._next_send_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        """
+        Processor is started
+        """
+        return bool(self._tasks)
+
+    def _enqueue(self, key: JoinRequestKey) -> None:
+        if self._queue is None or self._undecided is None:
+            return
+        if self._pending[key].decision is None:
+            self._undecided.put_nowait(key)
+        else:
+            self._queue.put_nowait(key)
+
+    def _add(
+        self,
+        request: ChatJoinRequest,
+        decision: Optional[JoinRequestDecision],
+        bot: Optional[Bot],
+    ) -> None:
+        bot = bot or request.bot
+        if bot is None:
+            raise RuntimeError(
+                "Chat join request is not mounted to a bot instance, pass the bot explicitly"
+            )
+        key = (bot.id, request.chat.id, request.from_user.id)
+        item = self._pending.get(key)
+        if item is not None:
+            self.stats.duplicates += 1
+            if item.decision is None and decision is not None:
+                # Explicit decision is preferred to the policy
+                item.decision = decision
+                self._enqueue(key)
+            return
+
+        self.stats.queued += 1
+        self._pending[key] = _PendingRequest(bot=bot, request=request, decision=decision)
+        if self._empty is not None:
+            self._empty.clear()
+        self._enqueue(key)
+
+    def approve(self, request: ChatJoinRequest, bot: Optional[Bot] = None) -> None:
+        """
+        Queue approval of the request
+
+        :param request: chat join request
+        :param bot: bot instance, by default the bot the request is received by
+        """
+        self._add(request, JoinRequestDecision.APPROVE, bot=bot)
+
+    def decline(self, request: ChatJoinRequest, bot: Optional[Bot] = None) -> None:
+        """
+        Queue declining of the request
+
+        :param request: chat join request
+        :param bot: bot instance, by default the bot the request is received by
+        """
+        self._add(request, JoinRequestDecision.DECLINE, bot=bot)
+
+    def submit(self, request: ChatJoinRequest, bot: Optional[Bot] = None) -> None:
+        """
+        Queue the request to be decided by the policy
+
+        :param request: chat join request
+        :param bot: bot instance, by default the bot the request is received by
+        """
+        if self.policy is None:
+            raise RuntimeError("Policy is not set, approve or decline the request explicitly")
+        self._add(request, None, bot=bot)
+
+    async def _wait_turn(self) -> None:
+        # Each request reserves the next slot, so the requests are spread evenly in time
+        now = time.monotonic()
+        send_at = max(self._next_send_at, now)
+        self._next_send_at = send_at + 1 / self.rate
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    def _pause(self, delay: float) -> None:
+        self._next_send_at = max(self._next_send_at, time.monotonic() + delay)
+
+    def _done(self, key: JoinRequestKey) -> None:
+        del self._pending[key]
+        if not self._pending and self._empty is not None:
+            self._empty.set()
+
+    async def process(self, key: JoinRequestKey) -> JoinRequestResult:
+        """
+        Approve or decline the queued request
+
+        :param key: key of the queued request
+        """
+        item = self._pending[key]
+        _, chat_id, user_id = key
+        # Only decided requests are queued for processing
+        decision = cast(JoinRequestDecision, item.decision)
+        method_type = (
+            ApproveChatJoinRequest
+            if decision is JoinRequestDecision.APPROVE
+            else DeclineChatJoinRequest
+        )
+        while True:
+            await self._wait_turn()
+            try:
+                await item.bot(method_type(chat_id=chat_id, user_id=user_id))
+            except TelegramRetryAfter as e:
+                self.stats.flood_waits += 1
+                logger.warning(
+                    "Join requests processing is paused for %d seconds by flood control",
+                    e.retry_after,
+                )
+                self._pause(e.retry_after)
+                continue
+            except TelegramAPIError as e:
+                # The request is already processed by the other admin, the user left and etc.
+                self.stats.failed += 1
+                return JoinRequestResult(
+                    chat_id=chat_id, user_id=user_id, decision=decision, error=e
+                )
+            if decision is JoinRequestDecision.APPROVE:
+                self.stats.approved += 1
+            else:
+                self.stats.declined += 1
+            return JoinRequestResult(chat_id=chat_id, user_id=user_id, decision=decision)
+
+    async def _worker(self, queue: "asyncio.Queue[JoinRequestKey]") -> None:
+        while True:
+            key = await queue.get()
+            try:
+                result = await self.process(key)
+            except Exception:
+                self.stats.failed += 1
+                logger.exception("Failed to process chat join request %s", key)
+                self._done(key)
+                continue
+            self._done(key)
+            if self.on_result is not None:
+                try:
+                    await self.on_result(result)
+                except Exception:
+                    logger.exception("Join request result callback is failed")
+
+    def _is_undecided(self, key: JoinRequestKey) -> bool:
+        item = self._pending.get(key)
+        return item is not None and item.decision is None
+
+    async def _get_batch(self, queue: "asyncio.Queue[JoinRequestKey]") -> List[JoinRequestKey]:
+        keys = [await queue.get()]
+        deadline = time.monotonic() + self.batch_window
+        while len(keys) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                keys.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+        # Requests decided explicitly while waiting are not passed to the policy
+        return [key for key in keys if self._is_undecided(key)]
+
+    async def _apply_policy(self, keys: List[JoinRequestKey]) -> None:
+        if self.policy is None:  # pragma: no cover
+            return
+        requests = [self._pending[key].request for key in keys]
+        decisions = await self.policy(requests)
+        if len(decisions) != len(keys):
+            raise ValueError(
+                f"Policy returned {len(decisions)} decisions for {len(keys)} requests"
+            )
+        for key, decision in zip(keys, decisions):
+            if not self._is_undecided(key):
+                continue
+            if decision is None:
+                self.stats.skipped += 1
+                self._done(key)
+                continue
+            self._pending[key].decision = (
+                JoinRequestDecision.APPROVE if decision else JoinRequestDecision.DECLINE
+            )
+            self._enqueue(key)
+
+    async def _policy_worker(self, queue: "asyncio.Queue[JoinRequestKey]") -> None:
+        while True:
+            keys = await self._get_batch(queue)
+            if not keys:
+                continue
+            try:
+                await self._apply_policy(keys)
+            except Exception:
+                logger.exception("Join requests policy is failed, requests are left undecided")
+                for key in keys:
+                    if self._is_undecided(key):
+                        self.stats.skipped += 1
+                        self._done(key)
+
+    async def start(self) -> None:
+        """
+        Start processing of the queued requests in background
+        """
+        if self.running:
+            return
+        self.stats.started_at = time.monotonic()
+        self._queue = asyncio.Queue()
+        self._undecided = asyncio.Queue()
+        self._empty = asyncio.Event()
+        if not self._pending:
+            self._empty.set()
+        # Requests queued before the start or left after the stop
+        for key in self._pending:
+            self._enqueue(key)
+
+        workers = [self._worker(self._queue) for _ in range(self.concurrency)]
+        if self.policy is not None:
+            workers.append(self._policy_worker(self._undecided))
+        for worker in workers:
+            self._tasks.add(asyncio.create_task(worker))
+        logger.info("Join requests processor is started")
+
+    async def join(self) -> None:
+        """
+        Wait until all the queued requests are processed
+        """
+        if self._empty is None:
+            raise RuntimeError("Processor is not started")
+        await self._empty.wait()
+
+    async def stop(self, wait: bool = True) -> None:
+        """
+        Stop the processor
+
+        :param wait: process all the queued requests before stopping
+        """
+        if wait and self.running:
+            await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._queue = self._undecided = None
+        self._empty = None
+        logger.info(
+            "Join requests processor is stopped: %d approved, %d declined, %d failed, %d pending",
+            self.stats.approved,
+            self.stats.declined,
+            self.stats.failed,
+            self.stats.pending,
+        )
+
+    def setup(self, dispatcher: Dispatcher) -> None:
+        """
+        Start the processor on the dispatcher startup and stop it on shutdown,
+        the processor is passed to the handlers as :code:`join_requests` argument
+
+        :param dispatcher: dispatcher instance
+        """
+        dispatcher["join_requests"] = self
+        dispatcher.startup.register(self.start)
+        dispatcher.shutdown.register(self.stop)
@@ -8,9 +8,11 @@ from aiohttp import MultipartWriter, web
 from aiohttp.abc import Application
 from aiohttp.typedefs import Handler
 from aiohttp.web_middlewares import middleware
+from pydantic_core import to_json
 
 from aiogram import Bot, Dispatcher, loggers
 from aiogram.client.form import construct_form_data, json_dumps, json_loads
+from aiogram.client.session.aiohttp import AiohttpSessionPool
 from aiogram.methods import TelegramMethod
 from aiogram.methods.base import TelegramType
 from aiogram.webhook.security import IPFilter
@@ -85,6 +87,7 @@ class BaseRequestHandler(ABC):
         self,
         dispatcher: Dispatcher,
         handle_in_background: bool = False,
+        json_response: bool = False,
         **data: Any,
     ) -> None:
         """
@@ -94,9 +97,12 @@ class BaseRequestHandler(ABC):
         :param dispatcher: instance of :class:`aiogram.dispatcher.dispatcher.Dispatcher`
         :param handle_in_background: immediately responds to the Telegram instead of
             a waiting end of a handler process
+        :param json_response: reply into webhook with a single JSON body
+            instead of multipart form data when the method has no files to upload
         """
         self.dispatcher = dispatcher
         self.handle_in_background = handle_in_background
+        self.json_response = json_response
         self.data = data
         self._background_feed_update_tasks: Set[asyncio.Task[Any]] = set()
 
@@ -176,12 +182,27 @@ class BaseRequestHandler(ABC):
 
         return writer
 
+    def _build_json_response(
+        self, bot: Bot, result: TelegramMethod[TelegramType]
+    ) -> Optional[web.Response]:
+        data, files = construct_form_data(result, bot=bot, dumps=False)
+        if files:
+            return None
+        return web.Response(
+            body=to_json({"method": result.__api_method__, **data}),
+            content_type="application/json",
+        )
+
     async def _handle_request(self, bot: Bot, request: web.Request) -> web.Response:
         result: Optional[TelegramMethod[Any]] = await self.dispatcher.feed_webhook_update(
             bot,
             await request.json(loads=json_loads),
             **self.data,
         )
+        if self.json_response and result:
+            response = self._build_json_response(bot=bot, result=result)
+            if response is not None:
+                return response
         return web.Response(body=self._build_response_writer(bot=bot, result=result))
 
     async def handle(self, request: web.Request) -> web.Response:
@@ -202,6 +223,7 @@ class SimpleRequestHandler(BaseRequestHandler):
         bot: Bot,
         handle_in_background: bool = True,
         secret_token: Optional[str] = None,
+        json_response: bool = False,
         **data: Any,
     ) -> None:
         """
@@ -211,8 +233,15 @@ class SimpleRequestHandler(BaseRequestHandler):
         :param handle_in_background: immediately responds to the Telegram instead of
             a waiting end of handler process
         :param bot: instance of :class:`aiogram.client.bot.Bot`
+        :param json_response: reply into webhook with a single JSON body
+            when the method has no files to upload
         """
-        super().__init__(dispatcher=dispatcher, handle_in_background=handle_in_background, **data)
+        super().__init__(
+            dispatcher=dispatcher,
+            handle_in_background=handle_in_background,
+            json_response=json_response,
+            **data,
+        )
         self.bot = bot
         self.secret_token = secret_token
 
@@ -237,6 +266,8 @@ class TokenBasedRequestHandler(BaseRequestHandler):
         dispatcher: Dispatcher,
         handle_in_background: bool = True,
         bot_settings: Optional[Dict[str, Any]] = None,
+        json_response: bool = False,
+        session_pool: Optional[AiohttpSessionPool] = None,
         **data: Any,
     ) -> None:
         """
@@ -252,11 +283,21 @@ class TokenBasedRequestHandler(BaseRequestHandler):
         :param handle_in_background: immediately responds to the Telegram instead of
             a waiting end of handler process
         :param bot_settings: kwargs that will be passed to new Bot instance
+        :param json_response: reply into webhook with a single JSON body
+            when the method has no files to upload
+        :param session_pool: connections pool shared by all the bots,
+            it is not closed by the handler
         """
-        super().__init__(dispatcher=dispatcher, handle_in_background=handle_in_background, **data)
+        super().__init__(
+            dispatcher=dispatcher,
+            handle_in_background=handle_in_background,
+            json_response=json_response,
+            **data,
+        )
         if bot_settings is None:
             bot_settings = {}
         self.bot_settings = bot_settings
+        self.session_pool = session_pool
         self.bots: Dict[str, Bot] = {}
 
     def verify_secret(self, telegram_secret_token: str, bot: Bot) -> bool:
@@ -287,5 +328,8 @@ class TokenBasedRequestHandler(BaseRequestHandler):
         """
         token = request.match_info["bot_token"]
         if token not in self.bots:
-            self.bots[token] = Bot(token=token, **self.bot_settings)
+            bot_settings = self.bot_settings
+            if self.session_pool is not None and "session" not in bot_settings:
+                bot_settings = {**bot_settings, "session": self.session_pool.create_session()}
+            self.bots[token] = Bot(token=token, **bot_settings)
         return self.bots[token]
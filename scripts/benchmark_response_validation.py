@@ -0,0 +1,109 @@
+"""
+Benchmark of the API responses validation
+
+Usage:
+
+    python scripts/benchmark_response_validation.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Dict, List, Tuple, Type
+
+from aiogram import Bot
+from aiogram.client.session.base import get_response_type
+from aiogram.methods import GetChatMember, GetUpdates, Response, SendMessage, TelegramMethod
+
+USER = {"id": 42, "is_bot": False, "first_name": "Test", "username": "test"}
+CHAT = {"id": 42, "type": "private", "first_name": "Test", "username": "test"}
+
+
+def make_message(message_id: int) -> Dict[str, Any]:
+    return {
+        "message_id": message_id,
+        "date": 1700000000,
+        "chat": CHAT,
+        "from": USER,
+        "text": "Hello, world! " * 4,
+        "entities": [{"type": "bold", "offset": 0, "length": 5}],
+    }
+
+
+CASES: List[Tuple[str, Type[TelegramMethod[Any]], str]] = [
+    ("SendMessage", SendMessage, json.dumps({"ok": True, "result": make_message(1)})),
+    (
+        "GetUpdates (100 updates)",
+        GetUpdates,
+        json.dumps(
+            {
+                "ok": True,
+                "result": [
+                    {"update_id": index, "message": make_message(index)} for index in range(100)
+                ],
+            }
+        ),
+    ),
+    (
+        "GetChatMember",
+        GetChatMember,
+        json.dumps(
+            {
+                "ok": True,
+                "result": {
+                    "status": "administrator",
+                    "user": USER,
+                    "can_be_edited": False,
+                    **{
+                        key: False
+                        for key in (
+                            "is_anonymous",
+                            "can_manage_chat",
+                            "can_delete_messages",
+                            "can_manage_video_chats",
+                            "can_restrict_members",
+                            "can_promote_members",
+                            "can_change_info",
+                            "can_invite_users",
+                            "can_post_stories",
+                            "can_edit_stories",
+                            "can_delete_stories",
+                        )
+                    },
+                },
+            }
+        ),
+    ),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    bot = Bot("42:TEST")
+    context = {"bot": bot}
+
+    print(f"{'Method':<28}{'Parametrize, us':>18}{'Cached type, us':>18}{'Validate, us':>16}")
+    for name, method_type, content in CASES:
+        response_type = get_response_type(method_type)
+
+        def parametrize() -> None:
+            Response[method_type.__returning__]  # type: ignore
+
+        def cached() -> None:
+            get_response_type(method_type)
+
+        def validate() -> None:
+            response_type.model_validate_json(content, context=context)
+
+        results = [
+            timeit.timeit(func, number=args.number) / args.number * 1e6
+            for func in (parametrize, cached, validate)
+        ]
+        print(f"{name:<28}{results[0]:>18.3f}{results[1]:>18.3f}{results[2]:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
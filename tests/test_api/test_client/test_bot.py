@@ -10,7 +10,7 @@ from aresponses import ResponsesMockServer
 from aiogram import Bot
 from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.client.telegram import TelegramAPIServer
-from aiogram.methods import GetFile, GetMe
+from aiogram.methods import GetFile, GetMe, ResultMode
 from aiogram.types import File, PhotoSize
 from tests.mocked_bot import MockedBot
 from tests.test_api.test_client.test_session.test_base_session import CustomSession
@@ -86,6 +86,17 @@ class TestBot:
             await bot(method)
             mocked_make_request.assert_awaited_with(bot, method, timeout=None)
 
+    @pytest.mark.parametrize("result_mode", [ResultMode.LAZY, ResultMode.SKIP])
+    async def test_emit_with_result_mode(self, mocked_bot: MockedBot, result_mode: ResultMode):
+        mocked_bot.add_result_for(GetMe, ok=True, result=mocked_bot._me)
+        method = GetMe()
+
+        await mocked_bot(method, result_mode=result_mode)
+        request = mocked_bot.get_request()
+        assert request is not method
+        assert request._result_mode is result_mode
+        assert method._result_mode is None
+
     async def test_close(self, session: AiohttpSession):
         bot = Bot("42:TEST", session=session)
         await session.create_session()
@@ -15,11 +15,19 @@ from aiogram.client.default_annotations import (
 from aiogram.client.form import (
     construct_form_data,
     extract_files_from_model,
+    get_default_prop_fields,
+    get_file_fields,
     json_dumps,
     replace_default_props,
 )
 from aiogram.enums import ChatType, ParseMode, TopicIconColor
-from aiogram.methods import BanChatMember, SendMediaGroup, SendMessage, SendPhoto
+from aiogram.methods import (
+    BanChatMember,
+    GetChatMember,
+    SendMediaGroup,
+    SendMessage,
+    SendPhoto,
+)
 from aiogram.types import (
     BufferedInputFile,
     InputMediaPhoto,
@@ -91,8 +99,55 @@ class TestExtractFiles:
             "file2": file2,
         }
 
+    def test_extract_files_without_files(self):
+        method = SendMessage(chat_id=1, text="test")
+        modified_method, files = extract_files_from_model(method)
+        assert modified_method is method
+        assert files == {}
+
+    def test_extract_files_from_extra(self):
+        file = BufferedInputFile(b"123", "file.png")
+        method = SendMessage(chat_id=1, text="test", custom_file=file)
+        with mock.patch("secrets.token_urlsafe", return_value="some_key"):
+            modified_method, files = extract_files_from_model(method)
+        assert modified_method.custom_file == "attach://some_key"
+        assert files == {"some_key": file}
+
+    @pytest.mark.parametrize(
+        "model_type,fields",
+        [
+            [SendMessage, ()],
+            [GetChatMember, ()],
+            [SendPhoto, ("photo",)],
+            [SendMediaGroup, ("media",)],
+        ],
+    )
+    def test_get_file_fields(self, model_type, fields):
+        assert get_file_fields(model_type) == fields
+
 
 class TestReplaceDefaultProps:
+    def test_get_default_prop_fields(self):
+        default_fields, nested_fields = get_default_prop_fields(SendMediaGroup)
+        assert ("protect_content", "protect_content") in default_fields
+        assert "media" in nested_fields
+        assert get_default_prop_fields(GetChatMember) == ((), ())
+
+    def test_replace_default_props_without_changes(self):
+        method = SendMessage(chat_id=1, text="test")
+        assert replace_default_props(method, props=DefaultBotProperties()) is method
+
+    def test_replace_default_props_in_list(self):
+        props = DefaultBotProperties(parse_mode=ParseMode.HTML)
+        method = SendMediaGroup(
+            chat_id=1,
+            media=[InputMediaPhoto(media="file_id"), InputMediaPhoto(media="file_id")],
+        )
+        patched_method = replace_default_props(method, props=props)
+        assert patched_method is not method
+        assert all(media.parse_mode == ParseMode.HTML for media in patched_method.media)
+        assert all(media.parse_mode is None for media in method.media)
+
     def test_replace_default_props(self):
         props = DefaultBotProperties(
             parse_mode=ParseMode.HTML,
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.prepared import PreparedMethod
+from aiogram.methods import GetMe, SendDocument, SendMessage
+from aiogram.types import BufferedInputFile, InlineKeyboardButton, InlineKeyboardMarkup
+from tests.mocked_bot import MockedBot
+
+MARKUP = InlineKeyboardMarkup(
+    inline_keyboard=[[InlineKeyboardButton(text="test", callback_data="test")]]
+)
+
+
+class TestPreparedMethod:
+    def test_prepare(self):
+        bot = MockedBot(default=DefaultBotProperties(parse_mode="HTML"))
+        prepared = PreparedMethod(
+            SendMessage(chat_id=0, text="test", reply_markup=MARKUP), bot=bot
+        )
+        assert prepared.data == {
+            "text": "test",
+            "parse_mode": "HTML",
+            "reply_markup": {"inline_keyboard": [[{"text": "test", "callback_data": "test"}]]},
+        }
+
+        method = prepared(chat_id=42)
+        assert isinstance(method, SendMessage)
+        assert method.chat_id == 42
+        assert method._prepared is prepared
+        assert prepared.method._prepared is None
+        assert json.loads(prepared.build_body(method)) == {"chat_id": 42, **prepared.data}
+        assert prepared.build_data(method) == {"chat_id": 42, **prepared.data}
+
+    def test_fields_changed_by_middleware(self, bot: MockedBot):
+        prepared = PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot)
+        method = prepared(chat_id=42).model_copy(update={"chat_id": -100})
+        assert method._prepared is prepared
+        assert json.loads(prepared.build_body(method)) == {"chat_id": -100, "text": "test"}
+
+    def test_other_fields_changed(self, bot: MockedBot):
+        prepared = PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot)
+
+        method = prepared(chat_id=42).model_copy(update={"text": "changed"})
+        assert method._prepared is None
+        assert method.text == "changed"
+
+        method = prepared(chat_id=42).model_copy(deep=True)
+        assert method._prepared is prepared
+
+        method = prepared(chat_id=42)
+        method.chat_id = -100
+        assert method._prepared is prepared
+        method.text = "changed"
+        assert method._prepared is None
+
+    def test_many_fields(self, bot: MockedBot):
+        prepared = PreparedMethod(
+            SendMessage(chat_id=0, text="test"), bot=bot, fields=["chat_id", "reply_markup"]
+        )
+        method = prepared(chat_id=42, reply_markup=MARKUP)
+        assert json.loads(prepared.build_body(method)) == {
+            "chat_id": 42,
+            "text": "test",
+            "reply_markup": {"inline_keyboard": [[{"text": "test", "callback_data": "test"}]]},
+        }
+        # Empty fields are skipped
+        method = prepared(chat_id=42)
+        assert json.loads(prepared.build_body(method)) == {"chat_id": 42, "text": "test"}
+
+    def test_empty_template(self, bot: MockedBot):
+        prepared = PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot, fields=["text"])
+        prepared.data = {}
+        prepared.body = b"{}"
+        assert prepared.build_body(prepared(text="test")) == b'{"text":"test"}'
+
+        prepared = PreparedMethod(GetMe(), bot=bot, fields=[])
+        assert prepared.build_body(prepared()) == b"{}"
+
+    def test_unknown_fields(self, bot: MockedBot):
+        with pytest.raises(ValueError, match="has no fields 'user_id'"):
+            PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot, fields=["user_id"])
+
+        prepared = PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot)
+        with pytest.raises(TypeError, match="'text' are not designated"):
+            prepared(chat_id=42, text="other")
+
+    def test_files(self, bot: MockedBot):
+        with pytest.raises(ValueError, match="can not contain files"):
+            PreparedMethod(
+                SendDocument(chat_id=0, document=BufferedInputFile(b"test", "file.txt")), bot=bot
+            )
+
+    async def test_send(self, bot: MockedBot):
+        prepared = PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot)
+        bot.add_result_for(SendMessage, ok=True, result=None)
+        await bot(prepared(chat_id=42))
+        assert bot.get_request().chat_id == 42
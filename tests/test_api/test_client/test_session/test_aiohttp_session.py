@@ -1,4 +1,5 @@
 import asyncio
+import json
 from typing import (
     Any,
     AsyncContextManager,
@@ -8,19 +9,40 @@ from typing import (
     List,
     Union,
 )
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp_socks
 import pytest
-from aiohttp import ClientError
+from aiohttp import ClientConnectorError, ClientError
 from aresponses import ResponsesMockServer
 
 from aiogram import Bot
 from aiogram.client.default_annotations import DefaultParseMode
+from aiogram.client.prepared import PreparedMethod
 from aiogram.client.session import aiohttp
-from aiogram.client.session.aiohttp import AiohttpSession
-from aiogram.exceptions import TelegramNetworkError
-from aiogram.methods import TelegramMethod
+from aiogram.client.session.aiohttp import (
+    AiohttpSession,
+    AiohttpSessionPool,
+    Lane,
+    LaneConfig,
+    PooledAiohttpSession,
+    PoolStats,
+)
+from aiogram.client.session.balancer import APIServerBalancer
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.exceptions import (
+    TelegramConnectionError,
+    TelegramNetworkError,
+    TelegramResponseTooLarge,
+)
+from aiogram.methods import (
+    GetMe,
+    GetUpdates,
+    SendChatAction,
+    SendDocument,
+    SendMessage,
+    TelegramMethod,
+)
 from aiogram.types import UNSET_PARSE_MODE, InputFile
 from tests.mocked_bot import MockedBot
 
@@ -97,6 +119,53 @@ class TestAiohttpSession:
 
         await session.close()
 
+    async def test_create_lane_session(self):
+        session = AiohttpSession(lanes={Lane.LONG_POLL: LaneConfig(limit=1)})
+        default_session = await session.create_session()
+        long_poll_session = await session.create_session(lane=Lane.LONG_POLL)
+
+        assert long_poll_session is not default_session
+        assert long_poll_session.connector.limit == 1
+        assert default_session.connector.limit == 100
+        assert await session.create_session(lane=Lane.LONG_POLL) is long_poll_session
+        # Not configured lanes share the default pool
+        assert await session.create_session(lane=Lane.BULK) is default_session
+
+        await session.close()
+        assert long_poll_session.closed
+        assert default_session.closed
+        assert session._lane_sessions == {}
+
+    def test_resolve_lane(self, bot: MockedBot):
+        session = AiohttpSession()
+        session.lane_methods[GetMe] = Lane.BULK
+
+        method = GetUpdates()
+        assert session.resolve_lane(method, session.build_request_data(bot, method)[0]) == (
+            Lane.LONG_POLL
+        )
+        method = GetMe()
+        assert session.resolve_lane(method, session.build_request_data(bot, method)[0]) == (
+            Lane.BULK
+        )
+        method = SendMessage(chat_id=42, text="test")
+        assert session.resolve_lane(method, session.build_request_data(bot, method)[0]) == (
+            Lane.INTERACTIVE
+        )
+        method = SendDocument(chat_id=42, document=BareInputFile(filename="file.txt"))
+        assert session.resolve_lane(method, session.build_request_data(bot, method)[0]) == (
+            Lane.FILE
+        )
+        # Lane of the call has precedence
+        method = SendMessage(chat_id=42, text="test").with_lane(Lane.BULK)
+        assert session.resolve_lane(method, session.build_request_data(bot, method)[0]) == (
+            Lane.BULK
+        )
+        method = GetMe().with_lane(Lane.INTERACTIVE)
+        assert session.resolve_lane(method, session.build_request_data(bot, method)[0]) == (
+            Lane.INTERACTIVE
+        )
+
     async def test_close_session(self):
         session = AiohttpSession()
         await session.create_session()
@@ -107,6 +176,113 @@ class TestAiohttpSession:
 
         await session.close()
 
+    async def test_get_pool_stats(self):
+        session = AiohttpSession(limit=10, lanes={Lane.LONG_POLL: LaneConfig(limit=1)})
+        assert session.get_pool_stats() == PoolStats(limit=10, acquired=0, idle=0)
+        assert session.get_pool_stats(lane=Lane.LONG_POLL) == PoolStats(
+            limit=1, acquired=0, idle=0
+        )
+
+        client_session = await session.create_session()
+        client_session.connector._acquired.update({MagicMock(), MagicMock()})
+        client_session.connector._conns[MagicMock()] = [(MagicMock(), 0.0)]
+        stats = session.get_pool_stats()
+        assert stats == PoolStats(limit=10, acquired=2, idle=1)
+        assert stats.utilisation == 0.2
+        assert PoolStats(limit=0, acquired=2, idle=0).utilisation == 0.0
+
+        client_session.connector._acquired.clear()
+        client_session.connector._conns.clear()
+        await session.close()
+
+    def test_get_warm_up_urls(self):
+        session = AiohttpSession(
+            api=TelegramAPIServer.from_base("http://localhost:8081", is_local=True)
+        )
+        assert session._get_warm_up_urls() == ["http://localhost:8081"]
+
+        session = AiohttpSession(
+            balancer=APIServerBalancer(
+                [
+                    TelegramAPIServer.from_base("https://server1.local"),
+                    TelegramAPIServer.from_base("https://server2.local"),
+                    TelegramAPIServer.from_base("https://server2.local/"),
+                ]
+            )
+        )
+        assert session._get_warm_up_urls() == ["https://server1.local", "https://server2.local"]
+
+    async def test_open_connections(self, aresponses: ResponsesMockServer):
+        for _ in range(2):
+            aresponses.add(aresponses.ANY, "/", "head", aresponses.Response(status=302))
+
+        async with AiohttpSession() as session:
+            assert await session.open_connections(connections=0) == 0
+            assert await session.open_connections(connections=2) == 2
+        aresponses.assert_plan_strictly_followed()
+
+    async def test_open_connections_error(self):
+        session = AiohttpSession()
+        client_session = MagicMock()
+        client_session.head.side_effect = ClientError("mocked")
+        with patch(
+            "aiogram.client.session.aiohttp.AiohttpSession.create_session",
+            new=AsyncMock(return_value=client_session),
+        ):
+            assert await session.open_connections(connections=2) == 0
+
+    async def test_warm_up(self):
+        session = AiohttpSession(warm_up_connections=3)
+        with patch(
+            "aiogram.client.session.aiohttp.AiohttpSession.open_connections",
+            new_callable=AsyncMock,
+        ) as mocked_open_connections:
+            await session.warm_up()
+            mocked_open_connections.assert_awaited_once_with(connections=3, lane=Lane.INTERACTIVE)
+            await session.warm_up(connections=0)
+            mocked_open_connections.assert_awaited_once()
+        assert session._keep_alive_task is None
+
+        # Warm-up is disabled by default
+        session = AiohttpSession()
+        with patch(
+            "aiogram.client.session.aiohttp.AiohttpSession.open_connections",
+            new_callable=AsyncMock,
+        ) as mocked_open_connections:
+            await session.warm_up()
+            mocked_open_connections.assert_not_awaited()
+
+    async def test_keep_alive(self):
+        session = AiohttpSession(warm_up_connections=2, keep_alive_interval=0.01)
+        called = asyncio.Event()
+        calls: List[int] = []
+
+        async def open_connections(self, connections, lane=Lane.INTERACTIVE):
+            calls.append(connections)
+            if len(calls) >= 3:
+                called.set()
+            return connections
+
+        with patch(
+            "aiogram.client.session.aiohttp.AiohttpSession.open_connections", open_connections
+        ), patch(
+            "aiogram.client.session.aiohttp.AiohttpSession.get_pool_stats",
+            return_value=PoolStats(limit=100, acquired=1, idle=0),
+        ):
+            await session.warm_up()
+            task = session._keep_alive_task
+            assert task is not None
+            await session.warm_up()
+            assert session._keep_alive_task is task
+
+            await asyncio.wait_for(called.wait(), timeout=1)
+            await session.close()
+
+        assert task.cancelled()
+        assert session._keep_alive_task is None
+        # Connections used by the requests in progress are not opened again
+        assert calls[:3] == [2, 2, 1]
+
     def test_build_form_data_with_data_only(self, bot: MockedBot):
         class TestMethod(TelegramMethod[bool]):
             __api_method__ = "test"
@@ -161,6 +337,79 @@ class TestAiohttpSession:
         assert fields[2][0]["filename"] == "file.txt"
         assert isinstance(fields[2][2], AsyncIterable)
 
+    def test_build_request_data_json(self, bot: MockedBot):
+        session = AiohttpSession()
+        data, headers = session.build_request_data(
+            bot, SendMessage(chat_id=42, text="test", reply_markup=None)
+        )
+        assert headers == {"Content-Type": "application/json"}
+        assert json.loads(data) == {"chat_id": 42, "text": "test"}
+
+    def test_build_request_data_json_disabled(self, bot: MockedBot):
+        session = AiohttpSession(json_requests=False)
+        data, headers = session.build_request_data(bot, SendMessage(chat_id=42, text="test"))
+        assert headers == {}
+        assert isinstance(data, aiohttp.FormData)
+
+    @pytest.mark.parametrize(
+        "json_requests,method",
+        [
+            [False, SendMessage(chat_id=42, text="test")],
+            [True, SendDocument(chat_id=42, document=BareInputFile(filename="file.txt"))],
+        ],
+    )
+    def test_build_request_data_overridden_form_data(
+        self, bot: MockedBot, json_requests: bool, method: TelegramMethod
+    ):
+        form = aiohttp.FormData()
+        calls = []
+
+        class CustomSession(AiohttpSession):
+            def build_form_data(self, bot, method):
+                calls.append((bot, method))
+                return form
+
+        session = CustomSession(json_requests=json_requests)
+        data, headers = session.build_request_data(bot, method)
+        assert calls == [(bot, method)]
+        assert data is form
+        assert headers == {}
+
+    def test_build_request_data_with_files_serialized_once(self, bot: MockedBot):
+        session = AiohttpSession()
+        method = SendDocument(chat_id=42, document=BareInputFile(filename="file.txt"))
+        with patch(
+            "aiogram.client.session.aiohttp.construct_form_data",
+            wraps=aiohttp.construct_form_data,
+        ) as mocked_construct:
+            data, headers = session.build_request_data(bot, method)
+        mocked_construct.assert_called_once()
+        assert headers == {}
+        assert isinstance(data, aiohttp.FormData)
+        assert data.is_multipart
+
+    def test_build_request_data_prepared(self, bot: MockedBot):
+        prepared = PreparedMethod(SendMessage(chat_id=0, text="test"), bot=bot)
+        method = prepared(chat_id=42)
+        with patch("aiogram.client.session.aiohttp.construct_form_data") as mocked_construct:
+            data, headers = AiohttpSession().build_request_data(bot, method)
+            form_data, form_headers = AiohttpSession(json_requests=False).build_request_data(
+                bot, method
+            )
+        mocked_construct.assert_not_called()
+        assert headers == {"Content-Type": "application/json"}
+        assert json.loads(data) == {"chat_id": 42, "text": "test"}
+        assert form_headers == {}
+        assert isinstance(form_data, aiohttp.FormData)
+
+    def test_build_request_data_with_files(self, bot: MockedBot):
+        session = AiohttpSession()
+        data, headers = session.build_request_data(
+            bot, SendDocument(chat_id=42, document=BareInputFile(filename="file.txt"))
+        )
+        assert headers == {}
+        assert isinstance(data, aiohttp.FormData)
+
     async def test_make_request(self, bot: MockedBot, aresponses: ResponsesMockServer):
         aresponses.add(
             aresponses.ANY,
@@ -185,8 +434,98 @@ class TestAiohttpSession:
             assert isinstance(result, int)
             assert result == 42
 
-    @pytest.mark.parametrize("error", [ClientError("mocked"), asyncio.TimeoutError()])
-    async def test_make_request_network_error(self, error):
+    @pytest.mark.parametrize(
+        "lane_timeout,call_timeout,expected",
+        [
+            [None, None, 60.0],
+            [5.0, None, 5.0],
+            [5.0, 10, 10],
+        ],
+    )
+    async def test_make_request_lane_timeout(
+        self, bot: MockedBot, lane_timeout, call_timeout, expected
+    ):
+        session = AiohttpSession(lanes={Lane.INTERACTIVE: LaneConfig(timeout=lane_timeout)})
+        resp = MagicMock()
+        resp.status = 200
+        client_session = MagicMock()
+        client_session.post.return_value.__aenter__ = AsyncMock(return_value=resp)
+        client_session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(
+            session, "create_session", AsyncMock(return_value=client_session)
+        ) as mocked_create_session, patch.object(
+            session, "_read_response", AsyncMock(return_value=b'{"ok": true, "result": true}')
+        ):
+            assert await session.make_request(
+                bot, SendChatAction(chat_id=42, action="typing"), timeout=call_timeout
+            )
+
+        mocked_create_session.assert_awaited_once_with(lane=Lane.INTERACTIVE)
+        assert client_session.post.call_args.kwargs["timeout"] == expected
+
+    async def test_make_request_too_large(self, bot: MockedBot, aresponses: ResponsesMockServer):
+        aresponses.add(
+            aresponses.ANY,
+            "/bot42:TEST/method",
+            "post",
+            aresponses.Response(
+                status=200,
+                text='{"ok": true, "result": 42}',
+                headers={"Content-Type": "application/json"},
+            ),
+        )
+
+        async with AiohttpSession(max_response_size=10) as session:
+
+            class TestMethod(TelegramMethod[int]):
+                __returning__ = int
+                __api_method__ = "method"
+
+            with pytest.raises(TelegramResponseTooLarge, match="larger than 10 bytes"):
+                await session.make_request(bot, TestMethod())
+
+    @pytest.mark.parametrize(
+        "max_size,content_length,error",
+        [
+            [None, None, False],
+            [None, 26, False],
+            [26, 26, False],
+            [25, 26, True],
+            [26, None, False],
+            [25, None, True],
+        ],
+    )
+    async def test_read_response(self, max_size, content_length, error):
+        body = b'{"ok": true, "result": 42}'
+
+        async def iter_any():
+            yield body[:10]
+            yield body[10:]
+
+        resp = MagicMock(content_length=content_length)
+        resp.read = AsyncMock(return_value=body)
+        resp.content.iter_any = iter_any
+
+        session = AiohttpSession(max_response_size=max_size)
+        if error:
+            with pytest.raises(TelegramResponseTooLarge):
+                await session._read_response(resp=resp, method=GetMe())
+        else:
+            assert await session._read_response(resp=resp, method=GetMe()) == body
+
+    @pytest.mark.parametrize(
+        "error,exception_type",
+        [
+            [ClientError("mocked"), TelegramNetworkError],
+            [asyncio.TimeoutError(), TelegramNetworkError],
+            [
+                ClientConnectorError(MagicMock(), OSError("mocked")),
+                TelegramConnectionError,
+            ],
+        ],
+    )
+    async def test_make_request_network_error(self, error, exception_type):
         async def side_effect(*args, **kwargs):
             raise error
 
@@ -195,9 +534,11 @@ class TestAiohttpSession:
                 "aiohttp.client.ClientSession._request",
                 new_callable=AsyncMock,
                 side_effect=side_effect,
-            ):
-                with pytest.raises(TelegramNetworkError):
+            ) as mocked_request:
+                with pytest.raises(exception_type) as exc_info:
                     await bot.get_me()
+                mocked_request.assert_awaited_once()
+        assert type(exc_info.value) is exception_type
 
     async def test_stream_content(self, aresponses: ResponsesMockServer):
         aresponses.add(
@@ -258,3 +599,90 @@ class TestAiohttpSession:
                     assert session == ctx
                 mocked_close.assert_awaited_once()
                 mocked_create_session.assert_awaited_once()
+
+
+class TestAiohttpSessionPool:
+    async def test_shared_client_session(self):
+        pool = AiohttpSessionPool(limit=10, limit_per_bot=2)
+        session1 = pool.create_session()
+        session2 = pool.create_session(limit=None)
+        assert isinstance(session1, PooledAiohttpSession)
+        assert session1.requests_limit == 2
+        assert session2.requests_limit is None
+
+        client_session = await session1.create_session()
+        assert await session2.create_session() is client_session
+        assert client_session.connector.limit == 10
+
+        await session1.close()
+        assert not client_session.closed
+
+        await pool.close()
+        assert client_session.closed
+
+    def test_pooled_session_skips_connector_setup(self):
+        pool = AiohttpSessionPool()
+        with patch("ssl.create_default_context") as mocked_create_default_context:
+            session = pool.create_session(json_requests=False, max_response_size=1024)
+        mocked_create_default_context.assert_not_called()
+        assert not hasattr(session, "_connector_init")
+        assert session.json_requests is False
+        assert session.max_response_size == 1024
+        assert session.proxy is None
+
+    def test_pooled_session_proxy(self):
+        pool = AiohttpSessionPool()
+        with pytest.raises(ValueError, match="AiohttpSessionPool"):
+            pool.create_session(proxy="socks5://proxy.url:1080/")
+        session = pool.create_session()
+        with pytest.raises(ValueError, match="AiohttpSessionPool"):
+            session.proxy = "socks5://proxy.url:1080/"
+
+    async def test_lanes(self):
+        async with AiohttpSessionPool(lanes={Lane.LONG_POLL: LaneConfig(limit=1)}) as pool:
+            session = pool.create_session()
+            assert session.lanes is pool.lanes
+            assert session.lane_methods is pool.lane_methods
+            client_session = await session.create_session(lane=Lane.LONG_POLL)
+            assert client_session.connector.limit == 1
+        assert client_session.closed
+
+    async def test_get_pool_stats(self):
+        async with AiohttpSessionPool(limit=10) as pool:
+            session = pool.create_session()
+            await session.create_session()
+            assert session.get_pool_stats() == pool.get_pool_stats()
+            assert pool.get_pool_stats() == PoolStats(limit=10, acquired=0, idle=0)
+
+    async def test_close_stops_keep_alive(self):
+        async with AiohttpSessionPool() as pool:
+            session = pool.create_session(warm_up_connections=1, keep_alive_interval=10)
+            with patch(
+                "aiogram.client.session.aiohttp.AiohttpSession.open_connections",
+                new_callable=AsyncMock,
+            ):
+                await session.warm_up()
+            task = session._keep_alive_task
+            await session.close()
+            assert task.cancelled()
+
+    async def test_limit_per_bot(self, bot: MockedBot):
+        pool = AiohttpSessionPool()
+        session = pool.create_session(limit=1)
+        active = 0
+        max_active = 0
+
+        async def make_request(self, bot, method, timeout=None):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        with patch("aiogram.client.session.aiohttp.AiohttpSession.make_request", make_request):
+            await asyncio.gather(*(session.make_request(bot, GetMe()) for _ in range(3)))
+            assert max_active == 1
+
+            await pool.create_session().make_request(bot, GetMe())
+        await pool.close()
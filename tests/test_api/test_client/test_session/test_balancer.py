@@ -0,0 +1,183 @@
+from unittest.mock import patch
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.session.balancer import APIServerBalancer
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramConnectionError,
+    TelegramEntityTooLarge,
+    TelegramNetworkError,
+    TelegramResponseTooLarge,
+    TelegramServerError,
+)
+from aiogram.methods import GetChat, GetMe, SendMessage
+from tests.mocked_bot import MockedBot
+
+SERVER1 = TelegramAPIServer.from_base("http://server1.local")
+SERVER2 = TelegramAPIServer.from_base("http://server2.local")
+
+
+class FakeRequest:
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.calls = []
+
+    async def __call__(self, server: TelegramAPIServer):
+        self.calls.append(server)
+        if server in self.errors:
+            raise self.errors[server](method=GetMe(), message="test")
+        return server
+
+
+class TestAPIServerBalancer:
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            APIServerBalancer([])
+
+    def test_least_outstanding(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2], sticky=False)
+        balancer.states[0].outstanding = 2
+        balancer.states[1].outstanding = 1
+        assert balancer.choose(1).server is SERVER2
+        balancer.states[1].outstanding = 3
+        assert balancer.choose(1).server is SERVER1
+
+    def test_sticky(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        assert balancer.get_server(1) is SERVER1
+        balancer.states[0].outstanding = 10
+        assert balancer.get_server(1) is SERVER1
+        assert balancer.get_server(2) is SERVER2
+
+    def test_unhealthy(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2], max_failures=2, cooldown=10)
+        assert balancer.get_server(1) is SERVER1
+
+        with patch("time.monotonic", return_value=100.0):
+            balancer.mark_failure(balancer.states[0])
+            assert balancer.get_server(1) is SERVER1
+            balancer.mark_failure(balancer.states[0])
+            assert not balancer.states[0].healthy
+            assert balancer.get_server(1) is SERVER2
+
+            # All the servers are unhealthy, so the least failed is chosen
+            balancer.mark_failure(balancer.states[1])
+            balancer.mark_failure(balancer.states[1])
+            balancer.mark_failure(balancer.states[1])
+            assert balancer.get_server(3) is SERVER1
+
+        with patch("time.monotonic", return_value=110.0):
+            assert balancer.states[0].healthy
+
+    async def test_call_failover(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        request = FakeRequest(errors={SERVER1: TelegramServerError})
+
+        assert await balancer.call(1, request) is SERVER2
+        assert request.calls == [SERVER1, SERVER2]
+        assert balancer.states[0].failures == 1
+        assert balancer.states[1].failures == 0
+        assert balancer.states[0].outstanding == balancer.states[1].outstanding == 0
+        # The bot is moved to the healthy server
+        assert balancer.get_server(1) is SERVER2
+
+    async def test_call_all_failed(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        request = FakeRequest(errors={SERVER1: TelegramNetworkError, SERVER2: TelegramServerError})
+
+        with pytest.raises(TelegramServerError):
+            await balancer.call(1, request)
+        assert len(request.calls) == 2
+
+    async def test_call_no_failover(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        request = FakeRequest(errors={SERVER1: TelegramBadRequest})
+
+        with pytest.raises(TelegramBadRequest):
+            await balancer.call(1, request)
+        assert request.calls == [SERVER1]
+        assert balancer.states[0].failures == 0
+
+    @pytest.mark.parametrize("error", [TelegramEntityTooLarge, TelegramResponseTooLarge])
+    async def test_call_client_side_error(self, error):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        request = FakeRequest(errors={SERVER1: error})
+
+        with pytest.raises(error):
+            await balancer.call(1, request)
+        assert request.calls == [SERVER1]
+        assert balancer.states[0].failures == 0
+        assert balancer.states[0].healthy
+
+    @pytest.mark.parametrize(
+        "error,failover",
+        [
+            [TelegramConnectionError, True],
+            [TelegramNetworkError, False],
+            [TelegramServerError, False],
+        ],
+    )
+    async def test_call_not_idempotent(self, error, failover):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        request = FakeRequest(errors={SERVER1: error})
+
+        if failover:
+            assert await balancer.call(1, request, idempotent=False) is SERVER2
+            assert request.calls == [SERVER1, SERVER2]
+        else:
+            with pytest.raises(error):
+                await balancer.call(1, request, idempotent=False)
+            assert request.calls == [SERVER1]
+        assert balancer.states[0].failures == 1
+
+    def test_is_idempotent(self):
+        balancer = APIServerBalancer([SERVER1])
+        assert balancer.is_idempotent(GetMe())
+        assert balancer.is_idempotent(GetChat(chat_id=42))
+        assert not balancer.is_idempotent(SendMessage(chat_id=42, text="test"))
+
+        balancer = APIServerBalancer([SERVER1], idempotent_methods=[SendMessage])
+        assert not balancer.is_idempotent(GetMe())
+        assert balancer.is_idempotent(SendMessage(chat_id=42, text="test"))
+
+    async def test_check_health(self):
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        balancer.mark_failure(balancer.states[1])
+
+        await balancer.check_health(FakeRequest(errors={SERVER1: TelegramNetworkError}))
+        assert not balancer.states[0].healthy
+        assert balancer.states[1].healthy
+
+
+class TestAiohttpSessionBalancer:
+    async def test_failover(self, bot: MockedBot, aresponses: ResponsesMockServer):
+        aresponses.add(
+            "server1.local",
+            "/bot42:TEST/getMe",
+            "post",
+            aresponses.Response(
+                status=502,
+                text='{"ok": false, "error_code": 502, "description": "Bad Gateway"}',
+                headers={"Content-Type": "application/json"},
+            ),
+        )
+        aresponses.add(
+            "server2.local",
+            "/bot42:TEST/getMe",
+            "post",
+            aresponses.Response(
+                status=200,
+                text='{"ok": true, "result": {"id": 42, "is_bot": true, "first_name": "Test"}}',
+                headers={"Content-Type": "application/json"},
+            ),
+        )
+
+        balancer = APIServerBalancer([SERVER1, SERVER2])
+        async with AiohttpSession(balancer=balancer) as session:
+            result = await session.make_request(bot, GetMe())
+            assert result.id == 42
+            assert session.get_api(bot) is SERVER2
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from aiogram import Bot
-from aiogram.client.session.base import BaseSession, TelegramType
+from aiogram.client.session.base import BaseSession, TelegramType, get_response_type
 from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
 from aiogram.exceptions import (
     ClientDecodeError,
@@ -21,7 +21,7 @@ from aiogram.exceptions import (
     TelegramServerError,
     TelegramUnauthorizedError,
 )
-from aiogram.methods import DeleteMessage, GetMe, TelegramMethod
+from aiogram.methods import DeleteMessage, GetMe, LazyResult, ResultMode, TelegramMethod
 from aiogram.types import UNSET_PARSE_MODE, User
 from tests.mocked_bot import MockedBot
 
@@ -138,6 +138,71 @@ class TestBaseSession:
             if error.url:
                 assert error.url in string
 
+    def test_check_response_bytes(self):
+        session = CustomSession()
+        bot = MockedBot()
+        method = DeleteMessage(chat_id=42, message_id=42)
+
+        response = session.check_response(
+            bot=bot,
+            method=method,
+            status_code=200,
+            content=b'{"ok":true,"result":true}',
+        )
+        assert response.result is True
+
+    def test_get_result_mode(self):
+        session = CustomSession()
+        method = GetMe()
+        assert session.get_result_mode(method) is ResultMode.FULL
+
+        session.result_modes[GetMe] = ResultMode.SKIP
+        assert session.get_result_mode(method) is ResultMode.SKIP
+        assert session.get_result_mode(DeleteMessage(chat_id=42, message_id=42)) is ResultMode.FULL
+
+        method.with_result_mode(ResultMode.LAZY)
+        assert session.get_result_mode(method) is ResultMode.LAZY
+
+    def test_check_response_lazy(self):
+        session = CustomSession()
+        bot = MockedBot()
+        method = GetMe().with_result_mode(ResultMode.LAZY)
+        content = '{"ok":true,"result":{"id":42,"is_bot":true,"first_name":"Test"}}'
+
+        response = session.check_response(bot=bot, method=method, status_code=200, content=content)
+        result = response.result
+        assert isinstance(result, LazyResult)
+        assert result.raw == {"id": 42, "is_bot": True, "first_name": "Test"}
+        assert "raw=" in repr(result)
+        assert isinstance(result.value, User)
+        assert result.value is result.value
+        assert result.first_name == "Test"
+        assert result.value.bot is bot
+
+    def test_check_response_skip(self):
+        session = CustomSession()
+        session.result_modes[GetMe] = ResultMode.SKIP
+
+        response = session.check_response(
+            bot=MockedBot(),
+            method=GetMe(),
+            status_code=200,
+            content='{"ok":true,"result":{"id":42,"is_bot":true,"first_name":"Test"}}',
+        )
+        assert response.result is None
+
+    def test_check_response_skip_error(self):
+        session = CustomSession()
+        method = GetMe().with_result_mode(ResultMode.SKIP)
+
+        with pytest.raises(TelegramRetryAfter):
+            session.check_response(
+                bot=MockedBot(),
+                method=method,
+                status_code=429,
+                content='{"ok":false,"description":"test","parameters":{"retry_after":1}}',
+            )
+
     def test_check_response_json_decode_error(self):
         session = CustomSession()
         bot = MockedBot()
@@ -164,6 +229,12 @@ class TestBaseSession:
                 content='{"ok": "test"}',
             )
 
+    def test_get_response_type(self):
+        response_type = get_response_type(DeleteMessage)
+        assert response_type is get_response_type(DeleteMessage)
+        assert response_type is not get_response_type(GetMe)
+        assert response_type.model_fields["result"].annotation == Optional[bool]
+
     async def test_make_request(self):
         session = CustomSession()
 
@@ -226,3 +297,22 @@ class TestBaseSession:
         assert await bot.get_me()
         assert flag_before
         assert flag_after
+
+    async def test_middleware_timeout(self, bot: MockedBot):
+        timeouts = []
+
+        @bot.session.middleware
+        async def my_middleware(make_request, b, method):
+            return await make_request(b, method)
+
+        async def make_request(b, method, timeout=None):
+            timeouts.append(timeout)
+            return True
+
+        with patch.object(bot.session, "make_request", make_request):
+            chain = bot.session.middleware.compile(bot.session._make_request_with_timeout)
+            await bot.session(bot, GetMe(), timeout=42)
+            await bot.session(bot, GetMe())
+            # Chain is reused for the requests with different timeouts
+            assert bot.session.middleware.compile(bot.session._make_request_with_timeout) is chain
+        assert timeouts == [42, None]
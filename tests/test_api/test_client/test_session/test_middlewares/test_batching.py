@@ -0,0 +1,182 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from aiogram.client.session.middlewares.batching import MessageBatcher
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import (
+    CopyMessage,
+    CopyMessages,
+    DeleteMessage,
+    DeleteMessages,
+    ForwardMessage,
+    ForwardMessages,
+    GetMe,
+    ResultMode,
+    SendMessage,
+)
+from aiogram.types import MessageId
+from tests.mocked_bot import MockedBot
+
+
+class FakeAPI:
+    def __init__(self, skip: int = 0) -> None:
+        self.skip = skip
+        self.sent: List = []
+
+    async def __call__(self, bot, method):
+        self.sent.append(method)
+        if isinstance(method, (CopyMessages, ForwardMessages)):
+            return [MessageId(message_id=100 + message_id) for message_id in method.message_ids][
+                self.skip :
+            ]
+        if isinstance(method, CopyMessage):
+            return MessageId(message_id=100 + method.message_id)
+        return True
+
+
+class TestMessageBatcher:
+    def test_init(self):
+        with pytest.raises(ValueError, match="SendMessage can not be batched"):
+            MessageBatcher(methods=[SendMessage])
+        with pytest.raises(ValueError, match="Batch size"):
+            MessageBatcher(max_size=101)
+
+    def test_is_batchable(self):
+        middleware = MessageBatcher(methods=[DeleteMessage, CopyMessage])
+        assert middleware.is_batchable(DeleteMessage(chat_id=42, message_id=1))
+        assert middleware.is_batchable(
+            CopyMessage(chat_id=42, from_chat_id=43, message_id=1, protect_content=True)
+        )
+        assert not middleware.is_batchable(
+            CopyMessage(chat_id=42, from_chat_id=43, message_id=1, caption="test")
+        )
+        assert not middleware.is_batchable(
+            DeleteMessage(chat_id=42, message_id=1).with_result_mode(ResultMode.SKIP)
+        )
+        assert not middleware.is_batchable(
+            ForwardMessage(chat_id=42, from_chat_id=43, message_id=1)
+        )
+        assert not middleware.is_batchable(GetMe())
+
+    async def test_delete(self, bot: MockedBot):
+        middleware = MessageBatcher(window=0.01)
+        api = FakeAPI()
+
+        results = await asyncio.gather(
+            *(
+                middleware(api, bot, DeleteMessage(chat_id=42, message_id=message_id))
+                for message_id in [3, 1, 2, 2]
+            ),
+            middleware(api, bot, DeleteMessage(chat_id=43, message_id=1)),
+        )
+        assert results == [True] * 5
+        assert len(api.sent) == 2
+        assert api.sent[0] == DeleteMessages(chat_id=42, message_ids=[1, 2, 3])
+        # Batch of the single message is sent as is
+        assert api.sent[1] == DeleteMessage(chat_id=43, message_id=1)
+        assert middleware.metrics.requests == 5
+        assert middleware.metrics.batches == 2
+        assert middleware.metrics.single == 1
+
+    async def test_max_size(self, bot: MockedBot):
+        middleware = MessageBatcher(window=10, max_size=2)
+        api = FakeAPI()
+
+        await asyncio.gather(
+            *(
+                middleware(api, bot, DeleteMessage(chat_id=42, message_id=message_id))
+                for message_id in range(4)
+            )
+        )
+        assert [method.message_ids for method in api.sent] == [[0, 1], [2, 3]]
+
+    async def test_copy(self, bot: MockedBot):
+        middleware = MessageBatcher(window=0.01)
+        api = FakeAPI()
+
+        results = await asyncio.gather(
+            *(
+                middleware(
+                    api, bot, CopyMessage(chat_id=42, from_chat_id=43, message_id=message_id)
+                )
+                for message_id in [2, 1, 1]
+            )
+        )
+        assert results == [
+            MessageId(message_id=102),
+            MessageId(message_id=101),
+            MessageId(message_id=101),
+        ]
+        # The same message is copied twice
+        assert api.sent == [
+            CopyMessages(chat_id=42, from_chat_id=43, message_ids=[1, 2]),
+            CopyMessage(chat_id=42, from_chat_id=43, message_id=1),
+        ]
+
+    async def test_forward(self, bot: MockedBot):
+        middleware = MessageBatcher(window=0.01, methods=[ForwardMessage])
+        api = FakeAPI()
+
+        results = await asyncio.gather(
+            *(
+                middleware(
+                    api, bot, ForwardMessage(chat_id=42, from_chat_id=43, message_id=message_id)
+                )
+                for message_id in [1, 2]
+            )
+        )
+        assert results == [MessageId(message_id=101), MessageId(message_id=102)]
+        assert api.sent == [ForwardMessages(chat_id=42, from_chat_id=43, message_ids=[1, 2])]
+
+    async def test_skipped_messages(self, bot: MockedBot):
+        middleware = MessageBatcher(window=0.01)
+        api = FakeAPI(skip=1)
+
+        results = await asyncio.gather(
+            *(
+                middleware(
+                    api, bot, CopyMessage(chat_id=42, from_chat_id=43, message_id=message_id)
+                )
+                for message_id in [1, 2]
+            ),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, TelegramBadRequest) for result in results)
+
+    async def test_error(self, bot: MockedBot):
+        middleware = MessageBatcher(window=0.01)
+
+        async def make_request(bot, method):
+            raise TelegramBadRequest(method=method, message="test")
+
+        results = await asyncio.gather(
+            *(
+                middleware(make_request, bot, DeleteMessage(chat_id=42, message_id=message_id))
+                for message_id in [1, 2]
+            ),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, TelegramBadRequest) for result in results)
+
+    async def test_flush_and_cancel(self, bot: MockedBot):
+        middleware = MessageBatcher(window=10)
+        api = FakeAPI()
+
+        cancelled = asyncio.create_task(
+            middleware(api, bot, DeleteMessage(chat_id=42, message_id=1))
+        )
+        task = asyncio.create_task(middleware(api, bot, DeleteMessage(chat_id=43, message_id=1)))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await middleware.flush()
+        assert await task is True
+        assert api.sent == [DeleteMessage(chat_id=43, message_id=1)]
+        assert not middleware._batches
+
+    async def test_not_batched(self, bot: MockedBot):
+        middleware = MessageBatcher()
+        api = FakeAPI()
+        assert await middleware(api, bot, GetMe()) is True
+        assert middleware.metrics.requests == 0
@@ -0,0 +1,175 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from aiogram import Dispatcher
+from aiogram.client.session.middlewares.cache import (
+    MemoryResponseCacheStorage,
+    ResponseCache,
+)
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.methods import (
+    BanChatMember,
+    GetChat,
+    GetChatAdministrators,
+    GetMe,
+    ResultMode,
+)
+from aiogram.types import (
+    Chat,
+    ChatFullInfo,
+    ChatMemberMember,
+    ChatMemberOwner,
+    ChatMemberUpdated,
+    Update,
+    User,
+)
+from tests.mocked_bot import MockedBot
+
+USER = User(id=1, is_bot=False, first_name="Test")
+ADMINS = [ChatMemberOwner(user=USER, is_anonymous=False)]
+
+
+class TestMemoryResponseCacheStorage:
+    async def test_get_set(self):
+        storage = MemoryResponseCacheStorage()
+        assert await storage.get("key") is None
+
+        with patch("time.monotonic", return_value=100.0):
+            await storage.set("key", "value", ttl=10, tag="tag")
+            assert await storage.get("key") == "value"
+        with patch("time.monotonic", return_value=110.0):
+            assert await storage.get("key") is None
+        assert storage._tags == {}
+
+    async def test_lru(self):
+        storage = MemoryResponseCacheStorage(max_size=2)
+        await storage.set("key1", "value1", ttl=10, tag="tag")
+        await storage.set("key2", "value2", ttl=10)
+        assert await storage.get("key1") == "value1"
+        await storage.set("key3", "value3", ttl=10)
+
+        assert await storage.get("key2") is None
+        assert await storage.get("key1") == "value1"
+        assert await storage.get("key3") == "value3"
+
+    async def test_invalidate(self):
+        storage = MemoryResponseCacheStorage()
+        await storage.set("key1", "value1", ttl=10, tag="tag")
+        await storage.set("key2", "value2", ttl=10, tag="tag")
+        await storage.set("key3", "value3", ttl=10, tag="other")
+        await storage.set("key1", "value1", ttl=10, tag="tag")
+
+        await storage.invalidate("tag")
+        await storage.invalidate("unknown")
+        assert await storage.get("key1") is None
+        assert await storage.get("key2") is None
+        assert await storage.get("key3") == "value3"
+
+
+class TestResponseCache:
+    async def test_cache(self, bot: MockedBot):
+        cache = ResponseCache()
+        bot.session.middleware(cache)
+        bot.add_result_for(GetChatAdministrators, ok=True, result=ADMINS)
+
+        first = await bot.get_chat_administrators(chat_id=-42)
+        second = await bot.get_chat_administrators(chat_id=-42)
+        assert first == ADMINS
+        assert isinstance(second[0], ChatMemberOwner)
+        assert second[0].model_dump() == ADMINS[0].model_dump()
+        assert second[0].bot is bot
+        assert len(bot.session.requests) == 1
+        assert cache.metrics.hits == 1
+        assert cache.metrics.misses == 1
+        assert cache.metrics.hit_ratio == 0.5
+
+    async def test_not_cached_methods(self, bot: MockedBot):
+        cache = ResponseCache()
+        bot.session.middleware(cache)
+        for _ in range(2):
+            bot.add_result_for(GetMe, ok=True, result=USER)
+            await bot.get_me()
+        assert len(bot.session.requests) == 2
+        assert cache.metrics.misses == 0
+
+    async def test_result_mode_is_not_cached(self, bot: MockedBot):
+        cache = ResponseCache()
+        bot.session.middleware(cache)
+        for _ in range(2):
+            bot.add_result_for(GetChatAdministrators, ok=True, result=ADMINS)
+            await bot(GetChatAdministrators(chat_id=-42), result_mode=ResultMode.SKIP)
+        assert len(bot.session.requests) == 2
+
+    async def test_invalidating_method(self, bot: MockedBot):
+        cache = ResponseCache()
+        bot.session.middleware(cache)
+        bot.add_result_for(GetChatAdministrators, ok=True, result=ADMINS)
+        await bot.get_chat_administrators(chat_id=-42)
+
+        bot.add_result_for(BanChatMember, ok=True, result=True)
+        await bot.ban_chat_member(chat_id=-42, user_id=1)
+        assert cache.metrics.invalidations == 1
+
+        bot.add_result_for(GetChatAdministrators, ok=True, result=ADMINS)
+        await bot.get_chat_administrators(chat_id=-42)
+        assert cache.metrics.misses == 2
+
+    @pytest.mark.parametrize("update_type", ["chat_member", "my_chat_member"])
+    async def test_invalidate_by_update(self, bot: MockedBot, update_type: str):
+        cache = ResponseCache()
+        bot.session.middleware(cache)
+        dp = Dispatcher()
+        cache.setup(dp)
+
+        bot.add_result_for(
+            GetChat,
+            ok=True,
+            result=ChatFullInfo(id=-42, type="group", accent_color_id=0, max_reaction_count=1),
+        )
+        await bot.get_chat(chat_id=-42)
+        assert len(cache.storage._data) == 1
+
+        member = ChatMemberMember(user=USER)
+        update = Update(
+            update_id=42,
+            **{
+                update_type: ChatMemberUpdated(
+                    chat=Chat(id=-42, type="group"),
+                    from_user=USER,
+                    date=datetime.datetime.now(),
+                    old_chat_member=member,
+                    new_chat_member=member,
+                )
+            },
+        )
+        result = await dp.feed_update(bot, update)
+        assert result is UNHANDLED
+        assert cache.metrics.invalidations == 1
+        assert len(cache.storage._data) == 0
+
+    def test_setup_resolves_update_types(self):
+        dp = Dispatcher()
+        assert dp.resolve_used_update_types() == []
+        ResponseCache().setup(dp)
+        assert dp.resolve_used_update_types() == ["chat_member", "my_chat_member"]
+
+
+@pytest.mark.redis
+class TestRedisResponseCacheStorage:
+    async def test_get_set_invalidate(self, redis_server):
+        from aiogram.client.session.middlewares.redis import RedisResponseCacheStorage
+
+        storage = RedisResponseCacheStorage.from_url(redis_server, prefix="test_cache")
+        try:
+            await storage.set("key1", "value1", ttl=10, tag="tag")
+            await storage.set("key2", "value2", ttl=10)
+            assert await storage.get("key1") == "value1"
+
+            await storage.invalidate("tag")
+            assert await storage.get("key1") is None
+            assert await storage.get("key2") == "value2"
+        finally:
+            await storage.redis.delete("test_cache:key1", "test_cache:key2")
+            await storage.close()
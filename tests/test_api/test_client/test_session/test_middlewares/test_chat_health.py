@@ -0,0 +1,206 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from aiogram import Dispatcher
+from aiogram.client.session.middlewares.chat_health import (
+    ChatHealth,
+    MemoryChatHealthStorage,
+    UnreachableChatPolicy,
+)
+from aiogram.exceptions import TelegramForbiddenError, TelegramMigrateToChat
+from aiogram.methods import GetMe, SendMessage
+from aiogram.types import (
+    Chat,
+    ChatMemberBanned,
+    ChatMemberMember,
+    ChatMemberUpdated,
+    Message,
+    Update,
+    User,
+)
+from tests.mocked_bot import MockedBot
+
+USER = User(id=1, is_bot=False, first_name="Test")
+
+
+def make_message(chat_id: int) -> Message:
+    return Message(
+        message_id=42,
+        date=datetime.datetime.now(),
+        chat=Chat(id=chat_id, type="supergroup"),
+        text="test",
+    )
+
+
+class TestMemoryChatHealthStorage:
+    async def test_get_set_delete(self):
+        storage = MemoryChatHealthStorage()
+        assert await storage.get("key") is None
+
+        await storage.set("key", "value", ttl=10)
+        assert await storage.get("key") == "value"
+
+        await storage.delete("key")
+        await storage.delete("key")
+        assert await storage.get("key") is None
+
+    async def test_expire(self):
+        storage = MemoryChatHealthStorage(cleanup_every=2)
+        with patch("time.monotonic", return_value=100.0):
+            await storage.set("key1", "value", ttl=10)
+        with patch("time.monotonic", return_value=200.0):
+            assert await storage.get("key1") is None
+            await storage.set("key1", "value", ttl=10)
+            await storage.set("key2", "value", ttl=10)
+        with patch("time.monotonic", return_value=300.0):
+            # Expired statuses are removed on cleanup
+            await storage.set("key3", "value", ttl=10)
+            await storage.set("key4", "value", ttl=10)
+        assert set(storage._data) == {"key3", "key4"}
+
+
+class TestChatHealth:
+    async def test_forbidden(self, bot: MockedBot):
+        middleware = ChatHealth()
+        bot.session.middleware(middleware)
+
+        bot.add_result_for(
+            SendMessage,
+            ok=False,
+            error_code=403,
+            description="Forbidden: bot was blocked by the user",
+        )
+        with pytest.raises(TelegramForbiddenError):
+            await bot.send_message(chat_id=42, text="test")
+        assert middleware.metrics.forbidden == 1
+        assert bot.get_request().chat_id == 42
+
+        # The request is not sent
+        with pytest.raises(TelegramForbiddenError, match="Forbidden: bot was blocked by the user"):
+            await bot.send_message(chat_id=42, text="test")
+        assert middleware.metrics.short_circuited == 1
+        assert not bot.session.requests
+
+        # Other chats are not affected
+        bot.add_result_for(SendMessage, ok=True, result=make_message(43))
+        await bot.send_message(chat_id=43, text="test")
+
+    @pytest.mark.parametrize(
+        "description,unreachable",
+        [
+            ["Forbidden: bot was blocked by the user", True],
+            ["Forbidden: user is deactivated", True],
+            ["Forbidden: bot was kicked from the supergroup chat", True],
+            ["Forbidden: bot can't initiate conversation with a user", False],
+            ["Forbidden: bot can't send messages to bots", False],
+        ],
+    )
+    async def test_forbidden_description(self, bot: MockedBot, description, unreachable):
+        middleware = ChatHealth()
+        bot.session.middleware(middleware)
+
+        bot.add_result_for(SendMessage, ok=False, error_code=403, description=description)
+        with pytest.raises(TelegramForbiddenError):
+            await bot.send_message(chat_id=42, text="test")
+        assert middleware.metrics.forbidden == int(unreachable)
+        assert (await middleware.storage.get(f"{bot.id}:42") is not None) is unreachable
+
+    async def test_send_policy(self, bot: MockedBot):
+        middleware = ChatHealth(policy=UnreachableChatPolicy.SEND)
+        bot.session.middleware(middleware)
+        await middleware.mark_forbidden(bot_id=bot.id, chat_id=42, description="Forbidden")
+
+        bot.add_result_for(SendMessage, ok=True, result=make_message(42))
+        await bot.send_message(chat_id=42, text="test")
+        assert middleware.metrics.short_circuited == 0
+
+    async def test_methods(self, bot: MockedBot):
+        middleware = ChatHealth(methods=[GetMe])
+        bot.session.middleware(middleware)
+        await middleware.mark_forbidden(bot_id=bot.id, chat_id=42, description="Forbidden")
+
+        bot.add_result_for(SendMessage, ok=True, result=make_message(42))
+        await bot.send_message(chat_id=42, text="test")
+
+    async def test_migrated(self, bot: MockedBot):
+        middleware = ChatHealth()
+        bot.session.middleware(middleware)
+
+        # Mocked responses and requests are stacks
+        bot.add_result_for(SendMessage, ok=True, result=make_message(-100))
+        bot.add_result_for(
+            SendMessage, ok=False, error_code=400, description="migrated", migrate_to_chat_id=-100
+        )
+        message = await bot.send_message(chat_id=-42, text="test")
+        assert message.chat.id == -100
+        assert bot.get_request().chat_id == -100
+        assert bot.get_request().chat_id == -42
+        assert middleware.metrics.migrated == 1
+
+        # The next requests are sent to the new chat id
+        method = SendMessage(chat_id=-42, text="test")
+        bot.add_result_for(SendMessage, ok=True, result=make_message(-100))
+        await bot(method)
+        assert bot.get_request().chat_id == -100
+        assert method.chat_id == -42
+        assert middleware.metrics.rewritten == 2
+
+    async def test_migrated_without_retry(self, bot: MockedBot):
+        middleware = ChatHealth(retry_migrated=False)
+        bot.session.middleware(middleware)
+
+        bot.add_result_for(
+            SendMessage, ok=False, error_code=400, description="migrated", migrate_to_chat_id=-100
+        )
+        with pytest.raises(TelegramMigrateToChat):
+            await bot.send_message(chat_id=-42, text="test")
+        assert middleware.metrics.migrated == 1
+        assert middleware.metrics.rewritten == 0
+
+    def test_setup_resolves_update_types(self):
+        dp = Dispatcher()
+        ChatHealth().setup(dp)
+        assert dp.resolve_used_update_types() == ["my_chat_member"]
+
+    @pytest.mark.parametrize(
+        "member,unreachable",
+        [
+            [ChatMemberBanned(user=USER, until_date=0), True],
+            [ChatMemberMember(user=USER), False],
+        ],
+    )
+    async def test_my_chat_member(self, bot: MockedBot, member, unreachable: bool):
+        middleware = ChatHealth()
+        dp = Dispatcher()
+        middleware.setup(dp)
+        await middleware.mark_forbidden(bot_id=bot.id, chat_id=42, description="Forbidden")
+
+        update = Update(
+            update_id=42,
+            my_chat_member=ChatMemberUpdated(
+                chat=Chat(id=42, type="private"),
+                from_user=USER,
+                date=datetime.datetime.now(),
+                old_chat_member=ChatMemberMember(user=USER),
+                new_chat_member=member,
+            ),
+        )
+        await dp.feed_update(bot, update)
+        assert (await middleware.storage.get(f"{bot.id}:42") is not None) is unreachable
+
+
+@pytest.mark.redis
+class TestRedisChatHealthStorage:
+    async def test_get_set_delete(self, redis_server):
+        from aiogram.client.session.middlewares.redis import RedisChatHealthStorage
+
+        storage = RedisChatHealthStorage.from_url(redis_server, prefix="test_chat_health")
+        try:
+            await storage.set("key", "value", ttl=10)
+            assert await storage.get("key") == "value"
+            await storage.delete("key")
+            assert await storage.get("key") is None
+        finally:
+            await storage.close()
@@ -0,0 +1,187 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiogram.client.session.middlewares.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from aiogram.exceptions import (
+    CircuitBreakerOpen,
+    TelegramBadRequest,
+    TelegramEntityTooLarge,
+    TelegramNetworkError,
+    TelegramResponseTooLarge,
+    TelegramServerError,
+)
+from aiogram.methods import GetMe, SendMessage
+from tests.mocked_bot import MockedBot
+
+
+def make_error(error_type, method):
+    return error_type(method=method, message="test")
+
+
+def expire(middleware: CircuitBreaker, key: str) -> None:
+    middleware.circuits[key].opened_at -= middleware.recovery_timeout
+
+
+class TestCircuitBreaker:
+    async def test_open(self, bot: MockedBot):
+        middleware = CircuitBreaker(failure_threshold=3)
+        method = GetMe()
+        key = middleware.get_key(bot)
+        assert key == bot.session.api.base
+
+        errors = [TelegramNetworkError, TelegramServerError, TelegramNetworkError]
+        for error in errors:
+            assert middleware.get_state(bot) is CircuitState.CLOSED
+            make_request = AsyncMock(side_effect=make_error(error, method))
+            with pytest.raises(error):
+                await middleware(make_request, bot, method)
+
+        assert middleware.get_state(bot) is CircuitState.OPEN
+        assert middleware.circuits[key].failures == 3
+
+        make_request = AsyncMock(return_value=True)
+        with pytest.raises(CircuitBreakerOpen) as exc_info:
+            await middleware(make_request, bot, method)
+        assert 0 < exc_info.value.retry_after <= middleware.recovery_timeout
+        make_request.assert_not_awaited()
+        assert middleware.metrics.failures == 3
+        assert middleware.metrics.opened == 1
+        assert middleware.metrics.rejected == 1
+
+    @pytest.mark.parametrize("error", [TelegramEntityTooLarge, TelegramResponseTooLarge])
+    async def test_client_side_errors_are_not_failures(self, bot: MockedBot, error):
+        middleware = CircuitBreaker(failure_threshold=2)
+        method = SendMessage(chat_id=42, text="test")
+
+        for _ in range(3):
+            with pytest.raises(error):
+                await middleware(AsyncMock(side_effect=make_error(error, method)), bot, method)
+
+        assert middleware.get_state(bot) is CircuitState.CLOSED
+        assert middleware.metrics.failures == 0
+
+    async def test_success_resets_failures(self, bot: MockedBot):
+        middleware = CircuitBreaker(failure_threshold=2)
+        method = GetMe()
+
+        with pytest.raises(TelegramNetworkError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramNetworkError, method)), bot, method
+            )
+        # Server is available when it answers with the client error
+        with pytest.raises(TelegramBadRequest):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramBadRequest, method)), bot, method
+            )
+        with pytest.raises(TelegramNetworkError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramNetworkError, method)), bot, method
+            )
+        assert middleware.get_state(bot) is CircuitState.CLOSED
+
+    async def test_half_open(self, bot: MockedBot):
+        middleware = CircuitBreaker(failure_threshold=1, half_open_probes=1)
+        method = GetMe()
+        key = middleware.get_key(bot)
+
+        with pytest.raises(TelegramNetworkError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramNetworkError, method)), bot, method
+            )
+        assert middleware.get_state(bot) is CircuitState.OPEN
+
+        # Failed probe opens the circuit again
+        expire(middleware, key)
+        with pytest.raises(TelegramServerError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramServerError, method)), bot, method
+            )
+        assert middleware.get_state(bot) is CircuitState.OPEN
+        assert middleware.metrics.opened == 2
+
+        expire(middleware, key)
+        probe_started = asyncio.Event()
+        probe_finish = asyncio.Event()
+
+        async def probe(bot, method):
+            probe_started.set()
+            await probe_finish.wait()
+            return True
+
+        probe_task = asyncio.create_task(middleware(probe, bot, method))
+        await probe_started.wait()
+        assert middleware.get_state(bot) is CircuitState.HALF_OPEN
+        # Only one probe is allowed at once
+        with pytest.raises(CircuitBreakerOpen):
+            await middleware(AsyncMock(return_value=True), bot, method)
+
+        probe_finish.set()
+        assert await probe_task is True
+        assert middleware.get_state(bot) is CircuitState.CLOSED
+        assert middleware.metrics.probes == 2
+        assert await middleware(AsyncMock(return_value=True), bot, method) is True
+
+    async def test_cancelled_probe(self, bot: MockedBot):
+        middleware = CircuitBreaker(failure_threshold=1)
+        method = GetMe()
+        key = middleware.get_key(bot)
+        with pytest.raises(TelegramNetworkError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramNetworkError, method)), bot, method
+            )
+        expire(middleware, key)
+
+        async def probe(bot, method):
+            await asyncio.sleep(10)
+
+        probe_task = asyncio.create_task(middleware(probe, bot, method))
+        await asyncio.sleep(0)
+        assert middleware.circuits[key].probes == 1
+        probe_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe_task
+
+        assert middleware.circuits[key].probes == 0
+        assert middleware.get_state(bot) is CircuitState.HALF_OPEN
+        assert await middleware(AsyncMock(return_value=True), bot, method) is True
+
+    async def test_queue(self, bot: MockedBot):
+        middleware = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.05, queue_methods=[SendMessage]
+        )
+        method = SendMessage(chat_id=42, text="test")
+        with pytest.raises(TelegramNetworkError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramNetworkError, method)), bot, method
+            )
+
+        # Non-critical request waits for the recovery timeout and is sent as the probe
+        assert await middleware(AsyncMock(return_value=True), bot, method) is True
+        assert middleware.get_state(bot) is CircuitState.CLOSED
+        assert middleware.metrics.queued == 1
+        assert middleware.metrics.rejected == 0
+
+    async def test_queue_timeout(self, bot: MockedBot):
+        middleware = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=10,
+            queue_methods=[SendMessage],
+            max_queue_time=0.01,
+        )
+        method = SendMessage(chat_id=42, text="test")
+        with pytest.raises(TelegramNetworkError):
+            await middleware(
+                AsyncMock(side_effect=make_error(TelegramNetworkError, method)), bot, method
+            )
+
+        make_request = AsyncMock(return_value=True)
+        with pytest.raises(CircuitBreakerOpen):
+            await middleware(make_request, bot, method)
+        make_request.assert_not_awaited()
+        assert middleware.metrics.queued == 1
+        assert middleware.metrics.rejected == 1
@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiogram.client.session.middlewares.coalescing import EditCoalescer
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import EditMessageReplyMarkup, EditMessageText, GetMe
+from aiogram.types import InlineKeyboardMarkup
+from tests.mocked_bot import MockedBot
+
+
+def make_edit(text: str, chat_id: int = 42, message_id: int = 1) -> EditMessageText:
+    return EditMessageText(chat_id=chat_id, message_id=message_id, text=text)
+
+
+class TestEditCoalescer:
+    async def test_not_coalesced_methods(self, bot: MockedBot):
+        middleware = EditCoalescer()
+        make_request = AsyncMock(return_value=True)
+        assert await middleware(make_request, bot, GetMe()) is True
+        assert middleware.metrics.requests == 0
+
+    async def test_coalesce(self, bot: MockedBot):
+        middleware = EditCoalescer(window=0.05)
+        sent = []
+
+        async def make_request(bot, method):
+            sent.append(method.text)
+            return method.text
+
+        # The first edit is sent at once, the next ones wait for the window end
+        assert await middleware(make_request, bot, make_edit("0")) == "0"
+        results = await asyncio.gather(
+            *(middleware(make_request, bot, make_edit(str(index))) for index in range(1, 5))
+        )
+        assert sent == ["0", "4"]
+        assert results == ["4", "4", "4", "4"]
+        assert middleware.metrics.requests == 5
+        assert middleware.metrics.sent == 2
+        assert middleware.metrics.coalesced == 3
+
+        # Message is forgotten when the window is passed without edits
+        await asyncio.sleep(0.1)
+        assert not middleware._pending
+
+    async def test_window(self, bot: MockedBot):
+        middleware = EditCoalescer(window=0.05)
+        make_request = AsyncMock(return_value=True)
+        loop = asyncio.get_running_loop()
+
+        started_at = loop.time()
+        await middleware(make_request, bot, make_edit("1"))
+        await middleware(make_request, bot, make_edit("2"))
+        assert loop.time() - started_at >= 0.04
+        assert make_request.await_count == 2
+
+    async def test_different_messages(self, bot: MockedBot):
+        middleware = EditCoalescer(window=0.01)
+        make_request = AsyncMock(return_value=True)
+
+        await asyncio.gather(
+            middleware(make_request, bot, make_edit("test", message_id=1)),
+            middleware(make_request, bot, make_edit("test", message_id=2)),
+            middleware(make_request, bot, make_edit("test", chat_id=43)),
+            middleware(
+                make_request,
+                bot,
+                EditMessageReplyMarkup(
+                    chat_id=42,
+                    message_id=1,
+                    reply_markup=InlineKeyboardMarkup(inline_keyboard=[]),
+                ),
+            ),
+        )
+        assert make_request.await_count == 4
+        assert middleware.metrics.coalesced == 0
+        await asyncio.gather(*(edit.task for edit in list(middleware._pending.values())))
+
+    async def test_error(self, bot: MockedBot):
+        middleware = EditCoalescer(window=0.01)
+        method = make_edit("test")
+        make_request = AsyncMock(side_effect=TelegramBadRequest(method, "message is not modified"))
+
+        results = await asyncio.gather(
+            middleware(make_request, bot, method),
+            middleware(make_request, bot, make_edit("test")),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, TelegramBadRequest) for result in results)
+        assert make_request.await_count == 1
+        await asyncio.sleep(0.02)
+
+    async def test_cancelled_waiter(self, bot: MockedBot):
+        middleware = EditCoalescer(window=0.01)
+        make_request = AsyncMock(return_value=True)
+
+        await middleware(make_request, bot, make_edit("1"))
+        task = asyncio.create_task(middleware(make_request, bot, make_edit("2")))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.02)
+
+        # Edit is not sent when nobody waits for it
+        assert make_request.await_count == 1
+        assert not middleware._pending
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiogram.client.session.middlewares.hedging import HedgedRequests
+from aiogram.client.session.middlewares.retry import RetryBudget
+from aiogram.exceptions import TelegramNetworkError
+from aiogram.methods import GetChat, SendMessage
+from tests.mocked_bot import MockedBot
+
+
+class ScriptedRequest:
+    def __init__(self, *delays, error_on=()):
+        self.delays = list(delays)
+        self.error_on = error_on
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, bot, method):
+        index = self.calls
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delays[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if index in self.error_on:
+            raise TelegramNetworkError(method=method, message="test")
+        return index
+
+
+class TestHedgedRequests:
+    def test_get_delay(self):
+        middleware = HedgedRequests(initial_delay=1.0, min_delay=0.1, min_samples=10)
+        assert middleware.get_delay(GetChat) == 1.0
+
+        for latency in range(1, 21):
+            middleware._record(GetChat, latency / 100)
+        assert middleware.get_delay(GetChat) == 0.2
+
+        middleware._latencies[GetChat].clear()
+        for _ in range(10):
+            middleware._record(GetChat, 0.001)
+        assert middleware.get_delay(GetChat) == 0.1
+
+    async def test_fast_request(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.1)
+        make_request = ScriptedRequest(0)
+
+        assert await middleware(make_request, bot, GetChat(chat_id=1)) == 0
+        assert make_request.calls == 1
+        assert middleware.metrics.hedged == 0
+        assert len(middleware._latencies[GetChat]) == 1
+
+    async def test_hedged_request_wins(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.01)
+        make_request = ScriptedRequest(10, 0)
+
+        assert await middleware(make_request, bot, GetChat(chat_id=1)) == 1
+        await asyncio.sleep(0)
+        assert make_request.calls == 2
+        assert make_request.cancelled == 1
+        assert middleware.metrics.hedged == 1
+        assert middleware.metrics.hedge_wins == 1
+
+    async def test_primary_request_wins(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.01)
+        make_request = ScriptedRequest(0.02, 10)
+
+        assert await middleware(make_request, bot, GetChat(chat_id=1)) == 0
+        await asyncio.sleep(0)
+        assert make_request.cancelled == 1
+        assert middleware.metrics.hedged == 1
+        assert middleware.metrics.hedge_wins == 0
+
+    async def test_first_error_is_ignored(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.01)
+        make_request = ScriptedRequest(0.02, 0.03, error_on=(0,))
+
+        assert await middleware(make_request, bot, GetChat(chat_id=1)) == 1
+
+    async def test_all_failed(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.01)
+        make_request = ScriptedRequest(0.02, 0.02, error_on=(0, 1))
+
+        with pytest.raises(TelegramNetworkError):
+            await middleware(make_request, bot, GetChat(chat_id=1))
+
+    async def test_error_before_delay(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=1)
+        make_request = ScriptedRequest(0, error_on=(0,))
+
+        with pytest.raises(TelegramNetworkError):
+            await middleware(make_request, bot, GetChat(chat_id=1))
+        assert make_request.calls == 1
+
+    async def test_budget(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.01, budget=RetryBudget(ratio=0, capacity=1))
+
+        assert await middleware(ScriptedRequest(0.02, 0), bot, GetChat(chat_id=1)) == 1
+        make_request = ScriptedRequest(0.02, 0)
+        assert await middleware(make_request, bot, GetChat(chat_id=1)) == 0
+        assert make_request.calls == 1
+        assert middleware.metrics.hedged == 1
+
+    async def test_cancel(self, bot: MockedBot):
+        middleware = HedgedRequests(initial_delay=0.01)
+        make_request = ScriptedRequest(10, 10)
+
+        task = asyncio.create_task(middleware(make_request, bot, GetChat(chat_id=1)))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        assert make_request.cancelled == 2
+
+    async def test_not_hedged_method(self, bot: MockedBot):
+        middleware = HedgedRequests()
+        make_request = AsyncMock(return_value=True)
+
+        assert await middleware(make_request, bot, SendMessage(chat_id=1, text="test"))
+        make_request.assert_awaited_once()
+        assert middleware.metrics.requests == 0
@@ -43,3 +43,33 @@ class TestMiddlewareManager:
             return timeout
 
         assert await manager.wrap_middlewares(target_call, timeout=42)(None, None) == 42
+
+    async def test_compile(self):
+        manager = RequestMiddlewareManager()
+
+        async def target_call(bot, method):
+            return method
+
+        async def other_call(bot, method):  # pragma: no cover
+            return method
+
+        chain = manager.compile(target_call)
+        assert manager.compile(target_call) is chain
+        assert manager.compile(other_call) is not chain
+
+        calls = []
+
+        async def middleware(make_request, bot, method):
+            calls.append(method)
+            return await make_request(bot, method)
+
+        manager.register(middleware)
+        chain = manager.compile(target_call)
+        assert manager.compile(target_call) is chain
+        assert await chain(None, 42) == 42
+        assert calls == [42]
+
+        manager.unregister(middleware)
+        assert manager.compile(target_call) is not chain
+        assert await manager.compile(target_call)(None, 42) == 42
+        assert calls == [42]
@@ -0,0 +1,170 @@
+import asyncio
+import datetime
+from unittest.mock import patch
+
+import pytest
+
+from aiogram import Dispatcher, flags
+from aiogram.client.session.middlewares.priority import (
+    Priority,
+    PriorityScheduler,
+    current_priority,
+)
+from aiogram.methods import AnswerCallbackQuery, GetMe, SendMessage
+from aiogram.types import Chat, Message, Update, User
+from tests.mocked_bot import MockedBot
+
+
+class Recorder:
+    def __init__(self):
+        self.events = {}
+        self.calls = []
+
+    async def __call__(self, bot, method):
+        self.calls.append(method)
+        event = self.events[id(method)] = asyncio.Event()
+        await event.wait()
+        return True
+
+    def finish(self, index: int):
+        self.events[id(self.calls[index])].set()
+
+
+class TestPriorityScheduler:
+    def test_resolve_priority(self):
+        scheduler = PriorityScheduler()
+        assert scheduler.resolve_priority(GetMe()) == Priority.NORMAL
+        assert scheduler.resolve_priority(AnswerCallbackQuery(callback_query_id="test")) == (
+            Priority.HIGH
+        )
+        token = current_priority.set(Priority.LOW)
+        try:
+            assert scheduler.resolve_priority(GetMe()) == Priority.LOW
+            assert scheduler.resolve_priority(GetMe().with_priority(10)) == 10
+        finally:
+            current_priority.reset(token)
+
+    async def test_priority_order(self, bot: MockedBot):
+        scheduler = PriorityScheduler(limit=1)
+        make_request = Recorder()
+
+        first = asyncio.create_task(scheduler(make_request, bot, GetMe()))
+        await asyncio.sleep(0)
+        low = asyncio.create_task(
+            scheduler(
+                make_request,
+                bot,
+                SendMessage(chat_id=1, text="low").with_priority(Priority.LOW),
+            )
+        )
+        high = asyncio.create_task(
+            scheduler(make_request, bot, AnswerCallbackQuery(callback_query_id="high"))
+        )
+        await asyncio.sleep(0)
+        assert scheduler.active == 1
+        assert scheduler.waiting == 2
+        assert len(make_request.calls) == 1
+
+        make_request.finish(0)
+        await first
+        await asyncio.sleep(0)
+        assert isinstance(make_request.calls[1], AnswerCallbackQuery)
+
+        make_request.finish(1)
+        await high
+        await asyncio.sleep(0)
+        make_request.finish(2)
+        await low
+        assert scheduler.active == 0
+        assert scheduler.waiting == 0
+
+    async def test_starvation(self, bot: MockedBot):
+        scheduler = PriorityScheduler(limit=1, max_wait=5)
+        make_request = Recorder()
+
+        with patch("time.monotonic", return_value=100.0):
+            first = asyncio.create_task(scheduler(make_request, bot, GetMe()))
+            await asyncio.sleep(0)
+            low = asyncio.create_task(
+                scheduler(
+                    make_request,
+                    bot,
+                    SendMessage(chat_id=1, text="low").with_priority(Priority.LOW),
+                )
+            )
+            await asyncio.sleep(0)
+        with patch("time.monotonic", return_value=110.0):
+            high = asyncio.create_task(
+                scheduler(make_request, bot, AnswerCallbackQuery(callback_query_id="high"))
+            )
+            await asyncio.sleep(0)
+            make_request.finish(0)
+            await first
+            await asyncio.sleep(0)
+
+        assert isinstance(make_request.calls[1], SendMessage)
+        make_request.finish(1)
+        await low
+        await asyncio.sleep(0)
+        make_request.finish(2)
+        await high
+
+    async def test_cancel_waiter(self, bot: MockedBot):
+        scheduler = PriorityScheduler(limit=1)
+        make_request = Recorder()
+
+        first = asyncio.create_task(scheduler(make_request, bot, GetMe()))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(scheduler(make_request, bot, GetMe()))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.waiting == 0
+
+        make_request.finish(0)
+        await first
+        assert scheduler.active == 0
+
+    async def test_cancel_after_handover(self):
+        scheduler = PriorityScheduler(limit=1)
+        await scheduler.acquire(Priority.NORMAL)
+        second = asyncio.create_task(scheduler.acquire(Priority.NORMAL))
+        third = asyncio.create_task(scheduler.acquire(Priority.NORMAL))
+        await asyncio.sleep(0)
+
+        # The slot is passed to the second request, but it is cancelled before the start
+        scheduler.release()
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await third
+        assert scheduler.active == 1
+
+        scheduler.release()
+        assert scheduler.active == 0
+
+    async def test_handler_flag(self, bot: MockedBot):
+        scheduler = PriorityScheduler()
+        dp = Dispatcher()
+        scheduler.setup(dp)
+        priorities = []
+
+        @dp.message()
+        @flags.priority(Priority.LOW)
+        async def handler(message: Message):
+            priorities.append(scheduler.resolve_priority(GetMe()))
+
+        update = Update(
+            update_id=42,
+            message=Message(
+                message_id=42,
+                date=datetime.datetime.now(),
+                text="test",
+                chat=Chat(id=42, type="private"),
+                from_user=User(id=42, is_bot=False, first_name="Test"),
+            ),
+        )
+        await dp.feed_update(bot, update)
+        assert priorities == [Priority.LOW]
+        assert current_priority.get() is None
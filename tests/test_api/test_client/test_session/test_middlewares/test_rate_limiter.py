@@ -0,0 +1,197 @@
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.client.session.middlewares.rate_limiter import (
+    MemoryRateLimitStorage,
+    RateLimit,
+    RateLimiter,
+    is_limited_method,
+)
+from aiogram.methods import (
+    AnswerCallbackQuery,
+    CopyMessage,
+    EditMessageText,
+    GetMe,
+    SendChatAction,
+    SendMessage,
+    SendPhoto,
+)
+from aiogram.types import Chat, Message, User
+from tests.mocked_bot import MockedBot
+
+
+class TestMemoryRateLimitStorage:
+    async def test_reserve(self):
+        storage = MemoryRateLimitStorage()
+        rate = RateLimit(limit=2, period=1.0)
+        with patch("time.monotonic", return_value=100.0):
+            assert await storage.reserve("key", rate) == 0
+            assert await storage.reserve("key", rate) == pytest.approx(0.5)
+            assert await storage.reserve("key", rate) == pytest.approx(1.0)
+            assert await storage.reserve("other", rate) == 0
+        with patch("time.monotonic", return_value=110.0):
+            assert await storage.reserve("key", rate) == 0
+
+    async def test_reserve_burst(self):
+        storage = MemoryRateLimitStorage()
+        rate = RateLimit(limit=3, period=3.0, burst=2)
+        with patch("time.monotonic", return_value=100.0):
+            assert await storage.reserve("key", rate) == 0
+            assert await storage.reserve("key", rate) == 0
+            assert await storage.reserve("key", rate) == pytest.approx(1.0)
+
+    async def test_reserve_delay(self):
+        storage = MemoryRateLimitStorage()
+        rate = RateLimit(limit=1, period=1.0)
+        with patch("time.monotonic", return_value=100.0):
+            assert await storage.reserve("key", rate, delay=5.0) == pytest.approx(5.0)
+            assert await storage.reserve("key", rate) == pytest.approx(6.0)
+
+    async def test_cleanup(self):
+        storage = MemoryRateLimitStorage(cleanup_every=2)
+        rate = RateLimit(limit=1, period=1.0)
+        with patch("time.monotonic", return_value=100.0):
+            await storage.reserve("key1", rate)
+        with patch("time.monotonic", return_value=200.0):
+            await storage.reserve("key2", rate)
+        assert list(storage._buckets) == ["key2"]
+
+
+class TestRateLimiter:
+    @pytest.mark.parametrize(
+        "method_type,result",
+        [
+            [SendMessage, True],
+            [SendPhoto, True],
+            [CopyMessage, True],
+            [EditMessageText, True],
+            [SendChatAction, False],
+            [AnswerCallbackQuery, False],
+            [GetMe, False],
+        ],
+    )
+    def test_is_limited_method(self, method_type, result):
+        assert is_limited_method(method_type) is result
+
+    def test_is_limited_custom_methods(self):
+        limiter = RateLimiter(methods=[GetMe])
+        assert limiter.is_limited(GetMe())
+        assert not limiter.is_limited(SendMessage(chat_id=42, text="test"))
+
+    @pytest.mark.parametrize(
+        "chat_id,private",
+        [
+            [42, True],
+            [-42, False],
+            [-10042, False],
+            ["@channel", False],
+        ],
+    )
+    def test_resolve_chat_limit(self, chat_id, private):
+        limiter = RateLimiter()
+        expected = limiter.private_chat_limit if private else limiter.group_chat_limit
+        assert limiter.resolve_chat_limit(chat_id) is expected
+
+    async def test_reserve(self, bot: MockedBot):
+        storage = MemoryRateLimitStorage()
+        limiter = RateLimiter(storage=storage, global_limit=RateLimit(limit=10))
+        with patch("time.monotonic", return_value=100.0):
+            assert await limiter.reserve_chat(bot, SendMessage(chat_id=1, text="test")) == 0
+            assert await limiter.reserve_chat(bot, SendMessage(chat_id=2, text="test")) == 0
+            assert await limiter.reserve_chat(bot, SendMessage(chat_id=1, text="test")) == (
+                pytest.approx(1.0)
+            )
+            # Inline messages are limited only globally
+            assert (
+                await limiter.reserve_chat(
+                    bot, EditMessageText(inline_message_id="test", text="test")
+                )
+                == 0
+            )
+            assert await limiter.reserve_global(bot) == 0
+            assert await limiter.reserve_global(bot) == pytest.approx(0.1)
+        assert set(storage._buckets) == {"42:chat:1", "42:chat:2", "42:global"}
+
+    async def test_wait(self, bot: MockedBot):
+        limiter = RateLimiter(global_limit=RateLimit(limit=10))
+        with patch("time.monotonic", return_value=100.0), patch(
+            "asyncio.sleep", new_callable=AsyncMock
+        ) as mocked_sleep:
+            await limiter.wait(bot, SendMessage(chat_id=1, text="test"))
+            mocked_sleep.assert_not_awaited()
+            await limiter.wait(bot, SendMessage(chat_id=1, text="test"))
+            # Time is frozen, so the global slot is reserved after the chat slot
+            assert [call.args[0] for call in mocked_sleep.await_args_list] == [
+                pytest.approx(1.0),
+                pytest.approx(0.1),
+            ]
+
+    async def test_busy_chat_does_not_delay_idle_chat(self, bot: MockedBot):
+        limiter = RateLimiter()
+        delays = []
+        blocked = asyncio.Event()
+        yield_control = asyncio.sleep
+
+        async def sleep(delay):
+            delays.append(delay)
+            if delay >= 1:
+                # Requests delayed by the chat limit are still waiting
+                await blocked.wait()
+
+        with patch("time.monotonic", return_value=100.0), patch("asyncio.sleep", new=sleep):
+            busy = [
+                asyncio.create_task(limiter.wait(bot, SendMessage(chat_id=-100, text="test")))
+                for _ in range(5)
+            ]
+            for _ in range(5):
+                await yield_control(0)
+            assert sorted(delays) == pytest.approx([3.0, 6.0, 9.0, 12.0])
+
+            delays.clear()
+            await limiter.wait(bot, SendMessage(chat_id=7, text="test"))
+            # Only the global slot of the single sent request is waited
+            assert delays == [pytest.approx(limiter.global_limit.interval)]
+
+            for task in busy:
+                task.cancel()
+            await asyncio.gather(*busy, return_exceptions=True)
+
+    async def test_use_middleware(self, bot: MockedBot):
+        bot.session.middleware(RateLimiter())
+        message = Message(
+            message_id=42,
+            date=datetime.datetime.now(),
+            text="test",
+            chat=Chat(id=42, type="private"),
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mocked_sleep:
+            for _ in range(2):
+                bot.add_result_for(SendMessage, ok=True, result=message)
+                assert await bot.send_message(chat_id=42, text="test")
+            mocked_sleep.assert_awaited()
+            assert 0 < mocked_sleep.await_args_list[0].args[0] <= 1
+            sleeps = mocked_sleep.await_count
+
+            bot.add_result_for(GetMe, ok=True, result=User(id=42, is_bot=True, first_name="T"))
+            await bot.get_me()
+            assert mocked_sleep.await_count == sleeps
+
+
+@pytest.mark.redis
+class TestRedisRateLimitStorage:
+    async def test_reserve(self, redis_server):
+        from aiogram.client.session.middlewares.redis import RedisRateLimitStorage
+
+        storage = RedisRateLimitStorage.from_url(redis_server, prefix="test_rate_limit")
+        rate = RateLimit(limit=1, period=10.0)
+        try:
+            await storage.redis.delete("test_rate_limit:key")
+            assert await storage.reserve("key", rate) == 0
+            assert await storage.reserve("key", rate) == pytest.approx(10.0, abs=0.5)
+        finally:
+            await storage.redis.delete("test_rate_limit:key")
+            await storage.close()
@@ -0,0 +1,227 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.client.session.middlewares.retry import (
+    MemoryBlockStorage,
+    RetryBudget,
+    RetryMiddleware,
+)
+from aiogram.exceptions import (
+    RestartingTelegram,
+    TelegramBadRequest,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods import GetMe, GetUpdates, Response, SendMessage
+from aiogram.utils.backoff import BackoffConfig
+from tests.mocked_bot import MockedBot
+
+BACKOFF_CONFIG = BackoffConfig(min_delay=1.0, max_delay=10.0, factor=2.0, jitter=0.0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture()
+def clock():
+    clock = FakeClock()
+    with patch("time.monotonic", clock.monotonic), patch("asyncio.sleep", clock.sleep):
+        yield clock
+
+
+def make_error(error_type, method, **kwargs):
+    return error_type(method=method, message="test", **kwargs)
+
+
+class TestMemoryBlockStorage:
+    async def test_block(self, clock: FakeClock):
+        storage = MemoryBlockStorage()
+        assert await storage.get_delay("a", "b") == 0
+
+        await storage.block("a", 10)
+        await storage.block("a", 5)
+        await storage.block("b", 3)
+        assert await storage.get_delay("a") == 10
+        assert await storage.get_delay("b") == 3
+        assert await storage.get_delay("a", "b") == 10
+
+        clock.now += 5
+        assert await storage.get_delay("a", "b") == 5
+        assert "b" not in storage._blocked_until
+
+
+class TestRetryBudget:
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, capacity=2)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+        budget.deposit()
+        assert not budget.withdraw()
+        budget.deposit()
+        assert budget.withdraw()
+
+        for _ in range(10):
+            budget.deposit()
+        assert budget.tokens == 2
+
+
+class TestRetryMiddleware:
+    def test_get_keys(self, bot: MockedBot):
+        assert RetryMiddleware.get_keys(bot, GetMe()) == ["42"]
+        assert RetryMiddleware.get_keys(bot, SendMessage(chat_id=-1, text="test")) == [
+            "42",
+            "42:chat:-1",
+        ]
+
+    async def test_success(self, bot: MockedBot, clock: FakeClock):
+        middleware = RetryMiddleware()
+        method = GetMe()
+        response = Response[bool](ok=True, result=True)
+        make_request = AsyncMock(return_value=response)
+
+        assert await middleware(make_request, bot, method) is response
+        make_request.assert_awaited_once_with(bot, method)
+        assert middleware.metrics.requests == 1
+        assert middleware.metrics.retries == 0
+        assert clock.sleeps == []
+
+    async def test_flood_wait(self, bot: MockedBot, clock: FakeClock):
+        storage = MemoryBlockStorage()
+        middleware = RetryMiddleware(storage=storage)
+        method = SendMessage(chat_id=1, text="test")
+        response = Response[bool](ok=True, result=True)
+        make_request = AsyncMock(
+            side_effect=[make_error(TelegramRetryAfter, method, retry_after=5), response]
+        )
+
+        assert await middleware(make_request, bot, method) is response
+        assert make_request.await_count == 2
+        assert clock.sleeps == [5]
+        assert middleware.metrics.flood_waits == 1
+        assert middleware.metrics.retries == 1
+        assert middleware.metrics.waited == 5
+
+    async def test_flood_wait_blocks_chat(self, bot: MockedBot, clock: FakeClock):
+        storage = MemoryBlockStorage()
+        middleware = RetryMiddleware(storage=storage)
+        await storage.block("42:chat:1", 3)
+        make_request = AsyncMock(return_value=Response[bool](ok=True, result=True))
+
+        await middleware(make_request, bot, SendMessage(chat_id=2, text="test"))
+        assert clock.sleeps == []
+
+        await middleware(make_request, bot, SendMessage(chat_id=1, text="test"))
+        assert clock.sleeps == [3]
+
+    async def test_flood_wait_too_long(self, bot: MockedBot, clock: FakeClock):
+        middleware = RetryMiddleware(max_retry_after=10)
+        method = SendMessage(chat_id=1, text="test")
+        make_request = AsyncMock(
+            side_effect=make_error(TelegramRetryAfter, method, retry_after=30)
+        )
+
+        with pytest.raises(TelegramRetryAfter):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 1
+        assert clock.sleeps == []
+
+    async def test_server_error(self, bot: MockedBot, clock: FakeClock):
+        middleware = RetryMiddleware(max_retries=2, backoff_config=BACKOFF_CONFIG)
+        method = GetMe()
+        make_request = AsyncMock(side_effect=make_error(TelegramServerError, method))
+
+        with pytest.raises(TelegramServerError):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 3
+        assert clock.sleeps == [1.0, 2.0]
+        assert middleware.metrics.server_errors == 3
+        assert middleware.metrics.retries == 2
+        assert middleware.metrics.exhausted == 1
+
+    async def test_restarting_blocks_bot(self, bot: MockedBot, clock: FakeClock):
+        storage = MemoryBlockStorage()
+        middleware = RetryMiddleware(storage=storage, backoff_config=BACKOFF_CONFIG)
+        method = GetMe()
+        response = Response[bool](ok=True, result=True)
+        make_request = AsyncMock(side_effect=[make_error(RestartingTelegram, method), response])
+
+        assert await middleware(make_request, bot, method) is response
+        assert clock.sleeps == [1.0]
+
+    async def test_network_error(self, bot: MockedBot, clock: FakeClock):
+        method = GetMe()
+        response = Response[bool](ok=True, result=True)
+
+        middleware = RetryMiddleware(backoff_config=BACKOFF_CONFIG)
+        make_request = AsyncMock(side_effect=[make_error(TelegramNetworkError, method), response])
+        with pytest.raises(TelegramNetworkError):
+            await middleware(make_request, bot, method)
+
+        middleware = RetryMiddleware(backoff_config=BACKOFF_CONFIG, retry_network_errors=True)
+        make_request = AsyncMock(side_effect=[make_error(TelegramNetworkError, method), response])
+        assert await middleware(make_request, bot, method) is response
+        assert middleware.metrics.network_errors == 1
+
+    async def test_not_retried_error(self, bot: MockedBot, clock: FakeClock):
+        middleware = RetryMiddleware()
+        method = GetMe()
+        make_request = AsyncMock(side_effect=make_error(TelegramBadRequest, method))
+
+        with pytest.raises(TelegramBadRequest):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 1
+
+    async def test_budget(self, bot: MockedBot, clock: FakeClock):
+        middleware = RetryMiddleware(
+            backoff_config=BACKOFF_CONFIG, budget=RetryBudget(ratio=0.1, capacity=1)
+        )
+        method = GetMe()
+        make_request = AsyncMock(side_effect=make_error(TelegramServerError, method))
+
+        with pytest.raises(TelegramServerError):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 2
+        assert middleware.metrics.exhausted == 1
+
+    async def test_ignore_methods(self, bot: MockedBot, clock: FakeClock):
+        middleware = RetryMiddleware(ignore_methods=[GetUpdates])
+        method = GetUpdates()
+        make_request = AsyncMock(side_effect=make_error(TelegramServerError, method))
+
+        with pytest.raises(TelegramServerError):
+            await middleware(make_request, bot, method)
+        assert make_request.await_count == 1
+        assert middleware.metrics.requests == 0
+
+
+@pytest.mark.redis
+class TestRedisBlockStorage:
+    async def test_block(self, redis_server):
+        from aiogram.client.session.middlewares.redis import RedisBlockStorage
+
+        storage = RedisBlockStorage.from_url(redis_server, prefix="test_blocked")
+        try:
+            await storage.redis.delete("test_blocked:a", "test_blocked:b")
+            assert await storage.get_delay("a", "b") == 0
+            await storage.block("a", 10)
+            await storage.block("a", 5)
+            await storage.block("b", 3)
+            assert await storage.get_delay("a", "b") == pytest.approx(10, abs=0.5)
+            assert await storage.get_delay("b") == pytest.approx(3, abs=0.5)
+        finally:
+            await storage.redis.delete("test_blocked:a", "test_blocked:b")
+            await storage.close()
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiogram.client.session.middlewares.single_flight import (
+    SingleFlight,
+    make_method_key,
+)
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import GetChat, GetChatMember, Response, SendMessage
+from tests.mocked_bot import MockedBot
+
+
+class SlowRequest:
+    def __init__(self, result=None, error=None):
+        self.event = asyncio.Event()
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    async def __call__(self, bot, method):
+        self.calls.append(method)
+        await self.event.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    def test_make_method_key(self, bot: MockedBot):
+        assert make_method_key(bot, GetChatMember(chat_id=1, user_id=2)) == (
+            make_method_key(bot, GetChatMember(chat_id=1, user_id=2))
+        )
+        assert make_method_key(bot, GetChatMember(chat_id=1, user_id=2)) != (
+            make_method_key(bot, GetChatMember(chat_id=1, user_id=3))
+        )
+        assert make_method_key(bot, GetChat(chat_id=1)) != make_method_key(
+            MockedBot(token="43:TEST"), GetChat(chat_id=1)
+        )
+
+    async def test_coalesce(self, bot: MockedBot):
+        middleware = SingleFlight()
+        response = Response[bool](ok=True, result=True)
+        make_request = SlowRequest(result=response)
+
+        tasks = [
+            asyncio.create_task(middleware(make_request, bot, GetChat(chat_id=1)))
+            for _ in range(3)
+        ]
+        other = asyncio.create_task(middleware(make_request, bot, GetChat(chat_id=2)))
+        await asyncio.sleep(0)
+        make_request.event.set()
+
+        assert await asyncio.gather(*tasks) == [response] * 3
+        assert await other is response
+        assert len(make_request.calls) == 2
+        assert middleware.coalesced == 2
+        assert middleware._in_flight == {}
+
+    async def test_coalesce_error(self, bot: MockedBot):
+        middleware = SingleFlight()
+        method = GetChat(chat_id=1)
+        make_request = SlowRequest(error=TelegramBadRequest(method=method, message="test"))
+
+        tasks = [asyncio.create_task(middleware(make_request, bot, method)) for _ in range(2)]
+        await asyncio.sleep(0)
+        make_request.event.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, TelegramBadRequest) for result in results)
+        assert len(make_request.calls) == 1
+
+    async def test_leader_cancelled(self, bot: MockedBot):
+        middleware = SingleFlight()
+        response = Response[bool](ok=True, result=True)
+        make_request = SlowRequest(result=response)
+
+        leader = asyncio.create_task(middleware(make_request, bot, GetChat(chat_id=1)))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(middleware(make_request, bot, GetChat(chat_id=1)))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        make_request.event.set()
+
+        assert await follower is response
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(make_request.calls) == 2
+
+    async def test_not_idempotent_method(self, bot: MockedBot):
+        middleware = SingleFlight(methods=[GetChat])
+        response = Response[bool](ok=True, result=True)
+        make_request = AsyncMock(return_value=response)
+
+        method = GetChatMember(chat_id=1, user_id=2)
+        await asyncio.gather(*(middleware(make_request, bot, method) for _ in range(2)))
+        await asyncio.gather(
+            *(middleware(make_request, bot, SendMessage(chat_id=1, text="t")) for _ in range(2))
+        )
+        assert make_request.await_count == 4
+        assert middleware.coalesced == 0
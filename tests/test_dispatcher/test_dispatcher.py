@@ -14,6 +14,7 @@ from aiogram import Bot
 from aiogram.dispatcher.dispatcher import Dispatcher
 from aiogram.dispatcher.event.bases import UNHANDLED, SkipHandler
 from aiogram.dispatcher.router import Router
+from aiogram.exceptions import CircuitBreakerOpen
 from aiogram.methods import GetMe, GetUpdates, SendMessage, TelegramMethod
 from aiogram.types import (
     BusinessConnection,
@@ -186,6 +187,25 @@ class TestDispatcher:
             assert isinstance(await anext(listen), Update)
             assert mocked_asleep.awaited
 
+    async def test_listen_update_with_open_circuit(self, bot: MockedBot):
+        dispatcher = Dispatcher()
+        listen = dispatcher._listen_updates(bot=bot)
+        bot.add_result_for(GetUpdates, ok=True, result=[Update(update_id=42)])
+
+        @bot.session.middleware
+        async def circuit_breaker(make_request, b, method):
+            bot.session.middleware.unregister(circuit_breaker)
+            raise CircuitBreakerOpen(method=method, message="test", retry_after=10)
+
+        with patch(
+            "aiogram.dispatcher.dispatcher.asyncio.sleep", new_callable=AsyncMock
+        ) as mocked_sleep, patch(
+            "aiogram.utils.backoff.Backoff.asleep", new_callable=AsyncMock
+        ) as mocked_asleep:
+            assert isinstance(await anext(listen), Update)
+            mocked_sleep.assert_awaited_once_with(10)
+            mocked_asleep.assert_not_awaited()
+
     async def test_silent_call_request(self, bot: MockedBot, caplog):
         dispatcher = Dispatcher()
         bot.add_result_for(SendMessage, ok=False, error_code=400, description="Kaboom")
@@ -847,10 +867,13 @@ class TestDispatcher:
             "aiogram.dispatcher.router.Router.emit_shutdown", new_callable=AsyncMock
         ) as mocked_emit_shutdown, patch(
             "aiogram.dispatcher.dispatcher.Dispatcher._listen_updates"
-        ) as patched_listen_updates:
+        ) as patched_listen_updates, patch.object(
+            bot.session, "warm_up", new_callable=AsyncMock
+        ) as mocked_warm_up:
             patched_listen_updates.return_value = _mock_updates()
             await dispatcher.start_polling(bot)
 
+            mocked_warm_up.assert_awaited_once_with()
             mocked_emit_startup.assert_awaited()
             mocked_process_update.assert_awaited()
             mocked_emit_shutdown.assert_awaited()
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 
 from aiogram.dispatcher.event.bases import UNHANDLED, SkipHandler, skip
 from aiogram.dispatcher.event.telegram import TelegramEventObserver
 from aiogram.dispatcher.router import Router
+from tests.mocked_bot import MockedBot
 
 
 class TestRouter:
@@ -114,6 +117,51 @@ class TestRouter:
         await router1.emit_shutdown()
         assert results == [2, 1, 2]
 
+    async def test_emit_startup_concurrent(self):
+        router = Router(concurrent_lifecycle=True)
+        router1 = Router()
+        router2 = Router()
+        router.include_routers(router1, router2)
+        results = []
+        event = asyncio.Event()
+
+        @router.startup()
+        async def startup():
+            results.append(0)
+
+        @router1.startup()
+        async def startup1():
+            await event.wait()
+            results.append(1)
+
+        @router2.startup()
+        async def startup2():
+            results.append(2)
+            event.set()
+
+        await asyncio.wait_for(router.emit_startup(), timeout=1)
+        assert results == [0, 2, 1]
+
+    async def test_emit_shutdown_concurrent_error(self):
+        router = Router(concurrent_lifecycle=True)
+        router1 = Router()
+        router2 = Router()
+        router.include_routers(router1, router2)
+        results = []
+
+        @router1.shutdown()
+        async def shutdown1():
+            raise ValueError("KABOOM")
+
+        @router2.shutdown()
+        async def shutdown2():
+            await asyncio.sleep(0)
+            results.append(2)
+
+        with pytest.raises(ValueError, match="KABOOM"):
+            await router.emit_shutdown()
+        assert results == [2]
+
     def test_skip(self):
         with pytest.raises(SkipHandler):
             skip()
@@ -179,3 +227,52 @@ class TestRouter:
         assert await r1.propagate_event(update_type="custom-event", event=None) is None
         assert await r2.propagate_event(update_type="custom-event", event=None) is UNHANDLED
         assert await r3.propagate_event(update_type="custom-event", event=None) is None
+
+    def test_bot_ids(self):
+        assert Router().bot_ids is None
+        assert Router(bot_ids=[42, 42, 43]).bot_ids == frozenset({42, 43})
+
+    def test_resolve_sub_routers(self):
+        router = Router()
+        common = Router()
+        first = Router(bot_ids=[42])
+        second = Router(bot_ids=[43, 44])
+        router.include_routers(first, common)
+
+        bot = MockedBot(token="42:TEST")
+        assert router.resolve_sub_routers(bot) == [first, common]
+        assert router.resolve_sub_routers(MockedBot(token="43:TEST")) == [common]
+        assert router.resolve_sub_routers() == [common]
+        # Cached result
+        assert router.resolve_sub_routers(bot) is router.resolve_sub_routers(bot)
+
+        router.include_router(second)
+        assert router.resolve_sub_routers(bot) == [first, common]
+        assert router.resolve_sub_routers(MockedBot(token="44:TEST")) == [common, second]
+
+    async def test_propagate_event_to_bot_routers(self):
+        router = Router()
+        first = Router(bot_ids=[42])
+        second = Router(bot_ids=[43])
+        router.include_routers(first, second)
+
+        @first.message()
+        async def first_handler(evt):
+            return "first"
+
+        @second.message()
+        async def second_handler(evt):
+            return "second"
+
+        result = await router.propagate_event(
+            update_type="message", event=None, bot=MockedBot(token="42:TEST")
+        )
+        assert result == "first"
+        result = await router.propagate_event(
+            update_type="message", event=None, bot=MockedBot(token="43:TEST")
+        )
+        assert result == "second"
+        result = await router.propagate_event(
+            update_type="message", event=None, bot=MockedBot(token="44:TEST")
+        )
+        assert result is UNHANDLED
@@ -0,0 +1,261 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramMigrateToChat,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
+from aiogram.methods import Lane, SendDocument, SendMessage
+from aiogram.types import BufferedInputFile
+from aiogram.utils.backoff import BackoffConfig
+from aiogram.utils.broadcast import (
+    Broadcast,
+    DeliveryResult,
+    DeliveryStatus,
+    FileBroadcastStorage,
+    MemoryBroadcastStorage,
+)
+from tests.mocked_bot import MockedBot
+
+BACKOFF_CONFIG = BackoffConfig(min_delay=0.001, max_delay=0.01, factor=2.0, jitter=0.0)
+
+
+class FakeAPI:
+    def __init__(self, errors: Dict[Any, List[Any]] = None) -> None:
+        self.errors = errors or {}
+        self.sent: List[Any] = []
+
+    async def __call__(self, make_request, bot, method):
+        errors = self.errors.get(method.chat_id)
+        if errors:
+            raise errors.pop(0)(method)
+        self.sent.append(method.chat_id)
+        return True
+
+
+async def async_range(count: int):
+    for chat_id in range(count):
+        yield chat_id
+
+
+class TestBroadcastStorage:
+    async def test_memory_storage(self):
+        storage = MemoryBroadcastStorage()
+        assert await storage.get_offset("job") == 0
+        await storage.set_offset("job", 42)
+        assert await storage.get_offset("job") == 42
+
+    async def test_file_storage(self, tmp_path):
+        storage = FileBroadcastStorage(tmp_path / "broadcast.json")
+        assert await storage.get_offset("job") == 0
+        await storage.set_offset("job", 42)
+        await storage.set_offset("other", 1)
+
+        storage = FileBroadcastStorage(tmp_path / "broadcast.json")
+        assert await storage.get_offset("job") == 42
+        assert await storage.get_offset("other") == 1
+
+
+class TestBroadcast:
+    async def test_run(self, bot: MockedBot):
+        api = FakeAPI()
+        bot.session.middleware(api)
+        results: List[DeliveryResult] = []
+
+        async def on_result(result: DeliveryResult):
+            results.append(result)
+
+        broadcast = Broadcast(
+            bot,
+            async_range(50),
+            SendMessage(chat_id=0, text="test"),
+            rate=10_000,
+            concurrency=5,
+            checkpoint_every=10,
+            on_result=on_result,
+        )
+        stats = await broadcast.run()
+
+        assert sorted(api.sent) == list(range(50))
+        assert stats.processed == stats.sent == 50
+        assert stats.throughput > 0
+        assert len(results) == 50
+        assert all(result.status is DeliveryStatus.SENT for result in results)
+        assert await broadcast.storage.get_offset("broadcast") == 50
+
+    async def test_message_factory(self, bot: MockedBot):
+        api = FakeAPI()
+        bot.session.middleware(api)
+
+        broadcast = Broadcast(
+            bot, [1, 2], lambda chat_id: SendMessage(chat_id=chat_id, text=str(chat_id))
+        )
+        assert broadcast.make_method(42).text == "42"
+        assert broadcast.make_method(42)._prepared is None
+        await broadcast.run()
+        assert sorted(api.sent) == [1, 2]
+
+    async def test_prepared_message(self, bot: MockedBot):
+        broadcast = Broadcast(bot, [1], SendMessage(chat_id=0, text="test"))
+        method = broadcast.make_method(42)
+        assert method.chat_id == 42
+        assert method._prepared is broadcast._prepared is not None
+
+        # Templates with files are copied for each chat
+        broadcast = Broadcast(
+            bot, [1], SendDocument(chat_id=0, document=BufferedInputFile(b"test", "file.txt"))
+        )
+        method = broadcast.make_method(42)
+        assert method.chat_id == 42
+        assert method._prepared is None
+
+    def test_lane(self, bot: MockedBot):
+        broadcast = Broadcast(bot, [1], SendMessage(chat_id=0, text="test"))
+        assert broadcast.make_method(42)._lane is Lane.BULK
+
+        broadcast = Broadcast(
+            bot,
+            [1],
+            lambda chat_id: SendMessage(chat_id=chat_id, text="test"),
+            lane=Lane.INTERACTIVE,
+        )
+        assert broadcast.make_method(42)._lane is Lane.INTERACTIVE
+
+        broadcast = Broadcast(bot, [1], SendMessage(chat_id=0, text="test"), lane=None)
+        assert broadcast.make_method(42)._lane is None
+
+    async def test_failures(self, bot: MockedBot):
+        def forbidden(method):
+            return TelegramForbiddenError(method=method, message="blocked")
+
+        def bad_request(method):
+            return TelegramBadRequest(method=method, message="chat not found")
+
+        def network_error(method):
+            return TelegramNetworkError(method=method, message="timeout")
+
+        def flood_wait(method):
+            return TelegramRetryAfter(method=method, message="flood", retry_after=1)
+
+        def migrated(method):
+            return TelegramMigrateToChat(
+                method=method, message="migrated", migrate_to_chat_id=-100
+            )
+
+        api = FakeAPI(
+            {
+                1: [forbidden],
+                2: [bad_request],
+                3: [network_error],
+                4: [network_error, network_error],
+                5: [flood_wait],
+                -42: [migrated],
+            }
+        )
+        bot.session.middleware(api)
+        results: Dict[Any, DeliveryStatus] = {}
+
+        async def on_result(result: DeliveryResult):
+            results[result.chat_id] = result.status
+
+        broadcast = Broadcast(
+            bot,
+            [1, 2, 3, 4, 5, -42],
+            SendMessage(chat_id=0, text="test"),
+            rate=10_000,
+            max_retries=1,
+            backoff_config=BACKOFF_CONFIG,
+            on_result=on_result,
+        )
+        with patch.object(broadcast, "_pause") as mocked_pause:
+            stats = await broadcast.run()
+        mocked_pause.assert_called_once_with(1)
+
+        assert results == {
+            1: DeliveryStatus.BLOCKED,
+            2: DeliveryStatus.INVALID,
+            3: DeliveryStatus.SENT,
+            4: DeliveryStatus.FAILED,
+            5: DeliveryStatus.SENT,
+            -42: DeliveryStatus.SENT,
+        }
+        assert sorted(api.sent) == [-100, 3, 5]
+        assert (stats.sent, stats.blocked, stats.invalid, stats.failed) == (3, 1, 1, 1)
+        assert stats.retries == 2
+        assert stats.flood_waits == 1
+
+    async def test_rate(self, bot: MockedBot):
+        bot.session.middleware(FakeAPI())
+        broadcast = Broadcast(bot, range(5), SendMessage(chat_id=0, text="test"), rate=10)
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mocked_sleep, patch(
+            "time.monotonic", return_value=100.0
+        ):
+            await broadcast.run()
+        delays = [call.args[0] for call in mocked_sleep.await_args_list]
+        assert delays == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+        broadcast._next_send_at = 0.0
+        with patch("time.monotonic", return_value=100.0):
+            broadcast._pause(5)
+        assert broadcast._next_send_at == 105.0
+
+    async def test_resume(self, bot: MockedBot):
+        api = FakeAPI()
+        bot.session.middleware(api)
+        storage = MemoryBroadcastStorage()
+        await storage.set_offset("job", 3)
+
+        broadcast = Broadcast(
+            bot, range(5), SendMessage(chat_id=0, text="test"), job_id="job", storage=storage
+        )
+        stats = await broadcast.run()
+        assert api.sent == [3, 4]
+        assert stats.skipped == 3
+        assert stats.processed == 2
+        assert await storage.get_offset("job") == 5
+
+    async def test_checkpoint_without_gaps(self, bot: MockedBot):
+        broadcast = Broadcast(
+            bot, [], SendMessage(chat_id=0, text="test"), job_id="job", checkpoint_every=2
+        )
+        broadcast.deliver = AsyncMock(
+            return_value=DeliveryResult(chat_id=0, status=DeliveryStatus.SENT)
+        )
+        await broadcast._process(1, 1)
+        assert broadcast._offset == 0
+        await broadcast._process(2, 2)
+        await broadcast._process(0, 0)
+        assert broadcast._offset == 3
+        assert await broadcast.storage.get_offset("job") == 3
+
+    async def test_unexpected_error(self, bot: MockedBot):
+        broadcast = Broadcast(
+            bot, range(100), SendMessage(chat_id=0, text="test"), job_id="job", concurrency=2
+        )
+        broadcast.deliver = AsyncMock(side_effect=RuntimeError("test"))
+        with pytest.raises(RuntimeError):
+            await broadcast.run()
+        assert broadcast.deliver.await_count < 100
+        assert await broadcast.storage.get_offset("job") == 0
+
+    async def test_cancel(self, bot: MockedBot):
+        async def deliver(chat_id):
+            if chat_id >= 3:
+                await asyncio.sleep(10)
+            return DeliveryResult(chat_id=chat_id, status=DeliveryStatus.SENT)
+
+        broadcast = Broadcast(bot, range(10), SendMessage(chat_id=0, text="test"), job_id="job")
+        broadcast.deliver = deliver
+        task = asyncio.create_task(broadcast.run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Progress is saved on cancellation
+        assert await broadcast.storage.get_offset("job") == 3
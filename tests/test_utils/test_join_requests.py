@@ -0,0 +1,183 @@
+import asyncio
+import datetime
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from aiogram import Dispatcher
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.methods import ApproveChatJoinRequest, DeclineChatJoinRequest
+from aiogram.types import Chat, ChatJoinRequest, User
+from aiogram.utils.join_requests import (
+    JoinRequestDecision,
+    JoinRequestProcessor,
+    JoinRequestResult,
+)
+from tests.mocked_bot import MockedBot
+
+
+class FakeAPI:
+    def __init__(self, errors: Optional[dict] = None) -> None:
+        self.errors = errors or {}
+        self.sent: List[Any] = []
+
+    async def __call__(self, make_request, bot, method):
+        errors = self.errors.get(method.user_id)
+        if errors:
+            raise errors.pop(0)(method)
+        self.sent.append((type(method), method.user_id))
+        return True
+
+
+def make_request(bot: MockedBot, user_id: int, chat_id: int = -42) -> ChatJoinRequest:
+    return ChatJoinRequest(
+        chat=Chat(id=chat_id, type="channel"),
+        from_user=User(id=user_id, is_bot=False, first_name="Test"),
+        user_chat_id=user_id,
+        date=datetime.datetime.now(),
+    ).as_(bot)
+
+
+class TestJoinRequestProcessor:
+    async def test_approve_and_decline(self, bot: MockedBot):
+        api = FakeAPI()
+        bot.session.middleware(api)
+        results: List[JoinRequestResult] = []
+
+        async def on_result(result: JoinRequestResult):
+            results.append(result)
+
+        processor = JoinRequestProcessor(rate=10_000, on_result=on_result)
+        # Requests can be queued before the start
+        processor.approve(make_request(bot, 1))
+        await processor.start()
+        await processor.start()
+        assert processor.running
+
+        processor.decline(make_request(bot, 2))
+        for user_id in range(3, 10):
+            processor.approve(make_request(bot, user_id))
+        # Repeated requests are processed once
+        processor.approve(make_request(bot, 3))
+        assert processor.stats.pending == 9
+        await processor.stop()
+
+        assert not processor.running
+        assert set(api.sent) == {
+            (ApproveChatJoinRequest, user_id) for user_id in [1, *range(3, 10)]
+        } | {(DeclineChatJoinRequest, 2)}
+        assert len(api.sent) == 9
+        assert processor.stats.approved == 8
+        assert processor.stats.declined == 1
+        assert processor.stats.duplicates == 1
+        assert processor.stats.pending == 0
+        assert processor.stats.throughput > 0
+        assert len(results) == 9
+        assert (
+            JoinRequestResult(chat_id=-42, user_id=2, decision=JoinRequestDecision.DECLINE)
+            in results
+        )
+
+    async def test_errors(self, bot: MockedBot):
+        def flood_wait(method):
+            return TelegramRetryAfter(method=method, message="flood", retry_after=1)
+
+        def bad_request(method):
+            return TelegramBadRequest(method=method, message="HIDE_REQUESTER_MISSING")
+
+        api = FakeAPI({1: [flood_wait], 2: [bad_request]})
+        bot.session.middleware(api)
+        processor = JoinRequestProcessor(rate=10_000)
+        await processor.start()
+        processor.approve(make_request(bot, 1))
+        processor.approve(make_request(bot, 2))
+        with patch.object(processor, "_pause") as mocked_pause:
+            await processor.join()
+        mocked_pause.assert_called_once_with(1)
+        await processor.stop()
+
+        assert api.sent == [(ApproveChatJoinRequest, 1)]
+        assert processor.stats.approved == 1
+        assert processor.stats.failed == 1
+        assert processor.stats.flood_waits == 1
+
+    async def test_unexpected_error(self, bot: MockedBot):
+        processor = JoinRequestProcessor(rate=10_000)
+        await processor.start()
+        with patch.object(processor, "process", side_effect=RuntimeError("test")):
+            processor.approve(make_request(bot, 1))
+            await processor.join()
+        assert processor.stats.failed == 1
+        await processor.stop()
+
+    async def test_rate(self, bot: MockedBot):
+        processor = JoinRequestProcessor(rate=10)
+        with patch("asyncio.sleep") as mocked_sleep, patch("time.monotonic", return_value=100.0):
+            for _ in range(3):
+                await processor._wait_turn()
+        delays = [call.args[0] for call in mocked_sleep.await_args_list]
+        assert delays == pytest.approx([0.1, 0.2])
+
+    async def test_policy(self, bot: MockedBot):
+        api = FakeAPI()
+        bot.session.middleware(api)
+        batches: List[List[int]] = []
+
+        async def policy(requests: List[ChatJoinRequest]):
+            batches.append([request.from_user.id for request in requests])
+            return [
+                None if request.from_user.id == 3 else request.from_user.id % 2 == 0
+                for request in requests
+            ]
+
+        processor = JoinRequestProcessor(
+            rate=10_000, policy=policy, batch_size=3, batch_window=0.01
+        )
+        await processor.start()
+        for user_id in range(1, 6):
+            processor.submit(make_request(bot, user_id))
+        # Explicit decision is preferred to the policy
+        processor.decline(make_request(bot, 4))
+        await processor.stop()
+
+        assert batches == [[1, 2, 3], [5]]
+        assert set(api.sent) == {
+            (DeclineChatJoinRequest, 1),
+            (ApproveChatJoinRequest, 2),
+            (DeclineChatJoinRequest, 4),
+            (DeclineChatJoinRequest, 5),
+        }
+        assert len(api.sent) == 4
+        assert processor.stats.skipped == 1
+        assert processor.stats.duplicates == 1
+
+    async def test_failed_policy(self, bot: MockedBot):
+        async def policy(requests: List[ChatJoinRequest]):
+            return []
+
+        processor = JoinRequestProcessor(policy=policy, batch_window=0.01)
+        await processor.start()
+        processor.submit(make_request(bot, 1))
+        await processor.stop()
+        assert processor.stats.skipped == 1
+
+    async def test_misuse(self, bot: MockedBot):
+        processor = JoinRequestProcessor()
+        with pytest.raises(RuntimeError, match="Policy is not set"):
+            processor.submit(make_request(bot, 1))
+        with pytest.raises(RuntimeError, match="not mounted"):
+            processor.approve(make_request(None, 1))
+        with pytest.raises(RuntimeError, match="not started"):
+            await processor.join()
+
+    async def test_setup(self, bot: MockedBot):
+        processor = JoinRequestProcessor()
+        dp = Dispatcher()
+        processor.setup(dp)
+        assert dp["join_requests"] is processor
+
+        await dp.emit_startup(bot=bot)
+        assert processor.running
+        await dp.emit_shutdown(bot=bot)
+        assert not processor.running
@@ -11,6 +11,7 @@ from aiohttp.test_utils import TestClient
 from aiohttp.web_app import Application
 
 from aiogram import Dispatcher, F
+from aiogram.client.session.aiohttp import AiohttpSessionPool, PooledAiohttpSession
 from aiogram.methods import GetMe, Request
 from aiogram.types import BufferedInputFile, Message, User
 from aiogram.webhook.aiohttp_server import (
@@ -132,6 +133,55 @@ class TestSimpleRequestHandler:
         assert result["method"] == "sendMessage"
         assert result["text"] == "PASS"
 
+    async def test_reply_into_webhook_json(self, bot: MockedBot, aiohttp_client):
+        app = Application()
+        dp = Dispatcher()
+
+        @dp.message(F.text == "test")
+        def handle_message(msg: Message):
+            return msg.answer(text="PASS")
+
+        handler = SimpleRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+            handle_in_background=False,
+            json_response=True,
+        )
+        handler.register(app, path="/webhook")
+        client: TestClient = await aiohttp_client(app)
+
+        resp = await self.make_reqest(client=client)
+        assert resp.status == 200
+        assert resp.content_type == "application/json"
+        result = await resp.json()
+        assert result["method"] == "sendMessage"
+        assert result["text"] == "PASS"
+        assert result["chat_id"] == 42
+
+    async def test_reply_into_webhook_json_with_file(self, bot: MockedBot, aiohttp_client):
+        app = Application()
+        dp = Dispatcher()
+
+        @dp.message(F.text == "test")
+        def handle_message(msg: Message):
+            return msg.answer_document(
+                caption="PASS",
+                document=BufferedInputFile(b"test", filename="test.txt"),
+            )
+
+        handler = SimpleRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+            handle_in_background=False,
+            json_response=True,
+        )
+        handler.register(app, path="/webhook")
+        client: TestClient = await aiohttp_client(app)
+
+        resp = await self.make_reqest(client=client)
+        assert resp.status == 200
+        assert resp.content_type == "multipart/form-data"
+
     async def test_reply_into_webhook_unhandled(self, bot: MockedBot, aiohttp_client):
         app = Application()
         dp = Dispatcher()
@@ -272,3 +322,22 @@ class TestTokenBasedRequestHandler:
 
         assert bot2 == bot3
         assert len(handler.bots) == 2
+
+    async def test_resolve_bot_with_session_pool(self):
+        dispatcher = Dispatcher()
+        async with AiohttpSessionPool() as pool:
+            handler = TokenBasedRequestHandler(dispatcher=dispatcher, session_pool=pool)
+
+            @dataclass
+            class FakeRequest:
+                match_info: Dict[str, Any]
+
+            bot1 = await handler.resolve_bot(
+                request=FakeRequest(match_info={"bot_token": "42:TEST"})
+            )
+            bot2 = await handler.resolve_bot(
+                request=FakeRequest(match_info={"bot_token": "1337:TEST"})
+            )
+            assert isinstance(bot1.session, PooledAiohttpSession)
+            assert bot1.session is not bot2.session
+            assert bot1.session.pool is bot2.session.pool is pool